@@ -1,5 +1,6 @@
 """Battery voltage to percentage conversion for 18650 Li-ion cells."""
 
+from bisect import bisect_left
 
 # Voltage to percentage lookup table for 18650 Li-ion cells
 # Based on typical discharge curve: 4.20V = 100%, 3.00V = 0%
@@ -19,6 +20,10 @@ VOLTAGE_TABLE = [
     (3.00, 0),
 ]
 
+# Columns of the table in ascending voltage order, for bisect lookups
+_VOLTAGES_ASC = tuple(v for v, _ in reversed(VOLTAGE_TABLE))
+_PERCENTS_ASC = tuple(p for _, p in reversed(VOLTAGE_TABLE))
+
 
 def voltage_to_percentage(voltage: float) -> float:
     """
@@ -33,18 +38,16 @@ def voltage_to_percentage(voltage: float) -> float:
     Returns:
         Estimated battery percentage (0-100)
     """
-    if voltage >= 4.20:
+    if voltage >= _VOLTAGES_ASC[-1]:
         return 100.0
-    if voltage <= 3.00:
+    if not voltage > _VOLTAGES_ASC[0]:  # also catches NaN
         return 0.0
 
     # Find the two points to interpolate between
-    for i in range(len(VOLTAGE_TABLE) - 1):
-        v_high, p_high = VOLTAGE_TABLE[i]
-        v_low, p_low = VOLTAGE_TABLE[i + 1]
-        if v_low <= voltage <= v_high:
-            # Linear interpolation
-            ratio = (voltage - v_low) / (v_high - v_low)
-            return p_low + ratio * (p_high - p_low)
-
-    return 0.0
+    i = bisect_left(_VOLTAGES_ASC, voltage)
+    v_low, v_high = _VOLTAGES_ASC[i - 1], _VOLTAGES_ASC[i]
+    p_low, p_high = _PERCENTS_ASC[i - 1], _PERCENTS_ASC[i]
+
+    # Linear interpolation
+    ratio = (voltage - v_low) / (v_high - v_low)
+    return p_low + ratio * (p_high - p_low)
@@ -11,7 +11,6 @@ from typing import TYPE_CHECKING, Any, TypedDict
 from jinja2 import Environment, PackageLoader, select_autoescape
 
 from . import log
-from .charts import load_chart_stats
 from .env import get_config
 from .formatters import (
     format_compact_number,
@@ -649,7 +648,10 @@ def build_page_context(
     # Radio config
     radio_config = build_radio_config()
 
-    # Load chart stats and build chart groups
+    # Load chart stats and build chart groups. Imported here so that
+    # rendering HTML does not pull in matplotlib via meshmon.charts.
+    from .charts import load_chart_stats
+
     chart_stats = load_chart_stats(role)
 
     # Relative path prefixes (avoid absolute paths for subpath deployments)
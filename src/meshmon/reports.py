@@ -14,11 +14,13 @@ Metric names use firmware field names directly:
 """
 
 import calendar
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime
+from itertools import pairwise
 from typing import Any
 
-from .db import VALID_ROLES, get_connection, get_metrics_for_period
+from .db import BATTERY_FIELD, VALID_ROLES, get_connection, get_metrics_for_period
 from .metrics import (
     is_counter_metric,
 )
@@ -194,15 +196,14 @@ def compute_counter_total(
     total = 0
     reboot_count = 0
 
-    for i in range(1, len(values)):
-        delta = values[i][1] - values[i - 1][1]
-        if delta >= 0:
-            total += delta
+    for previous, current in pairwise(value for _, value in values):
+        if current >= previous:
+            total += current - previous
         else:
             # Negative delta indicates counter reset (reboot)
             reboot_count += 1
             # Count from 0 to current value after reboot
-            total += values[i][1]
+            total += current
 
     return (total, reboot_count)
 
@@ -220,14 +221,14 @@ def _compute_gauge_stats(values: list[tuple[datetime, float]]) -> MetricStats:
         return MetricStats()
 
     float_values = [v for _, v in values]
-    min_idx = min(range(len(values)), key=lambda i: values[i][1])
-    max_idx = max(range(len(values)), key=lambda i: values[i][1])
+    min_idx = min(range(len(float_values)), key=float_values.__getitem__)
+    max_idx = max(range(len(float_values)), key=float_values.__getitem__)
 
     return MetricStats(
         mean=sum(float_values) / len(float_values),
-        min_value=values[min_idx][1],
+        min_value=float_values[min_idx],
         min_time=values[min_idx][0],
-        max_value=values[max_idx][1],
+        max_value=float_values[max_idx],
         max_time=values[max_idx][0],
         count=len(values),
     )
@@ -672,7 +673,7 @@ def _fmt_day(dt: datetime | None) -> str:
 # --- Fixed-width column formatting for yearly reports ---
 
 
-@dataclass
+@dataclass(frozen=True)
 class Column:
     """Define a fixed-width column for ASCII table formatting."""
 
@@ -681,28 +682,41 @@ class Column:
     decimals: int = 0  # For float formatting
     comma_sep: bool = False  # Use comma separators for large integers
 
+    # Derived from the fields above in __post_init__, so format() doesn't re-branch per cell
+    _justify: Callable[[str, int], str] = field(init=False, repr=False, compare=False)
+    _int_spec: str = field(init=False, repr=False, compare=False)
+    _float_spec: str = field(init=False, repr=False, compare=False)
+    _dash: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.align == "left":
+            justify = str.ljust
+        elif self.align == "center":
+            justify = str.center
+        else:  # right
+            justify = str.rjust
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, "_justify", justify)
+        object.__setattr__(self, "_int_spec", "," if self.comma_sep else "")
+        object.__setattr__(self, "_float_spec", f".{self.decimals}f")
+        object.__setattr__(self, "_dash", justify("-", self.width))
+
     def format(self, value: Any) -> str:
         """Format a value to fit this column width."""
         if value is None:
-            text = "-"
-        elif isinstance(value, int):
-            text = f"{value:,}" if self.comma_sep else str(value)
+            return self._dash
+        if isinstance(value, int):
+            text = format(value, self._int_spec)
         elif isinstance(value, float):
-            text = f"{value:.{self.decimals}f}"
+            text = format(value, self._float_spec)
         else:
             text = str(value)
-
-        if self.align == "left":
-            return text.ljust(self.width)
-        elif self.align == "center":
-            return text.center(self.width)
-        else:  # right
-            return text.rjust(self.width)
+        return self._justify(text, self.width)
 
 
 def _format_row(columns: list[Column], values: list[Any]) -> str:
     """Format a row of values using column specs."""
-    return "".join(col.format(val) for col, val in zip(columns, values, strict=False))
+    return "".join(map(Column.format, columns, values))
 
 
 def _format_separator(columns: list[Column], char: str = "-") -> str:
@@ -720,19 +734,20 @@ def _get_bat_v(m: dict[str, MetricStats], role: str) -> MetricStats:
     Returns:
         MetricStats with values in volts
     """
-    bat = m.get("battery_mv", MetricStats()) if role == "companion" else m.get("bat", MetricStats())
+    field_name = BATTERY_FIELD.get(role)
+    bat = m.get(field_name) if field_name else None
+    if bat is None:
+        return MetricStats()
 
     if not bat.has_data:
         return bat
 
     # Convert mV to V
-    return MetricStats(
+    return replace(
+        bat,
         mean=bat.mean / 1000.0 if bat.mean is not None else None,
         min_value=bat.min_value / 1000.0 if bat.min_value is not None else None,
-        min_time=bat.min_time,
         max_value=bat.max_value / 1000.0 if bat.max_value is not None else None,
-        max_time=bat.max_time,
-        count=bat.count,
     )
 
 
@@ -6,6 +6,18 @@ from . import log
 
 __all__ = ["extract_lpp_from_payload", "extract_telemetry_metrics"]
 
+# Numeric reading types; bool is covered as an int subclass, so digital
+# on/off sensors report 1.0/0.0
+_NUMERIC = (int, float)
+
+# Spaces in sensor types and subkeys become underscores in metric keys
+_KEY_SPACES = str.maketrans(" ", "_")
+
+
+def _normalize_key(text: str) -> str:
+    """Normalize a sensor type or subkey for use as a metric key component."""
+    return text.strip().lower().translate(_KEY_SPACES)
+
 
 def extract_lpp_from_payload(payload: Any) -> list | None:
     """Extract LPP data list from telemetry payload.
@@ -67,14 +79,13 @@ def extract_telemetry_metrics(lpp_data: Any) -> dict[str, float]:
             log.debug(f"Skipping non-dict LPP reading at index {i}")
             continue
 
+        # Normalize sensor type for use as metric key component
         sensor_type = reading.get("type")
-        if not isinstance(sensor_type, str) or not sensor_type.strip():
+        sensor_type = _normalize_key(sensor_type) if isinstance(sensor_type, str) else ""
+        if not sensor_type:
             log.debug(f"Skipping reading with invalid type at index {i}")
             continue
 
-        # Normalize sensor type for use as metric key component
-        sensor_type = sensor_type.strip().lower().replace(" ", "_")
-
         channel = reading.get("channel", 0)
         if not isinstance(channel, int):
             channel = 0
@@ -82,18 +93,15 @@ def extract_telemetry_metrics(lpp_data: Any) -> dict[str, float]:
         value = reading.get("value")
         base_key = f"telemetry.{sensor_type}.{channel}"
 
-        # Note: Check bool before int because bool is a subclass of int in Python.
-        # Some sensors may report digital on/off values as booleans.
-        if isinstance(value, (bool, int, float)):
+        if isinstance(value, _NUMERIC):
             metrics[base_key] = float(value)
         elif isinstance(value, dict):
+            prefix = f"{base_key}."
             for subkey, subval in value.items():
-                if not isinstance(subkey, str):
-                    continue
-                subkey_clean = subkey.strip().lower().replace(" ", "_")
-                if not subkey_clean:
+                if not isinstance(subkey, str) or not isinstance(subval, _NUMERIC):
                     continue
-                if isinstance(subval, (bool, int, float)):
-                    metrics[f"{base_key}.{subkey_clean}"] = float(subval)
+                subkey_clean = _normalize_key(subkey)
+                if subkey_clean:
+                    metrics[prefix + subkey_clean] = float(subval)
 
     return metrics
@@ -13,6 +13,9 @@ from meshmon.charts import (
     TimeSeries,
 )
 
+# Fixed "now" for the relative-time fixtures, so runs are reproducible
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
 
 @pytest.fixture
 def light_theme():
@@ -29,7 +32,7 @@ def dark_theme():
 @pytest.fixture
 def sample_timeseries():
     """Sample time series with 24 hours of data."""
-    now = datetime.now()
+    now = BASE_TIME
     points = []
     for i in range(24):
         ts = now - timedelta(hours=23 - i)
@@ -59,7 +62,7 @@ def empty_timeseries():
 @pytest.fixture
 def single_point_timeseries():
     """Time series with single data point."""
-    now = datetime.now()
+    now = BASE_TIME
     return TimeSeries(
         metric="bat",
         role="repeater",
@@ -71,7 +74,7 @@ def single_point_timeseries():
 @pytest.fixture
 def counter_timeseries():
     """Sample counter time series (for rate calculation testing)."""
-    now = datetime.now()
+    now = BASE_TIME
     points = []
     for i in range(24):
         ts = now - timedelta(hours=23 - i)
@@ -90,7 +93,7 @@ def counter_timeseries():
 @pytest.fixture
 def week_timeseries():
     """Sample week time series for binning tests."""
-    now = datetime.now()
+    now = BASE_TIME
     points = []
     # One point per hour for 7 days = 168 points
     for i in range(168):
@@ -215,7 +218,7 @@ def snapshots_dir():
 @pytest.fixture
 def sample_raw_points():
     """Raw points for aggregation testing."""
-    now = datetime.now()
+    now = BASE_TIME
     return [
         (now - timedelta(hours=2), 3.7),
         (now - timedelta(hours=1, minutes=45), 3.72),
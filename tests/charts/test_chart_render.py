@@ -1,6 +1,5 @@
 """Tests for SVG chart rendering."""
 
-import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from xml.etree import ElementTree as ET
@@ -13,8 +12,9 @@ from meshmon.charts import (
     TimeSeries,
     render_chart_svg,
 )
+from tests.snapshots.conftest import UPDATE_SNAPSHOTS, assert_snapshot_match
 
-from .conftest import extract_svg_data_attributes, normalize_svg_for_snapshot
+from .conftest import BASE_TIME, extract_svg_data_attributes, normalize_svg_for_snapshot
 
 
 def _svg_viewbox_dims(svg: str) -> tuple[float, float]:
@@ -149,7 +149,7 @@ class TestYAxisLimits:
 
     def test_auto_y_limits_with_padding(self, light_theme):
         """Auto Y limits add padding around data."""
-        now = datetime.now()
+        now = BASE_TIME
         points = [
             DataPoint(timestamp=now, value=10.0),
             DataPoint(timestamp=now + timedelta(hours=1), value=20.0),
@@ -258,7 +258,7 @@ class TestSvgSnapshots:
     @pytest.fixture
     def update_snapshots(self):
         """Return True if snapshots should be updated."""
-        return os.environ.get("UPDATE_SNAPSHOTS", "").lower() in ("1", "true", "yes")
+        return UPDATE_SNAPSHOTS
 
     def _assert_snapshot_match(
         self,
@@ -267,52 +267,7 @@ class TestSvgSnapshots:
         update: bool,
     ) -> None:
         """Compare SVG against snapshot, with optional update mode."""
-        # Normalize for comparison
-        normalized = normalize_svg_for_snapshot(actual)
-
-        if update:
-            # Update mode: write normalized SVG to snapshot
-            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-            snapshot_path.write_text(normalized, encoding="utf-8")
-            pytest.skip(f"Snapshot updated: {snapshot_path}")
-        else:
-            # Compare mode
-            if not snapshot_path.exists():
-                # Create new snapshot if it doesn't exist
-                snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-                snapshot_path.write_text(normalized, encoding="utf-8")
-                pytest.fail(
-                    f"Snapshot created: {snapshot_path}\n"
-                    f"Run tests again to verify, or set UPDATE_SNAPSHOTS=1 to regenerate."
-                )
-
-            expected = snapshot_path.read_text(encoding="utf-8")
-
-            if normalized != expected:
-                # Show first difference for debugging
-                norm_lines = normalized.splitlines()
-                exp_lines = expected.splitlines()
-
-                diff_info = []
-                for i, (n, e) in enumerate(zip(norm_lines, exp_lines, strict=False), 1):
-                    if n != e:
-                        diff_info.append(f"Line {i} differs:")
-                        diff_info.append(f"  Expected: {e[:100]}...")
-                        diff_info.append(f"  Actual:   {n[:100]}...")
-                        if len(diff_info) > 12:
-                            diff_info.append("  (more differences omitted)")
-                            break
-
-                if len(norm_lines) != len(exp_lines):
-                    diff_info.append(
-                        f"Line count: expected {len(exp_lines)}, got {len(norm_lines)}"
-                    )
-
-                pytest.fail(
-                    f"Snapshot mismatch: {snapshot_path}\n"
-                    f"Set UPDATE_SNAPSHOTS=1 to regenerate.\n\n"
-                    + "\n".join(diff_info)
-                )
+        assert_snapshot_match(normalize_svg_for_snapshot(actual), snapshot_path, update)
 
     def test_gauge_chart_light_theme(
         self,
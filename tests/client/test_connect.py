@@ -89,7 +89,6 @@ class TestAutoDetectSerialPort:
 class TestConnectFromEnv:
     """Tests for connect_from_env function."""
 
-    @pytest.mark.asyncio
     async def test_returns_none_when_meshcore_unavailable(self, configured_env, monkeypatch):
         """Returns None when meshcore library not available."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", False)
@@ -98,7 +97,6 @@ class TestConnectFromEnv:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_serial_connection(self, configured_env, monkeypatch, mock_serial_port):
         """Connects via serial when configured."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -121,7 +119,6 @@ class TestConnectFromEnv:
         assert result is mock_client
         mock_create.assert_called_once_with("/dev/ttyACM0", 57600, debug=True)
 
-    @pytest.mark.asyncio
     async def test_tcp_connection(self, configured_env, monkeypatch):
         """Connects via TCP when configured."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -143,7 +140,6 @@ class TestConnectFromEnv:
         assert result is mock_client
         mock_create.assert_called_once_with("localhost", 4403)
 
-    @pytest.mark.asyncio
     async def test_unknown_transport(self, configured_env, monkeypatch):
         """Returns None for unknown transport."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -155,7 +151,6 @@ class TestConnectFromEnv:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_handles_connection_error(self, configured_env, monkeypatch, mock_serial_port):
         """Returns None on connection error."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -175,7 +170,6 @@ class TestConnectFromEnv:
         assert result is None
         mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_ble_connection(self, configured_env, monkeypatch):
         """Connects via BLE when configured."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -197,7 +191,6 @@ class TestConnectFromEnv:
         assert result is mock_client
         mock_create.assert_called_once_with("AA:BB:CC:DD:EE:FF", pin="123456")
 
-    @pytest.mark.asyncio
     async def test_ble_missing_address(self, configured_env, monkeypatch):
         """Returns None when BLE address not configured."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -210,7 +203,6 @@ class TestConnectFromEnv:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_serial_auto_detect(self, configured_env, monkeypatch, mock_serial_port):
         """Auto-detects serial port when not configured."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -236,7 +228,6 @@ class TestConnectFromEnv:
         assert result is mock_client
         mock_create.assert_called_once_with("/dev/ttyACM0", 115200, debug=False)
 
-    @pytest.mark.asyncio
     async def test_serial_auto_detect_fails(self, configured_env, monkeypatch, mock_serial_port):
         """Returns None when serial auto-detection fails."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -256,7 +247,6 @@ class TestConnectFromEnv:
 class TestConnectWithLock:
     """Tests for connect_with_lock context manager."""
 
-    @pytest.mark.asyncio
     async def test_yields_client_on_success(self, configured_env, monkeypatch, mock_serial_port):
         """Yields connected client on success."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -279,7 +269,6 @@ class TestConnectWithLock:
         # Should disconnect when exiting context
         mock_client.disconnect.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_yields_none_on_connection_failure(self, configured_env, monkeypatch, mock_serial_port):
         """Yields None when connection fails."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -297,7 +286,6 @@ class TestConnectWithLock:
         async with connect_with_lock() as mc:
             assert mc is None
 
-    @pytest.mark.asyncio
     async def test_acquires_lock_for_serial(self, configured_env, monkeypatch, mock_serial_port):
         """Acquires lock file for serial transport."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -319,7 +307,6 @@ class TestConnectWithLock:
             lock_path = cfg.state_dir / "serial.lock"
             assert lock_path.exists()
 
-    @pytest.mark.asyncio
     async def test_no_lock_for_tcp(self, configured_env, monkeypatch):
         """Does not acquire lock for TCP transport."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -343,7 +330,6 @@ class TestConnectWithLock:
             # Lock file should not exist for TCP
             assert not lock_path.exists()
 
-    @pytest.mark.asyncio
     async def test_handles_disconnect_error(self, configured_env, monkeypatch, mock_serial_port):
         """Handles disconnect error gracefully."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -367,7 +353,6 @@ class TestConnectWithLock:
         # Disconnect was still called
         mock_client.disconnect.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_releases_lock_on_failure(self, configured_env, monkeypatch, mock_serial_port):
         """Releases lock even when connection fails."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -397,7 +382,6 @@ class TestConnectWithLock:
 class TestAcquireLockAsync:
     """Tests for _acquire_lock_async function."""
 
-    @pytest.mark.asyncio
     async def test_acquires_lock_immediately(self, tmp_path):
         """Acquires lock when not held by others."""
         lock_file = tmp_path / "test.lock"
@@ -406,7 +390,6 @@ class TestAcquireLockAsync:
             await _acquire_lock_async(f, timeout=1.0)
             # If we get here, lock was acquired
 
-    @pytest.mark.asyncio
     async def test_times_out_when_locked(self, tmp_path):
         """Times out when lock held by another."""
         import fcntl
@@ -424,7 +407,6 @@ class TestAcquireLockAsync:
         finally:
             holder.close()
 
-    @pytest.mark.asyncio
     async def test_waits_for_lock_release(self, tmp_path):
         """Waits and acquires when lock released."""
         import asyncio
@@ -2,13 +2,10 @@
 
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 
 class TestMeshcoreAvailableTrue:
     """Tests when MESHCORE_AVAILABLE is True."""
 
-    @pytest.mark.asyncio
     async def test_run_command_executes_when_available(self, mock_meshcore_client, monkeypatch):
         """run_command executes command when meshcore available."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -31,7 +28,6 @@ class TestMeshcoreAvailableTrue:
         assert payload == {"bat": 3850}
         assert error is None
 
-    @pytest.mark.asyncio
     async def test_connect_from_env_attempts_connection(self, monkeypatch, tmp_path):
         """connect_from_env attempts to connect when meshcore available."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -62,7 +58,6 @@ class TestMeshcoreAvailableTrue:
 class TestMeshcoreAvailableFalse:
     """Tests when MESHCORE_AVAILABLE is False."""
 
-    @pytest.mark.asyncio
     async def test_run_command_returns_failure(self, mock_meshcore_client, monkeypatch):
         """run_command returns failure when meshcore not available."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", False)
@@ -88,7 +83,6 @@ class TestMeshcoreAvailableFalse:
         assert payload is None
         assert "not available" in error
 
-    @pytest.mark.asyncio
     async def test_connect_from_env_returns_none(self, monkeypatch, tmp_path):
         """connect_from_env returns None when meshcore not available."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", False)
@@ -135,7 +129,6 @@ class TestMeshcoreImportFallback:
         monkeypatch.setattr(builtins, "__import__", real_import)
         importlib.reload(module)
 
-    @pytest.mark.asyncio
     async def test_event_type_check_handles_none(self, monkeypatch):
         """EventType checks handle None gracefully."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -2,8 +2,6 @@
 
 from unittest.mock import MagicMock
 
-import pytest
-
 from meshmon.meshcore_client import run_command
 
 from .conftest import make_mock_event
@@ -12,7 +10,6 @@ from .conftest import make_mock_event
 class TestRunCommandSuccess:
     """Tests for successful command execution."""
 
-    @pytest.mark.asyncio
     async def test_returns_success_tuple(self, mock_meshcore_client, monkeypatch):
         """Returns (True, event_type, payload, None) on success."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -31,7 +28,6 @@ class TestRunCommandSuccess:
         assert payload == {"bat": 3850}
         assert error is None
 
-    @pytest.mark.asyncio
     async def test_extracts_payload_dict(self, mock_meshcore_client, monkeypatch):
         """Extracts payload when it's a dict."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -48,7 +44,6 @@ class TestRunCommandSuccess:
 
         assert payload == payload_data
 
-    @pytest.mark.asyncio
     async def test_converts_object_payload(self, mock_meshcore_client, monkeypatch):
         """Converts object payload to dict."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -72,7 +67,6 @@ class TestRunCommandSuccess:
 
         assert payload == {"voltage": 3.85}
 
-    @pytest.mark.asyncio
     async def test_converts_namedtuple_payload(self, mock_meshcore_client, monkeypatch):
         """Converts namedtuple payload to dict."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -97,7 +91,6 @@ class TestRunCommandSuccess:
 class TestRunCommandFailure:
     """Tests for command failure scenarios."""
 
-    @pytest.mark.asyncio
     async def test_returns_failure_when_unavailable(self, mock_meshcore_client, monkeypatch):
         """Returns failure when meshcore not available."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", False)
@@ -121,7 +114,6 @@ class TestRunCommandFailure:
         assert payload is None
         assert error == "meshcore not available"
 
-    @pytest.mark.asyncio
     async def test_returns_failure_on_none_event(self, mock_meshcore_client, monkeypatch):
         """Returns failure when no event received."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -136,7 +128,6 @@ class TestRunCommandFailure:
         assert success is False
         assert error == "No response received"
 
-    @pytest.mark.asyncio
     async def test_returns_failure_on_error_event(self, mock_meshcore_client, monkeypatch):
         """Returns failure on ERROR event type."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -162,7 +153,6 @@ class TestRunCommandFailure:
         assert payload is None
         assert error == "Command failed"
 
-    @pytest.mark.asyncio
     async def test_returns_failure_on_timeout(self, mock_meshcore_client, monkeypatch):
         """Returns failure on timeout."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -177,7 +167,6 @@ class TestRunCommandFailure:
         assert success is False
         assert error == "Timeout"
 
-    @pytest.mark.asyncio
     async def test_returns_failure_on_exception(self, mock_meshcore_client, monkeypatch):
         """Returns failure on general exception."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -196,7 +185,6 @@ class TestRunCommandFailure:
 class TestRunCommandEventTypeParsing:
     """Tests for event type name extraction."""
 
-    @pytest.mark.asyncio
     async def test_extracts_type_name_attribute(self, mock_meshcore_client, monkeypatch):
         """Extracts event type from .type.name attribute."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
@@ -215,7 +203,6 @@ class TestRunCommandEventTypeParsing:
         assert payload == {}
         assert error is None
 
-    @pytest.mark.asyncio
     async def test_falls_back_to_str_type(self, mock_meshcore_client, monkeypatch):
         """Falls back to str(type) when no .name."""
         monkeypatch.setattr("meshmon.meshcore_client.MESHCORE_AVAILABLE", True)
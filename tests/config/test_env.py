@@ -60,16 +60,18 @@ class TestGetBoolEdgeCases:
 class TestConfigComplete:
     """Complete Config class tests."""
 
-    def test_all_connection_settings(self, clean_env, monkeypatch):
+    def test_all_connection_settings(self, clean_env, env_override):
         """All connection settings are loaded."""
-        monkeypatch.setenv("MESH_TRANSPORT", "tcp")
-        monkeypatch.setenv("MESH_SERIAL_PORT", "/dev/ttyUSB0")
-        monkeypatch.setenv("MESH_SERIAL_BAUD", "9600")
-        monkeypatch.setenv("MESH_TCP_HOST", "192.168.1.1")
-        monkeypatch.setenv("MESH_TCP_PORT", "8080")
-        monkeypatch.setenv("MESH_BLE_ADDR", "AA:BB:CC:DD:EE:FF")
-        monkeypatch.setenv("MESH_BLE_PIN", "1234")
-        monkeypatch.setenv("MESH_DEBUG", "true")
+        env_override(
+            MESH_TRANSPORT="tcp",
+            MESH_SERIAL_PORT="/dev/ttyUSB0",
+            MESH_SERIAL_BAUD="9600",
+            MESH_TCP_HOST="192.168.1.1",
+            MESH_TCP_PORT="8080",
+            MESH_BLE_ADDR="AA:BB:CC:DD:EE:FF",
+            MESH_BLE_PIN="1234",
+            MESH_DEBUG="true",
+        )
 
         config = Config()
 
@@ -82,14 +84,16 @@ class TestConfigComplete:
         assert config.mesh_ble_pin == "1234"
         assert config.mesh_debug is True
 
-    def test_all_repeater_settings(self, clean_env, monkeypatch):
+    def test_all_repeater_settings(self, clean_env, env_override):
         """All repeater identity settings are loaded."""
-        monkeypatch.setenv("REPEATER_NAME", "HilltopRepeater")
-        monkeypatch.setenv("REPEATER_KEY_PREFIX", "abc123")
-        monkeypatch.setenv("REPEATER_PASSWORD", "secret")
-        monkeypatch.setenv("REPEATER_DISPLAY_NAME", "Hilltop Relay")
-        monkeypatch.setenv("REPEATER_PUBKEY_PREFIX", "!abc123")
-        monkeypatch.setenv("REPEATER_HARDWARE", "RAK4631 with Solar")
+        env_override(
+            REPEATER_NAME="HilltopRepeater",
+            REPEATER_KEY_PREFIX="abc123",
+            REPEATER_PASSWORD="secret",
+            REPEATER_DISPLAY_NAME="Hilltop Relay",
+            REPEATER_PUBKEY_PREFIX="!abc123",
+            REPEATER_HARDWARE="RAK4631 with Solar",
+        )
 
         config = Config()
 
@@ -100,13 +104,15 @@ class TestConfigComplete:
         assert config.repeater_pubkey_prefix == "!abc123"
         assert config.repeater_hardware == "RAK4631 with Solar"
 
-    def test_all_timeout_settings(self, clean_env, monkeypatch):
+    def test_all_timeout_settings(self, clean_env, env_override):
         """All timeout and retry settings are loaded."""
-        monkeypatch.setenv("REMOTE_TIMEOUT_S", "30")
-        monkeypatch.setenv("REMOTE_RETRY_ATTEMPTS", "5")
-        monkeypatch.setenv("REMOTE_RETRY_BACKOFF_S", "10")
-        monkeypatch.setenv("REMOTE_CB_FAILS", "10")
-        monkeypatch.setenv("REMOTE_CB_COOLDOWN_S", "7200")
+        env_override(
+            REMOTE_TIMEOUT_S="30",
+            REMOTE_RETRY_ATTEMPTS="5",
+            REMOTE_RETRY_BACKOFF_S="10",
+            REMOTE_CB_FAILS="10",
+            REMOTE_CB_COOLDOWN_S="7200",
+        )
 
         config = Config()
 
@@ -116,12 +122,14 @@ class TestConfigComplete:
         assert config.remote_cb_fails == 10
         assert config.remote_cb_cooldown_s == 7200
 
-    def test_all_telemetry_settings(self, clean_env, monkeypatch):
+    def test_all_telemetry_settings(self, clean_env, env_override):
         """All telemetry settings are loaded."""
-        monkeypatch.setenv("TELEMETRY_ENABLED", "yes")
-        monkeypatch.setenv("TELEMETRY_TIMEOUT_S", "20")
-        monkeypatch.setenv("TELEMETRY_RETRY_ATTEMPTS", "3")
-        monkeypatch.setenv("TELEMETRY_RETRY_BACKOFF_S", "5")
+        env_override(
+            TELEMETRY_ENABLED="yes",
+            TELEMETRY_TIMEOUT_S="20",
+            TELEMETRY_RETRY_ATTEMPTS="3",
+            TELEMETRY_RETRY_BACKOFF_S="5",
+        )
 
         config = Config()
 
@@ -130,10 +138,9 @@ class TestConfigComplete:
         assert config.telemetry_retry_attempts == 3
         assert config.telemetry_retry_backoff_s == 5
 
-    def test_display_unit_system_defaults_to_metric(self, clean_env):
+    def test_display_unit_system_defaults_to_metric(self, default_config):
         """DISPLAY_UNIT_SYSTEM defaults to metric."""
-        config = Config()
-        assert config.display_unit_system == "metric"
+        assert default_config.display_unit_system == "metric"
 
     def test_display_unit_system_accepts_imperial(self, clean_env, monkeypatch):
         """DISPLAY_UNIT_SYSTEM=imperial is honored."""
@@ -147,14 +154,16 @@ class TestConfigComplete:
         config = Config()
         assert config.display_unit_system == "metric"
 
-    def test_all_location_settings(self, clean_env, monkeypatch):
+    def test_all_location_settings(self, clean_env, env_override):
         """All location/report settings are loaded."""
-        monkeypatch.setenv("REPORT_LOCATION_NAME", "Mountain Peak Observatory")
-        monkeypatch.setenv("REPORT_LOCATION_SHORT", "Mountain Peak")
-        monkeypatch.setenv("REPORT_LAT", "46.8523")
-        monkeypatch.setenv("REPORT_LON", "9.5369")
-        monkeypatch.setenv("REPORT_ELEV", "2500")
-        monkeypatch.setenv("REPORT_ELEV_UNIT", "ft")
+        env_override(
+            REPORT_LOCATION_NAME="Mountain Peak Observatory",
+            REPORT_LOCATION_SHORT="Mountain Peak",
+            REPORT_LAT="46.8523",
+            REPORT_LON="9.5369",
+            REPORT_ELEV="2500",
+            REPORT_ELEV_UNIT="ft",
+        )
 
         config = Config()
 
@@ -165,12 +174,14 @@ class TestConfigComplete:
         assert config.report_elev == pytest.approx(2500)
         assert config.report_elev_unit == "ft"
 
-    def test_all_radio_settings(self, clean_env, monkeypatch):
+    def test_all_radio_settings(self, clean_env, env_override):
         """All radio configuration settings are loaded."""
-        monkeypatch.setenv("RADIO_FREQUENCY", "915.000 MHz")
-        monkeypatch.setenv("RADIO_BANDWIDTH", "125 kHz")
-        monkeypatch.setenv("RADIO_SPREAD_FACTOR", "SF12")
-        monkeypatch.setenv("RADIO_CODING_RATE", "CR5")
+        env_override(
+            RADIO_FREQUENCY="915.000 MHz",
+            RADIO_BANDWIDTH="125 kHz",
+            RADIO_SPREAD_FACTOR="SF12",
+            RADIO_CODING_RATE="CR5",
+        )
 
         config = Config()
 
@@ -179,11 +190,13 @@ class TestConfigComplete:
         assert config.radio_spread_factor == "SF12"
         assert config.radio_coding_rate == "CR5"
 
-    def test_companion_settings(self, clean_env, monkeypatch):
+    def test_companion_settings(self, clean_env, env_override):
         """Companion display settings are loaded."""
-        monkeypatch.setenv("COMPANION_DISPLAY_NAME", "Base Station")
-        monkeypatch.setenv("COMPANION_PUBKEY_PREFIX", "!def456")
-        monkeypatch.setenv("COMPANION_HARDWARE", "T-Beam Supreme")
+        env_override(
+            COMPANION_DISPLAY_NAME="Base Station",
+            COMPANION_PUBKEY_PREFIX="!def456",
+            COMPANION_HARDWARE="T-Beam Supreme",
+        )
 
         config = Config()
 
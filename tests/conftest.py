@@ -1,32 +1,37 @@
 """Root fixtures for all tests."""
 
+import copy
 import os
 from pathlib import Path
 
 import pytest
 
+# Env var prefixes owned by meshmon; cleared so the host env can't leak in
+MESH_ENV_PREFIXES = (
+    "MESH_",
+    "REPEATER_",
+    "COMPANION_",
+    "REMOTE_",
+    "TELEMETRY_",
+    "DISPLAY_",
+    "REPORT_",
+    "RADIO_",
+    "STATE_DIR",
+    "OUT_DIR",
+)
+
+
+def _clear_mesh_env(monkeypatch) -> None:
+    """Remove all meshmon env vars via monkeypatch."""
+    for key in list(os.environ.keys()):
+        if key.startswith(MESH_ENV_PREFIXES):
+            monkeypatch.delenv(key, raising=False)
+
 
 @pytest.fixture(autouse=True)
 def clean_env(monkeypatch):
     """Clear mesh-related env vars and reset config singleton before each test."""
-    env_prefixes = (
-        "MESH_",
-        "REPEATER_",
-        "COMPANION_",
-        "REMOTE_",
-        "TELEMETRY_",
-        "DISPLAY_",
-        "REPORT_",
-        "RADIO_",
-        "STATE_DIR",
-        "OUT_DIR",
-    )
-
-    for key in list(os.environ.keys()):
-        for prefix in env_prefixes:
-            if key.startswith(prefix):
-                monkeypatch.delenv(key, raising=False)
-                break
+    _clear_mesh_env(monkeypatch)
 
     # Reset config singleton
     import meshmon.env
@@ -39,6 +44,56 @@ def clean_env(monkeypatch):
     meshmon.env._config = None
 
 
+@pytest.fixture(scope="session")
+def default_config():
+    """Config built once from a clean environment. Treat as read-only."""
+    from meshmon.env import Config
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _clear_mesh_env(monkeypatch)
+        return Config()
+
+
+@pytest.fixture
+def env_override(monkeypatch):
+    """Set env vars for a test and drop the cached config so they apply.
+
+    Usage:
+        def test_something(env_override):
+            env_override(REPORT_LAT="52.37", REPORT_LON="4.89")
+    """
+    import meshmon.env
+
+    def apply(**env):
+        for key, value in env.items():
+            monkeypatch.setenv(key, str(value))
+        monkeypatch.setattr(meshmon.env, "_config", None)
+
+    return apply
+
+
+@pytest.fixture
+def inject_config(monkeypatch, default_config):
+    """Install a Config with attribute overrides as the singleton, skipping env parsing.
+
+    Usage:
+        def test_something(inject_config):
+            inject_config(report_lat=51.5074, radio_frequency="915.0 MHz")
+    """
+    import meshmon.env
+
+    def apply(**overrides):
+        cfg = copy.copy(default_config)
+        for name, value in overrides.items():
+            if not hasattr(cfg, name):
+                raise AttributeError(f"Config has no attribute {name!r}")
+            setattr(cfg, name, value)
+        monkeypatch.setattr(meshmon.env, "_config", cfg)
+        return cfg
+
+    return apply
+
+
 @pytest.fixture
 def tmp_state_dir(tmp_path):
     """Create temp directory for state files (DB, circuit breaker)."""
@@ -87,11 +87,9 @@ class TestBuildNodeDetails:
             assert "label" in item
             assert "value" in item
 
-    def test_includes_hardware_info(self, configured_env, monkeypatch):
+    def test_includes_hardware_info(self, configured_env, env_override):
         """Includes hardware model info."""
-        monkeypatch.setenv("REPEATER_HARDWARE", "Test LoRa Device")
-        import meshmon.env
-        meshmon.env._config = None
+        env_override(REPEATER_HARDWARE="Test LoRa Device")
 
         result = build_node_details("repeater")
 
@@ -124,11 +122,9 @@ class TestBuildRadioConfig:
             assert "label" in item
             assert "value" in item
 
-    def test_includes_frequency_when_set(self, configured_env, monkeypatch):
+    def test_includes_frequency_when_set(self, configured_env, env_override):
         """Includes frequency when configured."""
-        monkeypatch.setenv("RADIO_FREQUENCY", "869.618 MHz")
-        import meshmon.env
-        meshmon.env._config = None
+        env_override(RADIO_FREQUENCY="869.618 MHz")
 
         result = build_radio_config()
 
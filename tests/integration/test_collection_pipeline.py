@@ -14,7 +14,6 @@ BASE_TS = 1704067200
 class TestCompanionCollectionPipeline:
     """Test companion collection end-to-end."""
 
-    @pytest.mark.asyncio
     async def test_successful_collection_stores_metrics(
         self,
         mock_meshcore_successful_collection,
@@ -80,7 +79,6 @@ class TestCompanionCollectionPipeline:
             assert "recv" in latest
             assert "sent" in latest
 
-    @pytest.mark.asyncio
     async def test_collection_fails_gracefully_on_connection_error(
         self, full_integration_env, monkeypatch
     ):
@@ -112,7 +110,6 @@ class TestCompanionCollectionPipeline:
 class TestCollectionWithCircuitBreaker:
     """Test collection with circuit breaker integration."""
 
-    @pytest.mark.asyncio
     async def test_circuit_breaker_prevents_collection_when_open(
         self, full_integration_env, monkeypatch
     ):
@@ -143,7 +140,6 @@ class TestCollectionWithCircuitBreaker:
         assert result == 0
         assert connect_called is False
 
-    @pytest.mark.asyncio
     async def test_circuit_breaker_records_failure(self, full_integration_env, monkeypatch):
         """Circuit breaker should record failures."""
 
@@ -165,7 +161,6 @@ class TestCollectionWithCircuitBreaker:
         cb.record_success()
         assert cb.consecutive_failures == 0
 
-    @pytest.mark.asyncio
     async def test_circuit_breaker_state_persists(self, full_integration_env):
         """Circuit breaker state should persist to disk."""
         from meshmon.retry import CircuitBreaker
@@ -6,7 +6,6 @@ to detect unintended changes in report layout and formatting.
 To update snapshots, run: UPDATE_SNAPSHOTS=1 pytest tests/reports/test_snapshots.py
 """
 
-import os
 from datetime import date, datetime
 from pathlib import Path
 
@@ -21,6 +20,7 @@ from meshmon.reports import (
     format_monthly_txt,
     format_yearly_txt,
 )
+from tests.snapshots.conftest import UPDATE_SNAPSHOTS, assert_snapshot_match
 
 
 class TestTxtReportSnapshots:
@@ -29,7 +29,7 @@ class TestTxtReportSnapshots:
     @pytest.fixture
     def update_snapshots(self):
         """Return True if snapshots should be updated."""
-        return os.environ.get("UPDATE_SNAPSHOTS", "").lower() in ("1", "true", "yes")
+        return UPDATE_SNAPSHOTS
 
     @pytest.fixture
     def txt_snapshots_dir(self):
@@ -397,49 +397,7 @@ class TestTxtReportSnapshots:
         update: bool,
     ) -> None:
         """Compare TXT report against snapshot, with optional update mode."""
-        if update:
-            # Update mode: write actual to snapshot
-            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-            snapshot_path.write_text(actual, encoding="utf-8")
-            pytest.skip(f"Snapshot updated: {snapshot_path}")
-        else:
-            # Compare mode
-            if not snapshot_path.exists():
-                # Create new snapshot if it doesn't exist
-                snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-                snapshot_path.write_text(actual, encoding="utf-8")
-                pytest.fail(
-                    f"Snapshot created: {snapshot_path}\n"
-                    f"Run tests again to verify, or set UPDATE_SNAPSHOTS=1 to regenerate."
-                )
-
-            expected = snapshot_path.read_text(encoding="utf-8")
-
-            if actual != expected:
-                # Show differences for debugging
-                actual_lines = actual.splitlines()
-                expected_lines = expected.splitlines()
-
-                diff_info = []
-                for i, (a, e) in enumerate(zip(actual_lines, expected_lines, strict=False), 1):
-                    if a != e:
-                        diff_info.append(f"Line {i} differs:")
-                        diff_info.append(f"  Expected: '{e}'")
-                        diff_info.append(f"  Actual:   '{a}'")
-                        if len(diff_info) > 15:
-                            diff_info.append("  (more differences omitted)")
-                            break
-
-                if len(actual_lines) != len(expected_lines):
-                    diff_info.append(
-                        f"Line count: expected {len(expected_lines)}, got {len(actual_lines)}"
-                    )
-
-                pytest.fail(
-                    f"Snapshot mismatch: {snapshot_path}\n"
-                    f"Set UPDATE_SNAPSHOTS=1 to regenerate.\n\n"
-                    + "\n".join(diff_info)
-                )
+        assert_snapshot_match(actual, snapshot_path, update)
 
     def test_monthly_report_repeater(
         self,
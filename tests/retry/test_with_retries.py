@@ -22,7 +22,6 @@ def sleep_spy(monkeypatch):
 class TestWithRetriesSuccess:
     """Tests for successful operation scenarios."""
 
-    @pytest.mark.asyncio
     async def test_returns_result_on_success(self):
         """Returns result when operation succeeds."""
         async def success_fn():
@@ -34,7 +33,6 @@ class TestWithRetriesSuccess:
         assert result == "result"
         assert exception is None
 
-    @pytest.mark.asyncio
     async def test_single_attempt_on_success(self):
         """Only calls function once when successful."""
         call_count = 0
@@ -48,7 +46,6 @@ class TestWithRetriesSuccess:
 
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_returns_complex_result(self):
         """Returns complex result types correctly."""
         async def complex_fn():
@@ -58,7 +55,6 @@ class TestWithRetriesSuccess:
 
         assert result == {"status": "ok", "data": [1, 2, 3]}
 
-    @pytest.mark.asyncio
     async def test_returns_none_result(self):
         """Returns None result correctly (distinct from failure)."""
         async def none_fn():
@@ -74,7 +70,6 @@ class TestWithRetriesSuccess:
 class TestWithRetriesFailure:
     """Tests for failure scenarios."""
 
-    @pytest.mark.asyncio
     async def test_returns_false_on_exhausted_attempts(self):
         """Returns failure when all attempts exhausted."""
         async def failing_fn():
@@ -88,7 +83,6 @@ class TestWithRetriesFailure:
         assert result is None
         assert isinstance(exception, ValueError)
 
-    @pytest.mark.asyncio
     async def test_retries_specified_times(self):
         """Retries the specified number of times."""
         call_count = 0
@@ -102,7 +96,6 @@ class TestWithRetriesFailure:
 
         assert call_count == 5
 
-    @pytest.mark.asyncio
     async def test_returns_last_exception(self):
         """Returns the exception from the last attempt."""
         attempt = 0
@@ -122,7 +115,6 @@ class TestWithRetriesFailure:
 class TestWithRetriesRetryBehavior:
     """Tests for retry behavior."""
 
-    @pytest.mark.asyncio
     async def test_succeeds_on_retry(self):
         """Succeeds if operation succeeds on retry."""
         attempt = 0
@@ -143,7 +135,6 @@ class TestWithRetriesRetryBehavior:
         assert exception is None
         assert attempt == 3
 
-    @pytest.mark.asyncio
     async def test_backoff_timing(self, sleep_spy):
         """Waits backoff_s between retries."""
         async def failing_fn():
@@ -153,7 +144,6 @@ class TestWithRetriesRetryBehavior:
 
         assert sleep_spy == [0.1, 0.1]
 
-    @pytest.mark.asyncio
     async def test_no_backoff_after_last_attempt(self, sleep_spy):
         """Does not wait after final failed attempt."""
         async def failing_fn():
@@ -167,7 +157,6 @@ class TestWithRetriesRetryBehavior:
 class TestWithRetriesParameters:
     """Tests for parameter handling."""
 
-    @pytest.mark.asyncio
     async def test_default_attempts(self):
         """Uses default of 2 attempts."""
         call_count = 0
@@ -181,7 +170,6 @@ class TestWithRetriesParameters:
 
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_single_attempt(self):
         """Works with single attempt (no retry)."""
         call_count = 0
@@ -195,7 +183,6 @@ class TestWithRetriesParameters:
 
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_zero_backoff(self):
         """Works with zero backoff."""
         call_count = 0
@@ -209,7 +196,6 @@ class TestWithRetriesParameters:
 
         assert call_count == 3
 
-    @pytest.mark.asyncio
     async def test_name_parameter_for_logging(self, monkeypatch, sleep_spy):
         """Name parameter is used in logging."""
         messages = []
@@ -236,7 +222,6 @@ class TestWithRetriesParameters:
 class TestWithRetriesExceptionTypes:
     """Tests for different exception types."""
 
-    @pytest.mark.asyncio
     async def test_handles_value_error(self):
         """Handles ValueError correctly."""
         async def fn():
@@ -247,7 +232,6 @@ class TestWithRetriesExceptionTypes:
         assert success is False
         assert isinstance(exception, ValueError)
 
-    @pytest.mark.asyncio
     async def test_handles_runtime_error(self):
         """Handles RuntimeError correctly."""
         async def fn():
@@ -258,7 +242,6 @@ class TestWithRetriesExceptionTypes:
         assert success is False
         assert isinstance(exception, RuntimeError)
 
-    @pytest.mark.asyncio
     async def test_handles_timeout_error(self):
         """Handles asyncio.TimeoutError correctly."""
         async def fn():
@@ -269,7 +252,6 @@ class TestWithRetriesExceptionTypes:
         assert success is False
         assert isinstance(exception, asyncio.TimeoutError)
 
-    @pytest.mark.asyncio
     async def test_handles_os_error(self):
         """Handles OSError correctly."""
         async def fn():
@@ -280,7 +262,6 @@ class TestWithRetriesExceptionTypes:
         assert success is False
         assert isinstance(exception, OSError)
 
-    @pytest.mark.asyncio
     async def test_handles_custom_exception(self):
         """Handles custom exception types correctly."""
         class CustomError(Exception):
@@ -298,7 +279,6 @@ class TestWithRetriesExceptionTypes:
 class TestWithRetriesAsyncBehavior:
     """Tests for async-specific behavior."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_retries_independent(self):
         """Multiple concurrent retry operations are independent."""
         calls_a = 0
@@ -328,7 +308,6 @@ class TestWithRetriesAsyncBehavior:
         assert calls_a == 2
         assert calls_b == 3
 
-    @pytest.mark.asyncio
     async def test_does_not_block_event_loop(self):
         """Backoff uses asyncio.sleep, not blocking sleep."""
         events = []
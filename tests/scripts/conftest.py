@@ -1,10 +1,13 @@
 """Script-specific test fixtures."""
 
+import functools
 import importlib.util
+import shutil
 import sys
 from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -19,9 +22,25 @@ if str(SRC_DIR) not in sys.path:
 _loaded_script_modules: set[str] = set()
 
 
+class MCSpec:
+    """Spec for MeshCore mocks: the attributes the collect scripts touch.
+
+    ``Mock(spec=MCSpec)`` rejects anything else and skips MagicMock's
+    magic-method setup.
+    """
+
+    commands = None
+    contacts = None
+
+
+@functools.cache
 def load_script_module(script_name: str):
     """Load a script as a module and track it for cleanup.
 
+    Each script is executed once per session; later calls return the cached
+    module. Tests only swap attributes via patch.object/monkeypatch, which
+    restore them on exit, so sharing the module is safe.
+
     Args:
         script_name: Name of script file (e.g., "collect_companion.py")
 
@@ -43,23 +62,141 @@ def load_script_module(script_name: str):
     return module
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def cleanup_script_modules():
-    """Clean up dynamically loaded script modules after each test.
+    """Clean up dynamically loaded script modules at the end of the session.
 
-    This prevents test pollution where module-level state persists
-    between tests, potentially causing false positives or flaky tests.
+    Script modules are cached by load_script_module, so they are dropped from
+    sys.modules (and the cache) once, after the last test has run.
     """
-    # Clear tracking before test
-    _loaded_script_modules.clear()
-
     yield
 
-    # Clean up after test
     for module_name in _loaded_script_modules:
         if module_name in sys.modules:
             del sys.modules[module_name]
     _loaded_script_modules.clear()
+    load_script_module.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def configured_env_module(tmp_path_factory):
+    """State and output directories shared by every test in a module."""
+    root = tmp_path_factory.mktemp("scripts_env")
+    state_dir = root / "state"
+    out_dir = root / "out"
+    state_dir.mkdir()
+    out_dir.mkdir()
+    return {"state_dir": state_dir, "out_dir": out_dir}
+
+
+@pytest.fixture
+def tmp_state_dir(configured_env_module):
+    """Module-shared state directory (overrides the root per-test fixture)."""
+    return configured_env_module["state_dir"]
+
+
+@pytest.fixture
+def tmp_out_dir(configured_env_module):
+    """Module-shared output directory (overrides the root per-test fixture)."""
+    return configured_env_module["out_dir"]
+
+
+@pytest.fixture
+def configured_env(configured_env_module, monkeypatch):
+    """Point STATE_DIR/OUT_DIR at the module-shared directories.
+
+    Anything a test writes there (database, circuit breaker state, rendered
+    files) is removed afterwards so tests stay isolated.
+    """
+    monkeypatch.setenv("STATE_DIR", str(configured_env_module["state_dir"]))
+    monkeypatch.setenv("OUT_DIR", str(configured_env_module["out_dir"]))
+
+    yield configured_env_module
+
+    for directory in configured_env_module.values():
+        for child in directory.iterdir():
+            if child.is_dir():
+                shutil.rmtree(child)
+            else:
+                child.unlink()
+
+
+@pytest.fixture(scope="session")
+def collect_companion_module():
+    """collect_companion.py loaded once and shared across the session."""
+    return load_script_module("collect_companion.py")
+
+
+@pytest.fixture(scope="session")
+def collect_repeater_module():
+    """collect_repeater.py loaded once and shared across the session."""
+    return load_script_module("collect_repeater.py")
+
+
+@pytest.fixture(scope="session")
+def render_charts_module():
+    """render_charts.py loaded once and shared across the session."""
+    return load_script_module("render_charts.py")
+
+
+@pytest.fixture(scope="session")
+def render_site_module():
+    """render_site.py loaded once and shared across the session."""
+    return load_script_module("render_site.py")
+
+
+@pytest.fixture(scope="session")
+def render_reports_module():
+    """render_reports.py loaded once and shared across the session."""
+    return load_script_module("render_reports.py")
+
+
+@pytest.fixture(scope="session")
+def generate_snapshots_module():
+    """generate_snapshots.py loaded once and shared across the session."""
+    return load_script_module("generate_snapshots.py")
+
+
+@pytest.fixture
+def mc_and_ctx(async_context_manager_factory):
+    """Connected MeshCore mock and the connect_with_lock context yielding it.
+
+    Usage:
+        async def test_something(mc_and_ctx):
+            mc, ctx_mock = mc_and_ctx
+            with patch.object(module, "connect_with_lock", return_value=ctx_mock):
+                ...
+
+    Returns:
+        (mc, ctx_mock) tuple
+    """
+    mc = Mock(spec=MCSpec)
+    mc.commands = Mock()
+    mc.contacts = {}
+    return mc, async_context_manager_factory(mc)
+
+
+@pytest.fixture
+def closed_breaker_mock():
+    """Circuit breaker mock that lets collection proceed."""
+    from meshmon.retry import CircuitBreaker
+
+    cb = Mock(spec=CircuitBreaker)
+    cb.is_open.return_value = False
+    cb.consecutive_failures = 0
+    return cb
+
+
+@pytest.fixture
+def collect_repeater_mocks(closed_breaker_mock, mc_and_ctx):
+    """Closed circuit breaker plus a connected mc for collect_repeater tests.
+
+    Returns:
+        Namespace with ``cb`` (circuit breaker), ``mc`` (MeshCore mock) and
+        ``ctx`` (async context manager yielding ``mc``)
+    """
+    mc, ctx_mock = mc_and_ctx
+    return SimpleNamespace(cb=closed_breaker_mock, mc=mc, ctx=ctx_mock)
 
 
 @pytest.fixture
@@ -7,42 +7,32 @@ The script is the entry point that users run - if it breaks, everything breaks.
 import inspect
 from unittest.mock import MagicMock, patch
 
-import pytest
-
-from tests.scripts.conftest import load_script_module
-
-
-def load_collect_companion():
-    """Load collect_companion.py as a module."""
-    return load_script_module("collect_companion.py")
-
 
 class TestCollectCompanionImport:
     """Verify script can be imported without errors."""
 
-    def test_imports_successfully(self, configured_env):
+    def test_imports_successfully(self, configured_env, collect_companion_module):
         """Script should import without errors."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         assert hasattr(module, "main")
         assert hasattr(module, "collect_companion")
         assert callable(module.main)
 
-    def test_collect_companion_is_async(self, configured_env):
+    def test_collect_companion_is_async(self, configured_env, collect_companion_module):
         """collect_companion() should be an async function."""
-        module = load_collect_companion()
+        module = collect_companion_module
         assert inspect.iscoroutinefunction(module.collect_companion)
 
 
 class TestCollectCompanionExitCodes:
     """Test exit code behavior - critical for monitoring."""
 
-    @pytest.mark.asyncio
     async def test_returns_zero_on_successful_collection(
-        self, configured_env, async_context_manager_factory, mock_run_command_factory
+        self, configured_env, collect_companion_module, mc_and_ctx, mock_run_command_factory
     ):
         """Successful collection should return exit code 0."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         responses = {
             "send_appstart": (True, "SELF_INFO", {}, None),
@@ -61,27 +51,22 @@ class TestCollectCompanionExitCodes:
             "get_stats_packets": (True, "STATS_PACKETS", {"recv": 100, "sent": 50}, None),
         }
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(
-                module, "run_command", side_effect=mock_run_command_factory(responses)
-            ),
+            patch.object(module, "run_command", side_effect=mock_run_command_factory(responses)),
             patch.object(module, "insert_metrics", return_value=5),
         ):
             exit_code = await module.collect_companion()
 
         assert exit_code == 0
 
-    @pytest.mark.asyncio
     async def test_returns_one_on_connection_failure(
-        self, configured_env, async_context_manager_factory
+        self, configured_env, collect_companion_module, async_context_manager_factory
     ):
         """Failed connection should return exit code 1."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         # Connection returns None (failed)
         ctx_mock = async_context_manager_factory(None)
@@ -91,20 +76,17 @@ class TestCollectCompanionExitCodes:
 
         assert exit_code == 1
 
-    @pytest.mark.asyncio
     async def test_returns_one_when_no_commands_succeed(
-        self, configured_env, async_context_manager_factory
+        self, configured_env, collect_companion_module, mc_and_ctx
     ):
         """No successful commands should return exit code 1."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         # All commands fail
         async def mock_run_command_fail(mc, coro, name):
             return (False, None, None, "Command failed")
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -114,12 +96,11 @@ class TestCollectCompanionExitCodes:
 
         assert exit_code == 1
 
-    @pytest.mark.asyncio
     async def test_returns_one_on_database_error(
-        self, configured_env, async_context_manager_factory, mock_run_command_factory
+        self, configured_env, collect_companion_module, mc_and_ctx, mock_run_command_factory
     ):
         """Database write failure should return exit code 1."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         responses = {
             "get_stats_core": (True, "STATS_CORE", {"battery_mv": 3850}, None),
@@ -127,9 +108,7 @@ class TestCollectCompanionExitCodes:
         # Default to success for other commands
         default = (True, "OK", {}, None)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -146,12 +125,11 @@ class TestCollectCompanionExitCodes:
 class TestCollectCompanionMetrics:
     """Test metric collection behavior."""
 
-    @pytest.mark.asyncio
     async def test_collects_all_numeric_fields_from_stats(
-        self, configured_env, async_context_manager_factory, mock_run_command_factory
+        self, configured_env, collect_companion_module, mc_and_ctx, mock_run_command_factory
     ):
         """Should insert all numeric fields from stats responses."""
-        module = load_collect_companion()
+        module = collect_companion_module
         collected_metrics = {}
 
         responses = {
@@ -180,15 +158,11 @@ class TestCollectCompanionMetrics:
             collected_metrics.update(metrics)
             return len(metrics)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(
-                module, "run_command", side_effect=mock_run_command_factory(responses)
-            ),
+            patch.object(module, "run_command", side_effect=mock_run_command_factory(responses)),
             patch.object(module, "insert_metrics", side_effect=capture_metrics),
         ):
             await module.collect_companion()
@@ -201,12 +175,11 @@ class TestCollectCompanionMetrics:
         assert collected_metrics["sent"] == 50
         assert collected_metrics["noise_floor"] == -115
 
-    @pytest.mark.asyncio
     async def test_telemetry_not_extracted_when_disabled(
-        self, configured_env, async_context_manager_factory, monkeypatch
+        self, configured_env, collect_companion_module, mc_and_ctx, monkeypatch
     ):
         """Telemetry metrics should NOT be extracted when TELEMETRY_ENABLED=0 (default)."""
-        module = load_collect_companion()
+        module = collect_companion_module
         collected_metrics = {}
 
         async def mock_run_command(mc, coro, name):
@@ -221,9 +194,7 @@ class TestCollectCompanionMetrics:
             collected_metrics.update(metrics)
             return len(metrics)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -236,18 +207,14 @@ class TestCollectCompanionMetrics:
         telemetry_keys = [k for k in collected_metrics if k.startswith("telemetry.")]
         assert len(telemetry_keys) == 0
 
-    @pytest.mark.asyncio
     async def test_telemetry_extracted_when_enabled(
-        self, configured_env, async_context_manager_factory, monkeypatch
+        self, configured_env, collect_companion_module, mc_and_ctx, env_override
     ):
         """Telemetry metrics SHOULD be extracted when TELEMETRY_ENABLED=1."""
-        # Enable telemetry BEFORE loading the module
-        monkeypatch.setenv("TELEMETRY_ENABLED", "1")
-        import meshmon.env
-
-        meshmon.env._config = None
+        # Enable telemetry before the script reads its config
+        env_override(TELEMETRY_ENABLED="1")
 
-        module = load_collect_companion()
+        module = collect_companion_module
         collected_metrics = {}
 
         # LPP data format: list of dictionaries with type, channel, value
@@ -267,9 +234,7 @@ class TestCollectCompanionMetrics:
             collected_metrics.update(metrics)
             return len(metrics)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -285,17 +250,13 @@ class TestCollectCompanionMetrics:
         assert "telemetry.temperature.0" in collected_metrics
         assert collected_metrics["telemetry.temperature.0"] == 25.5
 
-    @pytest.mark.asyncio
     async def test_telemetry_extraction_handles_invalid_lpp(
-        self, configured_env, async_context_manager_factory, monkeypatch
+        self, configured_env, collect_companion_module, mc_and_ctx, env_override
     ):
         """Telemetry extraction should handle invalid LPP data gracefully."""
-        monkeypatch.setenv("TELEMETRY_ENABLED", "1")
-        import meshmon.env
+        env_override(TELEMETRY_ENABLED="1")
 
-        meshmon.env._config = None
-
-        module = load_collect_companion()
+        module = collect_companion_module
         collected_metrics = {}
 
         async def mock_run_command(mc, coro, name):
@@ -310,9 +271,7 @@ class TestCollectCompanionMetrics:
             collected_metrics.update(metrics)
             return len(metrics)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -331,12 +290,11 @@ class TestCollectCompanionMetrics:
 class TestPartialSuccessScenarios:
     """Test behavior when only some commands succeed."""
 
-    @pytest.mark.asyncio
     async def test_succeeds_with_only_stats_core(
-        self, configured_env, async_context_manager_factory
+        self, configured_env, collect_companion_module, mc_and_ctx
     ):
         """Should succeed if only stats_core returns metrics."""
-        module = load_collect_companion()
+        module = collect_companion_module
         collected_metrics = {}
 
         async def mock_run_command(mc, coro, name):
@@ -349,9 +307,7 @@ class TestPartialSuccessScenarios:
             collected_metrics.update(metrics)
             return len(metrics)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -364,12 +320,11 @@ class TestPartialSuccessScenarios:
         assert exit_code == 0
         assert collected_metrics["battery_mv"] == 3850
 
-    @pytest.mark.asyncio
     async def test_succeeds_with_only_contacts(
-        self, configured_env, async_context_manager_factory
+        self, configured_env, collect_companion_module, mc_and_ctx
     ):
         """Should succeed if only contacts command returns data."""
-        module = load_collect_companion()
+        module = collect_companion_module
         collected_metrics = {}
 
         async def mock_run_command(mc, coro, name):
@@ -385,9 +340,7 @@ class TestPartialSuccessScenarios:
             collected_metrics.update(metrics)
             return len(metrics)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -399,12 +352,11 @@ class TestPartialSuccessScenarios:
         assert exit_code == 0
         assert collected_metrics["contacts"] == 2
 
-    @pytest.mark.asyncio
     async def test_fails_when_metrics_empty_despite_success(
-        self, configured_env, async_context_manager_factory
+        self, configured_env, collect_companion_module, mc_and_ctx
     ):
         """Should fail if commands succeed but no metrics collected."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         async def mock_run_command(mc, coro, name):
             # Commands succeed but return empty/non-dict payloads
@@ -418,9 +370,7 @@ class TestPartialSuccessScenarios:
                 return (False, None, None, "Failed")  # Fails
             return (True, "OK", {}, None)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -435,12 +385,11 @@ class TestPartialSuccessScenarios:
 class TestExceptionHandling:
     """Test exception handling in the command loop (lines 165-166)."""
 
-    @pytest.mark.asyncio
     async def test_handles_exception_in_command_loop(
-        self, configured_env, async_context_manager_factory
+        self, configured_env, collect_companion_module, mc_and_ctx
     ):
         """Should catch and log exceptions during command execution."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         call_count = 0
 
@@ -451,9 +400,7 @@ class TestExceptionHandling:
                 raise RuntimeError("Unexpected network error")
             return (True, "OK", {}, None)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -463,25 +410,24 @@ class TestExceptionHandling:
             exit_code = await module.collect_companion()
 
         # Should have logged the error
-        error_calls = [c for c in mock_log.error.call_args_list if "Error during collection" in str(c)]
+        error_calls = [
+            c for c in mock_log.error.call_args_list if "Error during collection" in str(c)
+        ]
         assert len(error_calls) > 0
 
         # Should return 1 because exception interrupted collection
         assert exit_code == 1
 
-    @pytest.mark.asyncio
     async def test_exception_closes_connection_properly(
-        self, configured_env, async_context_manager_factory
+        self, configured_env, collect_companion_module, mc_and_ctx
     ):
         """Context manager should still exit properly after exception."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         async def mock_run_command_raise(mc, coro, name):
             raise RuntimeError("Connection lost")
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -496,9 +442,9 @@ class TestExceptionHandling:
 class TestMainEntryPoint:
     """Test the main() entry point behavior."""
 
-    def test_main_calls_init_db(self, configured_env):
+    def test_main_calls_init_db(self, configured_env, collect_companion_module):
         """main() should initialize database before collection."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         with (
             patch.object(module, "init_db") as mock_init,
@@ -512,9 +458,9 @@ class TestMainEntryPoint:
 
             mock_init.assert_called_once()
 
-    def test_main_exits_with_collection_result(self, configured_env):
+    def test_main_exits_with_collection_result(self, configured_env, collect_companion_module):
         """main() should exit with the collection exit code."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         with (
             patch.object(module, "init_db"),
@@ -528,9 +474,9 @@ class TestMainEntryPoint:
 
             mock_sys.exit.assert_called_once_with(1)
 
-    def test_main_runs_collect_companion_async(self, configured_env):
+    def test_main_runs_collect_companion_async(self, configured_env, collect_companion_module):
         """main() should run collect_companion() with asyncio.run()."""
-        module = load_collect_companion()
+        module = collect_companion_module
 
         with (
             patch.object(module, "init_db"),
@@ -549,14 +495,18 @@ class TestMainEntryPoint:
 class TestDatabaseIntegration:
     """Test that collection actually writes to database."""
 
-    @pytest.mark.asyncio
     async def test_writes_metrics_to_database(
-        self, configured_env, initialized_db, async_context_manager_factory, mock_run_command_factory
+        self,
+        configured_env,
+        collect_companion_module,
+        initialized_db,
+        mc_and_ctx,
+        mock_run_command_factory,
     ):
         """Collection should write metrics to database."""
         from meshmon.db import get_latest_metrics
 
-        module = load_collect_companion()
+        module = collect_companion_module
 
         responses = {
             "send_appstart": (True, "SELF_INFO", {}, None),
@@ -575,15 +525,11 @@ class TestDatabaseIntegration:
             "get_stats_packets": (True, "STATS_PACKETS", {"recv": 999, "sent": 888}, None),
         }
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(
-                module, "run_command", side_effect=mock_run_command_factory(responses)
-            ),
+            patch.object(module, "run_command", side_effect=mock_run_command_factory(responses)),
         ):
             exit_code = await module.collect_companion()
 
@@ -596,19 +542,15 @@ class TestDatabaseIntegration:
         assert latest["recv"] == 999
         assert latest["sent"] == 888
 
-    @pytest.mark.asyncio
     async def test_writes_telemetry_to_database_when_enabled(
-        self, configured_env, initialized_db, async_context_manager_factory, monkeypatch
+        self, configured_env, collect_companion_module, initialized_db, mc_and_ctx, env_override
     ):
         """Telemetry should be written to database when enabled."""
-        monkeypatch.setenv("TELEMETRY_ENABLED", "1")
-        import meshmon.env
-
-        meshmon.env._config = None
+        env_override(TELEMETRY_ENABLED="1")
 
         from meshmon.db import get_latest_metrics
 
-        module = load_collect_companion()
+        module = collect_companion_module
 
         # LPP data format: list of dictionaries with type, channel, value
         lpp_data = [
@@ -622,9 +564,7 @@ class TestDatabaseIntegration:
                 return (True, "STATS_CORE", {"battery_mv": 3850}, None)
             return (True, "OK", {}, None)
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
+        mc, ctx_mock = mc_and_ctx
 
         with (
             patch.object(module, "connect_with_lock", return_value=ctx_mock),
@@ -8,24 +8,42 @@ These tests verify the actual script behavior, including:
 """
 
 import inspect
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from tests.scripts.conftest import load_script_module
+from meshmon.retry import CircuitBreaker
 
+# Successful run_command result; the read-only payload makes it safe to share.
+_RUN_OK = (True, "OK", MappingProxyType({}), None)
 
-def load_collect_repeater():
-    """Load collect_repeater.py as a module."""
-    return load_script_module("collect_repeater.py")
+
+def make_login_failing_run_command():
+    """Build a run_command stand-in that raises on send_login.
+
+    Every other command succeeds.
+
+    Returns:
+        (run_command coroutine function, call counter dict with key "n")
+    """
+    calls = {"n": 0}
+
+    async def _run(mc, coro, name):
+        calls["n"] += 1
+        if name == "send_login":
+            raise Exception("Login not supported")
+        return _RUN_OK
+
+    return _run, calls
 
 
 class TestCollectRepeaterImport:
     """Verify script can be imported without errors."""
 
-    def test_imports_successfully(self, configured_env):
+    def test_imports_successfully(self, configured_env, collect_repeater_module):
         """Script should import without errors."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
         assert hasattr(module, "main")
         assert hasattr(module, "collect_repeater")
@@ -33,136 +51,117 @@ class TestCollectRepeaterImport:
         assert hasattr(module, "query_repeater_with_retry")
         assert callable(module.main)
 
-    def test_collect_repeater_is_async(self, configured_env):
+    def test_collect_repeater_is_async(self, configured_env, collect_repeater_module):
         """collect_repeater() should be an async function."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
         assert inspect.iscoroutinefunction(module.collect_repeater)
 
-    def test_find_repeater_contact_is_async(self, configured_env):
+    def test_find_repeater_contact_is_async(self, configured_env, collect_repeater_module):
         """find_repeater_contact() should be an async function."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
         assert inspect.iscoroutinefunction(module.find_repeater_contact)
 
 
 class TestFindRepeaterContact:
     """Test the find_repeater_contact function."""
 
-    @pytest.mark.asyncio
-    async def test_finds_contact_by_name(self, configured_env, monkeypatch):
-        """Should find repeater by advertised name."""
-        monkeypatch.setenv("REPEATER_NAME", "MyRepeater")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        mc.contacts = {"abc123": {"adv_name": "MyRepeater", "public_key": "abc123"}}
-
-        with (
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "get_contact_by_name") as mock_get,
-        ):
-            mock_run.return_value = (True, "CONTACTS", mc.contacts, None)
-            mock_get.return_value = mc.contacts["abc123"]
-
-            contact = await module.find_repeater_contact(mc)
-
-            assert contact is not None
-            assert contact["adv_name"] == "MyRepeater"
-            mock_get.assert_called_once_with(mc, "MyRepeater")
-
-    @pytest.mark.asyncio
-    async def test_finds_contact_by_key_prefix(self, configured_env, monkeypatch):
-        """Should find repeater by public key prefix when name not set."""
-        monkeypatch.setenv("REPEATER_KEY_PREFIX", "abc123")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        mc.contacts = {"abc123def456": {"adv_name": "SomeNode", "public_key": "abc123def456"}}
-
-        with (
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "get_contact_by_name", return_value=None),
-            patch.object(module, "get_contact_by_key_prefix") as mock_get,
-        ):
-            mock_run.return_value = (True, "CONTACTS", mc.contacts, None)
-            mock_get.return_value = mc.contacts["abc123def456"]
-
-            contact = await module.find_repeater_contact(mc)
-
-            assert contact is not None
-            assert contact["public_key"] == "abc123def456"
-            mock_get.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_fallback_to_manual_name_search(self, configured_env, monkeypatch):
-        """Should fallback to manual name search in payload dict."""
-        monkeypatch.setenv("REPEATER_NAME", "ManualFind")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        contacts_dict = {"xyz789": {"adv_name": "ManualFind", "public_key": "xyz789"}}
-
-        with (
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "get_contact_by_name", return_value=None),
-        ):
-            mock_run.return_value = (True, "CONTACTS", contacts_dict, None)
-            # get_contact_by_name returns None, forcing manual search
-            contact = await module.find_repeater_contact(mc)
-
-            assert contact is not None
-            assert contact["adv_name"] == "ManualFind"
-
-    @pytest.mark.asyncio
-    async def test_case_insensitive_name_match(self, configured_env, monkeypatch):
-        """Name search should be case-insensitive."""
-        monkeypatch.setenv("REPEATER_NAME", "myrepeater")  # lowercase
-        import meshmon.env
+    @pytest.mark.parametrize(
+        ("env_vars", "contacts", "name_hit", "prefix_hit", "expected_key"),
+        [
+            pytest.param(
+                {"REPEATER_NAME": "MyRepeater"},
+                {"abc123": {"adv_name": "MyRepeater", "public_key": "abc123"}},
+                "abc123",
+                None,
+                "abc123",
+                id="by_name",
+            ),
+            pytest.param(
+                {"REPEATER_KEY_PREFIX": "abc123"},
+                {"abc123def456": {"adv_name": "SomeNode", "public_key": "abc123def456"}},
+                None,
+                "abc123def456",
+                "abc123def456",
+                id="by_key_prefix",
+            ),
+            pytest.param(
+                {"REPEATER_NAME": "ManualFind"},
+                {"xyz789": {"adv_name": "ManualFind", "public_key": "xyz789"}},
+                None,
+                None,
+                "xyz789",
+                id="manual_name_search",
+            ),
+            pytest.param(
+                {"REPEATER_NAME": "myrepeater"},
+                {"key1": {"adv_name": "MyRepeater", "public_key": "key1"}},
+                None,
+                None,
+                "key1",
+                id="case_insensitive_name",
+            ),
+            pytest.param(
+                {"REPEATER_KEY_PREFIX": "abc"},
+                {"abc123xyz": {"adv_name": "KeyPrefixNode"}},
+                None,
+                None,
+                "abc123xyz",
+                id="manual_key_prefix_search",
+            ),
+        ],
+    )
+    async def test_finds_contact(
+        self,
+        configured_env,
+        collect_repeater_module,
+        env_override,
+        mc_and_ctx,
+        env_vars,
+        contacts,
+        name_hit,
+        prefix_hit,
+        expected_key,
+    ):
+        """Should find the repeater via the helpers or by scanning the contacts payload.
 
-        meshmon.env._config = None
+        ``name_hit``/``prefix_hit`` name the contact key returned by
+        get_contact_by_name/get_contact_by_key_prefix; None forces the manual
+        search over the get_contacts payload.
+        """
+        env_override(**env_vars)
 
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        contacts_dict = {"key1": {"adv_name": "MyRepeater", "public_key": "key1"}}  # Mixed case
+        mc, _ = mc_and_ctx
 
         with (
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "get_contact_by_name", return_value=None),
+            patch.object(module, "run_command", return_value=(True, "CONTACTS", contacts, None)),
+            patch.object(
+                module, "get_contact_by_name", return_value=contacts.get(name_hit)
+            ) as mock_by_name,
+            patch.object(
+                module, "get_contact_by_key_prefix", return_value=contacts.get(prefix_hit)
+            ) as mock_by_prefix,
         ):
-            mock_run.return_value = (True, "CONTACTS", contacts_dict, None)
             contact = await module.find_repeater_contact(mc)
 
-            assert contact is not None
-            assert contact["adv_name"] == "MyRepeater"
+        assert contact is contacts[expected_key]
+        if "REPEATER_NAME" in env_vars:
+            mock_by_name.assert_called_once_with(mc, env_vars["REPEATER_NAME"])
+        if name_hit is None and "REPEATER_KEY_PREFIX" in env_vars:
+            mock_by_prefix.assert_called_once_with(mc, env_vars["REPEATER_KEY_PREFIX"])
+        else:
+            mock_by_prefix.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_returns_none_when_not_found(self, configured_env, monkeypatch):
+    async def test_returns_none_when_not_found(
+        self, configured_env, collect_repeater_module, monkeypatch, mc_and_ctx
+    ):
         """Should return None when repeater not in contacts."""
         monkeypatch.setenv("REPEATER_NAME", "NonExistent")
-        import meshmon.env
-
-        meshmon.env._config = None
 
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
+        mc, _ = mc_and_ctx
 
         with (
             patch.object(module, "run_command") as mock_run,
@@ -173,18 +172,15 @@ class TestFindRepeaterContact:
 
             assert contact is None
 
-    @pytest.mark.asyncio
-    async def test_returns_none_when_get_contacts_fails(self, configured_env, monkeypatch):
+    async def test_returns_none_when_get_contacts_fails(
+        self, configured_env, collect_repeater_module, monkeypatch, mc_and_ctx
+    ):
         """Should return None when get_contacts command fails."""
         monkeypatch.setenv("REPEATER_NAME", "AnyName")
-        import meshmon.env
-
-        meshmon.env._config = None
 
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
+        mc, _ = mc_and_ctx
 
         with patch.object(module, "run_command") as mock_run:
             mock_run.return_value = (False, None, None, "Connection failed")
@@ -194,16 +190,18 @@ class TestFindRepeaterContact:
             assert contact is None
 
 
+@pytest.mark.timeout(5)
 class TestCircuitBreakerIntegration:
     """Test circuit breaker integration in collect_repeater."""
 
-    @pytest.mark.asyncio
-    async def test_skips_collection_when_circuit_open(self, configured_env):
+    async def test_skips_collection_when_circuit_open(
+        self, configured_env, collect_repeater_module
+    ):
         """Should return 0 and skip collection when circuit breaker is open."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
         # Create mock circuit breaker that is open
-        mock_cb = MagicMock()
+        mock_cb = Mock(spec=CircuitBreaker)
         mock_cb.is_open.return_value = True
         mock_cb.cooldown_remaining.return_value = 1800
 
@@ -219,71 +217,66 @@ class TestCircuitBreakerIntegration:
             mock_cb.is_open.assert_called_once()
             mock_connect.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_records_success_on_successful_status(
-        self, configured_env, monkeypatch, async_context_manager_factory
+        self, configured_env, collect_repeater_module, monkeypatch, collect_repeater_mocks
     ):
         """Should record success when status query succeeds."""
         monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
 
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-            patch.object(module, "insert_metrics", return_value=2),
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (True, {"bat": 3850, "uptime": 86400}, None)
+        module = collect_repeater_module
+
+        mock_cb = collect_repeater_mocks.cb
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+            insert_metrics=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["insert_metrics"].return_value = 2
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (
+                True,
+                {"bat": 3850, "uptime": 86400},
+                None,
+            )
 
             await module.collect_repeater()
 
             mock_cb.record_success.assert_called_once()
             mock_cb.record_failure.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_records_failure_on_status_timeout(
-        self, configured_env, monkeypatch, async_context_manager_factory
+        self, configured_env, collect_repeater_module, monkeypatch, collect_repeater_mocks
     ):
         """Should record failure when status query times out."""
         monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        import meshmon.env
 
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (False, None, "Timeout")
+        module = collect_repeater_module
+
+        mock_cb = collect_repeater_mocks.cb
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (False, None, "Timeout")
 
             exit_code = await module.collect_repeater()
 
@@ -292,114 +285,87 @@ class TestCircuitBreakerIntegration:
             assert exit_code == 1
 
 
+@pytest.mark.timeout(5)
 class TestCollectRepeaterExitCodes:
     """Test exit code behavior - critical for monitoring."""
 
-    @pytest.mark.asyncio
-    async def test_returns_zero_on_successful_collection(
-        self, configured_env, monkeypatch, async_context_manager_factory
+    @pytest.mark.parametrize(
+        ("env_name", "connected", "find_return", "expected_exit", "expected_metrics"),
+        [
+            pytest.param(
+                "TestRepeater",
+                True,
+                {"adv_name": "TestRepeater"},
+                0,
+                {"bat": 3850, "uptime": 86400, "nb_recv": 100},
+                id="success",
+            ),
+            pytest.param(None, False, None, 1, None, id="connection_failure"),
+            pytest.param("NonExistent", True, None, 1, None, id="repeater_not_found"),
+        ],
+    )
+    async def test_exit_code(
+        self,
+        configured_env,
+        collect_repeater_module,
+        collect_repeater_mocks,
+        monkeypatch,
+        async_context_manager_factory,
+        env_name,
+        connected,
+        find_return,
+        expected_exit,
+        expected_metrics,
     ):
-        """Successful collection should return exit code 0."""
-        monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-            patch.object(module, "insert_metrics") as mock_insert,
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (
+        """Exit code is 0 only when status metrics were collected and stored."""
+        if env_name is not None:
+            monkeypatch.setenv("REPEATER_NAME", env_name)
+
+        module = collect_repeater_module
+        mocks = collect_repeater_mocks
+        # A failed connection yields None from connect_with_lock
+        ctx_mock = mocks.ctx if connected else async_context_manager_factory(None)
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+            insert_metrics=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mocks.cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = find_return
+            patched["query_repeater_with_retry"].return_value = (
                 True,
                 {"bat": 3850, "uptime": 86400, "nb_recv": 100},
                 None,
             )
-
             exit_code = await module.collect_repeater()
 
-        assert exit_code == 0
-        mock_insert.assert_called_once()
-        insert_kwargs = mock_insert.call_args.kwargs
-        assert insert_kwargs["role"] == "repeater"
-        assert insert_kwargs["metrics"]["bat"] == 3850
-        assert insert_kwargs["metrics"]["nb_recv"] == 100
-
-    @pytest.mark.asyncio
-    async def test_returns_one_on_connection_failure(
-        self, configured_env, async_context_manager_factory
-    ):
-        """Failed connection should return exit code 1."""
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-        ctx_mock = async_context_manager_factory(None)  # Connection returns None
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-        ):
-            exit_code = await module.collect_repeater()
-
-        assert exit_code == 1
-
-    @pytest.mark.asyncio
-    async def test_returns_one_when_repeater_not_found(
-        self, configured_env, monkeypatch, async_context_manager_factory
-    ):
-        """Should return 1 when repeater contact not found."""
-        monkeypatch.setenv("REPEATER_NAME", "NonExistent")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = None  # Not found
-
-            exit_code = await module.collect_repeater()
-
-        assert exit_code == 1
+        assert exit_code == expected_exit
+        if expected_metrics is None:
+            patched["insert_metrics"].assert_not_called()
+        else:
+            patched["insert_metrics"].assert_called_once()
+            insert_kwargs = patched["insert_metrics"].call_args.kwargs
+            assert insert_kwargs["role"] == "repeater"
+            assert insert_kwargs["metrics"] == expected_metrics
 
 
 class TestQueryRepeaterWithRetry:
     """Test the retry wrapper for repeater queries."""
 
-    @pytest.mark.asyncio
-    async def test_returns_success_on_first_try(self, configured_env):
+    async def test_returns_success_on_first_try(
+        self, configured_env, collect_repeater_module, mc_and_ctx
+    ):
         """Should return success when command succeeds immediately."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
-        mc = MagicMock()
+        mc, _ = mc_and_ctx
         contact = {"adv_name": "Test"}
 
         async def successful_command():
@@ -416,12 +382,13 @@ class TestQueryRepeaterWithRetry:
             assert payload == {"bat": 3850}
             assert err is None
 
-    @pytest.mark.asyncio
-    async def test_returns_failure_after_retries_exhausted(self, configured_env):
+    async def test_returns_failure_after_retries_exhausted(
+        self, configured_env, collect_repeater_module, mc_and_ctx
+    ):
         """Should return failure when all retries fail."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
-        mc = MagicMock()
+        mc, _ = mc_and_ctx
         contact = {"adv_name": "Test"}
 
         async def failing_command():
@@ -442,73 +409,72 @@ class TestQueryRepeaterWithRetry:
 class TestMainEntryPoint:
     """Test the main() entry point behavior."""
 
-    def test_main_calls_init_db(self, configured_env):
+    def test_main_calls_init_db(self, configured_env, collect_repeater_module):
         """main() should initialize database before collection."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
         with (
             patch.object(module, "init_db") as mock_init,
             patch.object(module, "collect_repeater", new=MagicMock(return_value=0)),
-            patch.object(module, "asyncio") as mock_asyncio,
+            patch.object(module.asyncio, "run", return_value=0),
             patch.object(module, "sys"),
         ):
             # Patch collect_repeater to return a non-coroutine to avoid unawaited coroutine warning
-            mock_asyncio.run.return_value = 0
             module.main()
 
             mock_init.assert_called_once()
 
-    def test_main_exits_with_collection_result(self, configured_env):
+    def test_main_exits_with_collection_result(self, configured_env, collect_repeater_module):
         """main() should exit with the collection exit code."""
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
         with (
             patch.object(module, "init_db"),
             patch.object(module, "collect_repeater", new=MagicMock(return_value=1)),
-            patch.object(module, "asyncio") as mock_asyncio,
+            patch.object(module.asyncio, "run", return_value=1),  # Collection failed
             patch.object(module, "sys") as mock_sys,
         ):
             # Patch collect_repeater to return a non-coroutine to avoid unawaited coroutine warning
-            mock_asyncio.run.return_value = 1  # Collection failed
             module.main()
 
             mock_sys.exit.assert_called_once_with(1)
 
 
+@pytest.mark.timeout(5)
 class TestDatabaseIntegration:
     """Test that collection actually writes to database."""
 
-    @pytest.mark.asyncio
     async def test_writes_metrics_to_database(
-        self, configured_env, initialized_db, monkeypatch, async_context_manager_factory
+        self,
+        configured_env,
+        collect_repeater_module,
+        initialized_db,
+        monkeypatch,
+        collect_repeater_mocks,
     ):
         """Collection should write metrics to database."""
         from meshmon.db import get_latest_metrics
 
         monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
 
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (
+        module = collect_repeater_module
+
+        mock_cb = collect_repeater_mocks.cb
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (
                 True,
                 {"bat": 3777, "uptime": 99999, "nb_recv": 1234, "nb_sent": 567},
                 None,
@@ -528,71 +494,15 @@ class TestDatabaseIntegration:
 class TestFindRepeaterContactEdgeCases:
     """Test edge cases in find_repeater_contact."""
 
-    @pytest.mark.asyncio
-    async def test_finds_contact_in_payload_dict(self, configured_env, monkeypatch):
-        """Should find contact in payload dict when mc.contacts is empty."""
-        monkeypatch.setenv("REPEATER_NAME", "PayloadRepeater")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        mc.contacts = {}  # Empty contacts attribute
-        payload_dict = {"pk123": {"adv_name": "PayloadRepeater", "public_key": "pk123"}}
-
-        with (
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "get_contact_by_name", return_value=None),
-        ):
-            # Return contacts in payload
-            mock_run.return_value = (True, "CONTACTS", payload_dict, None)
-            # get_contact_by_name returns None, forcing manual search in payload
-            contact = await module.find_repeater_contact(mc)
-
-            assert contact is not None
-            assert contact["adv_name"] == "PayloadRepeater"
-
-    @pytest.mark.asyncio
-    async def test_finds_contact_by_key_prefix_manual_search(self, configured_env, monkeypatch):
-        """Should find contact by key prefix via manual search in payload."""
-        monkeypatch.setenv("REPEATER_KEY_PREFIX", "abc")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        contacts_dict = {"abc123xyz": {"adv_name": "KeyPrefixNode"}}
-
-        with (
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "get_contact_by_name", return_value=None),
-            patch.object(module, "get_contact_by_key_prefix", return_value=None),
-        ):
-            mock_run.return_value = (True, "CONTACTS", contacts_dict, None)
-            # Both helper functions return None, forcing manual search
-            contact = await module.find_repeater_contact(mc)
-
-            assert contact is not None
-            assert contact["adv_name"] == "KeyPrefixNode"
-
-    @pytest.mark.asyncio
-    async def test_prints_available_contacts_when_not_found(self, configured_env, monkeypatch):
+    async def test_prints_available_contacts_when_not_found(
+        self, configured_env, collect_repeater_module, monkeypatch, mc_and_ctx
+    ):
         """Should print available contacts when repeater not found."""
         monkeypatch.setenv("REPEATER_NAME", "NonExistent")
-        import meshmon.env
-
-        meshmon.env._config = None
 
-        module = load_collect_repeater()
+        module = collect_repeater_module
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
+        mc, _ = mc_and_ctx
         contacts_dict = {
             "key1": {"adv_name": "Node1", "name": "alt1"},
             "key2": {"adv_name": "Node2"},
@@ -612,267 +522,238 @@ class TestFindRepeaterContactEdgeCases:
             mock_log.info.assert_called()
 
 
+@pytest.mark.timeout(5)
 class TestLoginFunctionality:
     """Test optional login functionality."""
 
-    @pytest.mark.asyncio
     async def test_attempts_login_when_password_set(
-        self, configured_env, monkeypatch, async_context_manager_factory
+        self, configured_env, collect_repeater_module, env_override, collect_repeater_mocks
     ):
         """Should attempt login when REPEATER_PASSWORD is set."""
-        monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        monkeypatch.setenv("REPEATER_PASSWORD", "secret123")
-        import meshmon.env
+        env_override(REPEATER_NAME="TestRepeater", REPEATER_PASSWORD="secret123")
 
-        meshmon.env._config = None
+        module = collect_repeater_module
 
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
+        mock_cb = collect_repeater_mocks.cb
+        mc = collect_repeater_mocks.mc
         mc.commands.send_login = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "extract_contact_info") as mock_extract,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-            patch.object(module, "insert_metrics", return_value=1),
-        ):
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            extract_contact_info=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+            insert_metrics=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["insert_metrics"].return_value = 1
             # Return success for all commands
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_extract.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (True, {"bat": 3850}, None)
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["extract_contact_info"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (True, {"bat": 3850}, None)
 
             await module.collect_repeater()
 
             # Verify login was attempted (run_command called with send_login)
-            login_calls = [c for c in mock_run.call_args_list if c[0][2] == "send_login"]
+            login_calls = [
+                c for c in patched["run_command"].call_args_list if c[0][2] == "send_login"
+            ]
             assert len(login_calls) == 1
 
-    @pytest.mark.asyncio
     async def test_handles_login_exception(
-        self, configured_env, monkeypatch, async_context_manager_factory
+        self, configured_env, collect_repeater_module, env_override, collect_repeater_mocks
     ):
         """Should handle exception during login gracefully."""
-        monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        monkeypatch.setenv("REPEATER_PASSWORD", "secret123")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
+        env_override(REPEATER_NAME="TestRepeater", REPEATER_PASSWORD="secret123")
 
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
+        module = collect_repeater_module
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
+        mock_cb = collect_repeater_mocks.cb
+        mc = collect_repeater_mocks.mc
         mc.commands.send_login = MagicMock(side_effect=Exception("Login not supported"))
-        ctx_mock = async_context_manager_factory(mc)
-
-        call_count = 0
-
-        async def mock_run_command(mc, coro, name):
-            nonlocal call_count
-            call_count += 1
-            if name == "send_login":
-                raise Exception("Login not supported")
-            return (True, "OK", {}, None)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command", side_effect=mock_run_command),
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "extract_contact_info") as mock_extract,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-            patch.object(module, "insert_metrics", return_value=1),
-        ):
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_extract.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (True, {"bat": 3850}, None)
+        ctx_mock = collect_repeater_mocks.ctx
+
+        mock_run_command, run_calls = make_login_failing_run_command()
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            extract_contact_info=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+            insert_metrics=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["run_command"].side_effect = mock_run_command
+            patched["insert_metrics"].return_value = 1
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["extract_contact_info"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (True, {"bat": 3850}, None)
 
             # Should not raise - login failure should be handled
             exit_code = await module.collect_repeater()
             assert exit_code == 0
+            assert run_calls["n"] > 0
 
 
+@pytest.mark.timeout(5)
 class TestTelemetryCollection:
     """Test telemetry collection when enabled."""
 
-    @pytest.mark.asyncio
     async def test_collects_telemetry_when_enabled(
-        self, configured_env, monkeypatch, initialized_db, async_context_manager_factory
+        self,
+        configured_env,
+        collect_repeater_module,
+        env_override,
+        initialized_db,
+        collect_repeater_mocks,
     ):
         """Should collect telemetry when TELEMETRY_ENABLED=1."""
-        monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        monkeypatch.setenv("TELEMETRY_ENABLED", "1")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "extract_contact_info") as mock_extract,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-            patch.object(
-                module,
-                "with_retries",
-                new=AsyncMock(return_value=(True, {"lpp": b"\x00\x67\x01\x00"}, None)),
-            ),
-            patch.object(module, "extract_lpp_from_payload") as mock_lpp,
-            patch.object(module, "extract_telemetry_metrics") as mock_telem,
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_extract.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (True, {"bat": 3850}, None)
-            mock_lpp.return_value = {"temperature": [(0, 25.5)]}
-            mock_telem.return_value = {"telemetry.temperature.0": 25.5}
+        # initialized_db already built the config; env_override drops it
+        env_override(REPEATER_NAME="TestRepeater", TELEMETRY_ENABLED="1")
+
+        module = collect_repeater_module
+
+        mock_cb = collect_repeater_mocks.cb
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            extract_contact_info=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+            with_retries=AsyncMock(return_value=(True, {"lpp": b"\x00\x67\x01\x00"}, None)),
+            extract_lpp_from_payload=DEFAULT,
+            extract_telemetry_metrics=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["extract_contact_info"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (True, {"bat": 3850}, None)
+            patched["extract_lpp_from_payload"].return_value = {"temperature": [(0, 25.5)]}
+            patched["extract_telemetry_metrics"].return_value = {"telemetry.temperature.0": 25.5}
 
             exit_code = await module.collect_repeater()
 
             assert exit_code == 0
             # Verify telemetry was processed
-            mock_lpp.assert_called_once()
-            mock_telem.assert_called_once()
+            patched["extract_lpp_from_payload"].assert_called_once()
+            patched["extract_telemetry_metrics"].assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_handles_telemetry_failure_gracefully(
-        self, configured_env, monkeypatch, async_context_manager_factory
+        self, configured_env, collect_repeater_module, env_override, collect_repeater_mocks
     ):
         """Should continue when telemetry collection fails."""
-        monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        monkeypatch.setenv("TELEMETRY_ENABLED", "1")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "extract_contact_info") as mock_extract,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-            patch.object(module, "insert_metrics", return_value=1),
-            patch.object(
-                module,
-                "with_retries",
-                new=AsyncMock(return_value=(False, None, Exception("Timeout"))),
-            ),
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_extract.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (True, {"bat": 3850}, None)
+        env_override(REPEATER_NAME="TestRepeater", TELEMETRY_ENABLED="1")
+
+        module = collect_repeater_module
+
+        mock_cb = collect_repeater_mocks.cb
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            extract_contact_info=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+            insert_metrics=DEFAULT,
+            with_retries=AsyncMock(return_value=(False, None, Exception("Timeout"))),
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["insert_metrics"].return_value = 1
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["extract_contact_info"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (True, {"bat": 3850}, None)
 
             # Should still succeed (status metrics were saved)
             exit_code = await module.collect_repeater()
             assert exit_code == 0
 
 
+@pytest.mark.timeout(5)
 class TestDatabaseErrorHandling:
     """Test database error handling."""
 
-    @pytest.mark.asyncio
     async def test_returns_one_on_status_db_error(
-        self, configured_env, monkeypatch, async_context_manager_factory
+        self, configured_env, collect_repeater_module, monkeypatch, collect_repeater_mocks
     ):
         """Should return 1 when status metrics DB write fails."""
         monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
-
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
 
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "extract_contact_info") as mock_extract,
-            patch.object(module, "query_repeater_with_retry") as mock_query,
-            patch.object(module, "insert_metrics", side_effect=Exception("DB error")),
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_extract.return_value = {"adv_name": "TestRepeater"}
-            mock_query.return_value = (True, {"bat": 3850}, None)
+        module = collect_repeater_module
+
+        mock_cb = collect_repeater_mocks.cb
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            extract_contact_info=DEFAULT,
+            query_repeater_with_retry=DEFAULT,
+            insert_metrics=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["insert_metrics"].side_effect = Exception("DB error")
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["extract_contact_info"].return_value = {"adv_name": "TestRepeater"}
+            patched["query_repeater_with_retry"].return_value = (True, {"bat": 3850}, None)
 
             exit_code = await module.collect_repeater()
             assert exit_code == 1
 
 
+@pytest.mark.timeout(5)
 class TestExceptionHandling:
     """Test general exception handling."""
 
-    @pytest.mark.asyncio
     async def test_records_failure_on_exception(
-        self, configured_env, monkeypatch, async_context_manager_factory
+        self, configured_env, collect_repeater_module, monkeypatch, collect_repeater_mocks
     ):
         """Should record circuit breaker failure on unexpected exception."""
         monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_collect_repeater()
 
-        mock_cb = MagicMock()
-        mock_cb.is_open.return_value = False
-
-        mc = MagicMock()
-        mc.commands = MagicMock()
-        ctx_mock = async_context_manager_factory(mc)
-
-        with (
-            patch.object(module, "get_repeater_circuit_breaker", return_value=mock_cb),
-            patch.object(module, "connect_with_lock", return_value=ctx_mock),
-            patch.object(module, "run_command") as mock_run,
-            patch.object(module, "find_repeater_contact") as mock_find,
-            patch.object(module, "extract_contact_info") as mock_extract,
-        ):
-            mock_run.return_value = (True, "OK", {}, None)
-            mock_find.return_value = {"adv_name": "TestRepeater"}
-            mock_extract.side_effect = Exception("Unexpected error")
+        module = collect_repeater_module
+
+        mock_cb = collect_repeater_mocks.cb
+        ctx_mock = collect_repeater_mocks.ctx
+
+        with patch.multiple(
+            module,
+            get_repeater_circuit_breaker=DEFAULT,
+            connect_with_lock=DEFAULT,
+            run_command=DEFAULT,
+            find_repeater_contact=DEFAULT,
+            extract_contact_info=DEFAULT,
+        ) as patched:
+            patched["get_repeater_circuit_breaker"].return_value = mock_cb
+            patched["connect_with_lock"].return_value = ctx_mock
+            patched["run_command"].return_value = _RUN_OK
+            patched["find_repeater_contact"].return_value = {"adv_name": "TestRepeater"}
+            patched["extract_contact_info"].side_effect = Exception("Unexpected error")
 
             await module.collect_repeater()
 
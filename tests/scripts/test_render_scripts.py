@@ -6,29 +6,59 @@ scripts can be imported and their main() functions work correctly.
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
 
-from tests.scripts.conftest import load_script_module
+_MONTHLY_JSON = {"period": "2024-12", "metrics": {"bat": {"avg": 3850}}}
 
 
-def load_script(script_name: str):
-    """Load a script as a module."""
-    return load_script_module(script_name)
+def _repeater_periods_2024(role):
+    """get_available_periods stand-in: two repeater months in 2024."""
+    return [(2024, 11), (2024, 12)] if role == "repeater" else []
+
+
+def _repeater_periods_spanning_years(role):
+    """get_available_periods stand-in: repeater months across 2024 and 2025."""
+    return [(2024, 11), (2024, 12), (2025, 1)] if role == "repeater" else []
+
+
+# Stand-ins for report renderers whose calls the tests never inspect
+def _html(*args, **kwargs):
+    return "<html>"
+
+
+def _txt(*args, **kwargs):
+    return "TXT"
+
+
+def _empty_json(*args, **kwargs):
+    return {}
+
+
+def _capture_writes():
+    """safe_write stand-in that records content by path instead of writing it."""
+    writes: dict[Path, str] = {}
+
+    def capture(path, content):
+        writes[path] = content
+        return True
+
+    return writes, capture
 
 
 class TestRenderChartsImport:
     """Verify render_charts.py imports correctly."""
 
-    def test_imports_successfully(self, configured_env):
+    def test_imports_successfully(self, render_charts_module, configured_env):
         """Script should import without errors."""
-        module = load_script("render_charts.py")
+        module = render_charts_module
 
         assert hasattr(module, "main")
         assert callable(module.main)
 
-    def test_main_calls_init_db(self, configured_env):
+    def test_main_calls_init_db(self, render_charts_module, configured_env):
         """main() should initialize database."""
-        module = load_script("render_charts.py")
+        module = render_charts_module
 
         with (
             patch.object(module, "init_db") as mock_init,
@@ -38,9 +68,9 @@ class TestRenderChartsImport:
 
             mock_init.assert_called_once()
 
-    def test_main_checks_metric_counts(self, configured_env):
+    def test_main_checks_metric_counts(self, render_charts_module, configured_env):
         """main() should check for data before rendering."""
-        module = load_script("render_charts.py")
+        module = render_charts_module
 
         with (
             patch.object(module, "init_db"),
@@ -56,9 +86,9 @@ class TestRenderChartsImport:
                 "repeater",
             ]
 
-    def test_main_renders_when_data_exists(self, configured_env):
+    def test_main_renders_when_data_exists(self, render_charts_module, configured_env):
         """main() should render charts when data exists."""
-        module = load_script("render_charts.py")
+        module = render_charts_module
 
         with (
             patch.object(module, "init_db"),
@@ -83,16 +113,16 @@ class TestRenderChartsImport:
 class TestRenderSiteImport:
     """Verify render_site.py imports correctly."""
 
-    def test_imports_successfully(self, configured_env):
+    def test_imports_successfully(self, render_site_module, configured_env):
         """Script should import without errors."""
-        module = load_script("render_site.py")
+        module = render_site_module
 
         assert hasattr(module, "main")
         assert callable(module.main)
 
-    def test_main_calls_init_db(self, configured_env):
+    def test_main_calls_init_db(self, render_site_module, configured_env):
         """main() should initialize database."""
-        module = load_script("render_site.py")
+        module = render_site_module
 
         with (
             patch.object(module, "init_db") as mock_init,
@@ -103,9 +133,9 @@ class TestRenderSiteImport:
 
             mock_init.assert_called_once()
 
-    def test_main_loads_latest_metrics(self, configured_env):
+    def test_main_loads_latest_metrics(self, render_site_module, configured_env):
         """main() should load latest metrics for both roles."""
-        module = load_script("render_site.py")
+        module = render_site_module
 
         with (
             patch.object(module, "init_db"),
@@ -121,9 +151,9 @@ class TestRenderSiteImport:
                 "repeater",
             ]
 
-    def test_main_calls_write_site(self, configured_env):
+    def test_main_calls_write_site(self, render_site_module, configured_env):
         """main() should call write_site with metrics."""
-        module = load_script("render_site.py")
+        module = render_site_module
 
         companion_metrics = {"battery_mv": 3850, "ts": 12345}
         repeater_metrics = {"bat": 3900, "ts": 12346}
@@ -140,18 +170,19 @@ class TestRenderSiteImport:
 
             mock_write.assert_called_once_with(companion_metrics, repeater_metrics)
 
-    def test_creates_html_files_for_all_periods(self, configured_env, initialized_db, tmp_path):
+    def test_creates_html_files_for_all_periods(
+        self, render_site_module, configured_env, initialized_db
+    ):
         """Should create HTML files for day/week/month/year periods."""
-        module = load_script("render_site.py")
+        module = render_site_module
         out_dir = configured_env["out_dir"]
 
-        # Use real write_site but mock the templates to avoid complex setup
+        # Let write_site run for real - it renders the pages into out_dir
         with (
             patch.object(module, "init_db"),
             patch.object(module, "get_latest_metrics") as mock_get,
         ):
             mock_get.return_value = {"battery_mv": 3850, "ts": 12345}
-            # Let write_site run - it will create the files
             module.main()
 
         # Verify HTML files exist and have content
@@ -159,16 +190,18 @@ class TestRenderSiteImport:
             html_file = out_dir / f"{period}.html"
             assert html_file.exists(), f"{period}.html should exist"
             content = html_file.read_text()
-            assert len(content) > 0, f"{period}.html should have content"
-            assert "<!DOCTYPE html>" in content or "<html" in content, f"{period}.html should be valid HTML"
+            assert content, f"{period}.html should have content"
+            assert "<!DOCTYPE html>" in content or "<html" in content, (
+                f"{period}.html should be valid HTML"
+            )
 
 
 class TestRenderReportsImport:
     """Verify render_reports.py imports correctly."""
 
-    def test_imports_successfully(self, configured_env):
+    def test_imports_successfully(self, render_reports_module, configured_env):
         """Script should import without errors."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         assert hasattr(module, "main")
         assert hasattr(module, "safe_write")
@@ -179,33 +212,41 @@ class TestRenderReportsImport:
         assert hasattr(module, "build_reports_index_data")
         assert callable(module.main)
 
-    def test_main_calls_init_db(self, configured_env):
+    def test_main_calls_init_db(self, render_reports_module, configured_env):
         """main() should initialize database."""
-        module = load_script("render_reports.py")
-
-        with (
-            patch.object(module, "init_db") as mock_init,
-            patch.object(module, "get_available_periods", return_value=[]),
-            patch.object(module, "build_reports_index_data", return_value=[]),
-            patch.object(module, "render_reports_index", return_value="<html>"),
-            patch.object(module, "safe_write", return_value=True),
-        ):
+        module = render_reports_module
+
+        with patch.multiple(
+            module,
+            init_db=DEFAULT,
+            get_available_periods=DEFAULT,
+            build_reports_index_data=DEFAULT,
+            render_reports_index=_html,
+            safe_write=DEFAULT,
+        ) as patched:
+            patched["get_available_periods"].return_value = []
+            patched["build_reports_index_data"].return_value = []
+            patched["safe_write"].return_value = True
             module.main()
 
-            mock_init.assert_called_once()
+            patched["init_db"].assert_called_once()
 
-    def test_main_processes_both_roles(self, configured_env):
+    def test_main_processes_both_roles(self, render_reports_module, configured_env):
         """main() should process both repeater and companion."""
-        module = load_script("render_reports.py")
-
-        with (
-            patch.object(module, "init_db"),
-            patch.object(module, "get_available_periods") as mock_periods,
-            patch.object(module, "build_reports_index_data", return_value=[]),
-            patch.object(module, "render_reports_index", return_value="<html>"),
-            patch.object(module, "safe_write", return_value=True),
-        ):
+        module = render_reports_module
+
+        with patch.multiple(
+            module,
+            init_db=DEFAULT,
+            get_available_periods=DEFAULT,
+            build_reports_index_data=DEFAULT,
+            render_reports_index=_html,
+            safe_write=DEFAULT,
+        ) as patched:
+            mock_periods = patched["get_available_periods"]
             mock_periods.return_value = []
+            patched["build_reports_index_data"].return_value = []
+            patched["safe_write"].return_value = True
             module.main()
 
             # Should check periods for both roles
@@ -218,9 +259,9 @@ class TestRenderReportsImport:
 class TestRenderReportsHelpers:
     """Test helper functions in render_reports.py."""
 
-    def test_safe_write_success(self, configured_env, tmp_path):
+    def test_safe_write_success(self, render_reports_module, configured_env, tmp_path):
         """safe_write should return True on success."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         test_file = tmp_path / "test.txt"
         result = module.safe_write(test_file, "test content")
@@ -228,9 +269,11 @@ class TestRenderReportsHelpers:
         assert result is True
         assert test_file.read_text() == "test content"
 
-    def test_safe_write_fails_for_missing_parent_directories(self, configured_env, tmp_path):
+    def test_safe_write_fails_for_missing_parent_directories(
+        self, render_reports_module, configured_env, tmp_path
+    ):
         """safe_write should fail when parent directories don't exist (it doesn't create them)."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         # Parent directory doesn't exist
         test_file = tmp_path / "nested" / "dir" / "test.txt"
@@ -240,9 +283,11 @@ class TestRenderReportsHelpers:
         assert result is False
         assert not test_file.exists()
 
-    def test_safe_write_works_with_existing_parent_directories(self, configured_env, tmp_path):
+    def test_safe_write_works_with_existing_parent_directories(
+        self, render_reports_module, configured_env, tmp_path
+    ):
         """safe_write should work when parent directories exist."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         # Create parent directory first
         nested_dir = tmp_path / "existing" / "dir"
@@ -254,9 +299,9 @@ class TestRenderReportsHelpers:
         assert test_file.exists()
         assert test_file.read_text() == "nested content"
 
-    def test_safe_write_failure(self, configured_env):
+    def test_safe_write_failure(self, render_reports_module, configured_env):
         """safe_write should return False on failure."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         # Try to write to non-existent directory that can't be created
         bad_path = Path("/nonexistent/dir/file.txt")
@@ -264,48 +309,41 @@ class TestRenderReportsHelpers:
 
         assert result is False
 
-    def test_get_node_name_repeater(self, configured_env, monkeypatch):
+    def test_get_node_name_repeater(self, render_reports_module, configured_env, env_override):
         """get_node_name should return display name for repeater."""
-        monkeypatch.setenv("REPEATER_DISPLAY_NAME", "My Repeater")
-        import meshmon.env
-
-        meshmon.env._config = None
+        env_override(REPEATER_DISPLAY_NAME="My Repeater")
 
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         name = module.get_node_name("repeater")
         assert name == "My Repeater"
 
-    def test_get_node_name_companion(self, configured_env, monkeypatch):
+    def test_get_node_name_companion(self, render_reports_module, configured_env, env_override):
         """get_node_name should return display name for companion."""
-        monkeypatch.setenv("COMPANION_DISPLAY_NAME", "My Companion")
-        import meshmon.env
-
-        meshmon.env._config = None
+        env_override(COMPANION_DISPLAY_NAME="My Companion")
 
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         name = module.get_node_name("companion")
         assert name == "My Companion"
 
-    def test_get_node_name_unknown(self, configured_env):
+    def test_get_node_name_unknown(self, render_reports_module, configured_env):
         """get_node_name should capitalize unknown roles."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         name = module.get_node_name("unknown")
         assert name == "Unknown"
 
-    def test_get_location(self, configured_env, monkeypatch):
+    def test_get_location(self, render_reports_module, configured_env, env_override):
         """get_location should return LocationInfo from config."""
-        monkeypatch.setenv("REPORT_LOCATION_NAME", "Test Location")
-        monkeypatch.setenv("REPORT_LAT", "52.37")
-        monkeypatch.setenv("REPORT_LON", "4.89")
-        monkeypatch.setenv("REPORT_ELEV", "10")
-        import meshmon.env
+        env_override(
+            REPORT_LOCATION_NAME="Test Location",
+            REPORT_LAT="52.37",
+            REPORT_LON="4.89",
+            REPORT_ELEV="10",
+        )
 
-        meshmon.env._config = None
-
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         location = module.get_location()
 
@@ -314,9 +352,9 @@ class TestRenderReportsHelpers:
         assert location.lon == 4.89
         assert location.elev == 10
 
-    def test_build_reports_index_data_empty(self, configured_env):
+    def test_build_reports_index_data_empty(self, render_reports_module, configured_env):
         """build_reports_index_data should return empty years for no data."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         with patch.object(module, "get_available_periods", return_value=[]):
             sections = module.build_reports_index_data()
@@ -327,16 +365,11 @@ class TestRenderReportsHelpers:
             assert sections[1]["role"] == "companion"
             assert sections[1]["years"] == []
 
-    def test_build_reports_index_data_with_periods(self, configured_env):
+    def test_build_reports_index_data_with_periods(self, render_reports_module, configured_env):
         """build_reports_index_data should organize periods by year."""
-        module = load_script("render_reports.py")
-
-        def mock_periods(role):
-            if role == "repeater":
-                return [(2024, 11), (2024, 12), (2025, 1)]
-            return []
+        module = render_reports_module
 
-        with patch.object(module, "get_available_periods", side_effect=mock_periods):
+        with patch.object(module, "get_available_periods", new=_repeater_periods_spanning_years):
             sections = module.build_reports_index_data()
 
             repeater_section = sections[0]
@@ -351,12 +384,11 @@ class TestRenderReportsHelpers:
 class TestRenderMonthlyReport:
     """Test render_monthly_report function."""
 
-    def test_skips_empty_aggregation(self, configured_env):
+    def test_skips_empty_aggregation(self, render_reports_module, configured_env):
         """Should skip when no data for the period."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
-        mock_agg = MagicMock()
-        mock_agg.daily = []  # No data
+        mock_agg = SimpleNamespace(daily=[])  # No data
 
         with (
             patch.object(module, "aggregate_monthly", return_value=mock_agg),
@@ -367,69 +399,65 @@ class TestRenderMonthlyReport:
             # Should not write any files
             mock_write.assert_not_called()
 
-    def test_writes_all_formats(self, configured_env, tmp_path, monkeypatch):
+    def test_writes_all_formats(
+        self, render_reports_module, configured_env, tmp_path, env_override
+    ):
         """Should write HTML, TXT, and JSON formats."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
+        env_override(OUT_DIR=tmp_path)
 
-        meshmon.env._config = None
+        module = render_reports_module
 
-        module = load_script("render_reports.py")
+        mock_agg = SimpleNamespace(daily=[{"day": 1}])  # Has data
 
-        mock_agg = MagicMock()
-        mock_agg.daily = [{"day": 1}]  # Has data
+        writes, capture = _capture_writes()
 
         with (
             patch.object(module, "aggregate_monthly", return_value=mock_agg),
-            patch.object(module, "render_report_page", return_value="<html>"),
-            patch.object(module, "format_monthly_txt", return_value="TXT"),
-            patch.object(module, "monthly_to_json", return_value={}),
+            patch.object(module, "render_report_page", new=_html),
+            patch.object(module, "format_monthly_txt", new=_txt),
+            patch.object(module, "monthly_to_json", new=_empty_json),
+            patch.object(module, "safe_write", new=capture),
         ):
             module.render_monthly_report("repeater", 2024, 12)
 
-        # Check files were created
         report_dir = tmp_path / "reports" / "repeater" / "2024" / "12"
-        assert (report_dir / "index.html").exists()
-        assert (report_dir / "report.txt").exists()
-        assert (report_dir / "report.json").exists()
+        assert writes == {
+            report_dir / "index.html": "<html>",
+            report_dir / "report.txt": "TXT",
+            report_dir / "report.json": "{}",
+        }
 
-    def test_writes_valid_json(self, configured_env, tmp_path, monkeypatch):
+    def test_writes_valid_json(self, render_reports_module, configured_env, tmp_path, env_override):
         """JSON output should be valid JSON."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
-
-        meshmon.env._config = None
+        env_override(OUT_DIR=tmp_path)
 
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
-        mock_agg = MagicMock()
-        mock_agg.daily = [{"day": 1}]
+        mock_agg = SimpleNamespace(daily=[{"day": 1}])
 
-        json_data = {"period": "2024-12", "metrics": {"bat": {"avg": 3850}}}
+        writes, capture = _capture_writes()
 
         with (
             patch.object(module, "aggregate_monthly", return_value=mock_agg),
-            patch.object(module, "render_report_page", return_value="<html>"),
-            patch.object(module, "format_monthly_txt", return_value="TXT"),
-            patch.object(module, "monthly_to_json", return_value=json_data),
+            patch.object(module, "render_report_page", new=_html),
+            patch.object(module, "format_monthly_txt", new=_txt),
+            patch.object(module, "monthly_to_json", return_value=_MONTHLY_JSON),
+            patch.object(module, "safe_write", new=capture),
         ):
             module.render_monthly_report("repeater", 2024, 12)
 
-        json_file = tmp_path / "reports" / "repeater" / "2024" / "12" / "report.json"
-        content = json_file.read_text()
-        parsed = json.loads(content)  # Should not raise
-        assert parsed["period"] == "2024-12"
+        content = writes[tmp_path / "reports" / "repeater" / "2024" / "12" / "report.json"]
+        assert json.loads(content) == _MONTHLY_JSON  # Should not raise
 
 
 class TestRenderYearlyReport:
     """Test render_yearly_report function."""
 
-    def test_skips_empty_aggregation(self, configured_env):
+    def test_skips_empty_aggregation(self, render_reports_module, configured_env):
         """Should skip when no data for the year."""
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
-        mock_agg = MagicMock()
-        mock_agg.monthly = []  # No data
+        mock_agg = SimpleNamespace(monthly=[])  # No data
 
         with (
             patch.object(module, "aggregate_yearly", return_value=mock_agg),
@@ -440,56 +468,58 @@ class TestRenderYearlyReport:
             # Should not write any files
             mock_write.assert_not_called()
 
-    def test_writes_all_formats(self, configured_env, tmp_path, monkeypatch):
+    def test_writes_all_formats(
+        self, render_reports_module, configured_env, tmp_path, env_override
+    ):
         """Should write HTML, TXT, and JSON formats."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
+        env_override(OUT_DIR=tmp_path)
 
-        meshmon.env._config = None
+        module = render_reports_module
 
-        module = load_script("render_reports.py")
+        mock_agg = SimpleNamespace(monthly=[{"month": 1}])  # Has data
 
-        mock_agg = MagicMock()
-        mock_agg.monthly = [{"month": 1}]  # Has data
+        writes, capture = _capture_writes()
 
         with (
             patch.object(module, "aggregate_yearly", return_value=mock_agg),
-            patch.object(module, "render_report_page", return_value="<html>"),
-            patch.object(module, "format_yearly_txt", return_value="TXT"),
-            patch.object(module, "yearly_to_json", return_value={}),
+            patch.object(module, "render_report_page", new=_html),
+            patch.object(module, "format_yearly_txt", new=_txt),
+            patch.object(module, "yearly_to_json", new=_empty_json),
+            patch.object(module, "safe_write", new=capture),
         ):
             module.render_yearly_report("repeater", 2024)
 
-        # Check files were created
         report_dir = tmp_path / "reports" / "repeater" / "2024"
-        assert (report_dir / "index.html").exists()
-        assert (report_dir / "report.txt").exists()
-        assert (report_dir / "report.json").exists()
+        assert writes == {
+            report_dir / "index.html": "<html>",
+            report_dir / "report.txt": "TXT",
+            report_dir / "report.json": "{}",
+        }
 
-    def test_writes_valid_html(self, configured_env, tmp_path, monkeypatch):
+    def test_writes_valid_html(self, render_reports_module, configured_env, tmp_path, env_override):
         """HTML output should contain valid HTML structure."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
+        env_override(OUT_DIR=tmp_path)
 
-        meshmon.env._config = None
+        module = render_reports_module
 
-        module = load_script("render_reports.py")
+        mock_agg = SimpleNamespace(monthly=[{"month": 1}])
 
-        mock_agg = MagicMock()
-        mock_agg.monthly = [{"month": 1}]
+        html_content = (
+            "<!DOCTYPE html><html><head><title>Report</title></head><body>Content</body></html>"
+        )
 
-        html_content = "<!DOCTYPE html><html><head><title>Report</title></head><body>Content</body></html>"
+        writes, capture = _capture_writes()
 
         with (
             patch.object(module, "aggregate_yearly", return_value=mock_agg),
             patch.object(module, "render_report_page", return_value=html_content),
-            patch.object(module, "format_yearly_txt", return_value="TXT"),
-            patch.object(module, "yearly_to_json", return_value={}),
+            patch.object(module, "format_yearly_txt", new=_txt),
+            patch.object(module, "yearly_to_json", new=_empty_json),
+            patch.object(module, "safe_write", new=capture),
         ):
             module.render_yearly_report("repeater", 2024)
 
-        html_file = tmp_path / "reports" / "repeater" / "2024" / "index.html"
-        content = html_file.read_text()
+        content = writes[tmp_path / "reports" / "repeater" / "2024" / "index.html"]
         assert "<!DOCTYPE html>" in content
         assert "<html>" in content
         assert "</html>" in content
@@ -498,17 +528,15 @@ class TestRenderYearlyReport:
 class TestReportNavigation:
     """Test prev/next navigation in reports."""
 
-    def test_monthly_report_with_prev_next(self, configured_env, tmp_path, monkeypatch):
+    def test_monthly_report_with_prev_next(
+        self, render_reports_module, configured_env, tmp_path, env_override
+    ):
         """Monthly report should build prev/next navigation links."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
+        env_override(OUT_DIR=tmp_path)
 
-        meshmon.env._config = None
+        module = render_reports_module
 
-        module = load_script("render_reports.py")
-
-        mock_agg = MagicMock()
-        mock_agg.daily = [{"day": 1}]
+        mock_agg = SimpleNamespace(daily=[{"day": 1}])
 
         prev_report_data = None
         next_report_data = None
@@ -522,8 +550,8 @@ class TestReportNavigation:
         with (
             patch.object(module, "aggregate_monthly", return_value=mock_agg),
             patch.object(module, "render_report_page", side_effect=capture_render),
-            patch.object(module, "format_monthly_txt", return_value="TXT"),
-            patch.object(module, "monthly_to_json", return_value={}),
+            patch.object(module, "format_monthly_txt", new=_txt),
+            patch.object(module, "monthly_to_json", new=_empty_json),
         ):
             # Call with prev and next periods
             module.render_monthly_report(
@@ -537,17 +565,15 @@ class TestReportNavigation:
         assert next_report_data["url"] == "/reports/repeater/2024/07/"
         assert next_report_data["label"] == "Jul 2024"
 
-    def test_yearly_report_with_prev_next(self, configured_env, tmp_path, monkeypatch):
+    def test_yearly_report_with_prev_next(
+        self, render_reports_module, configured_env, tmp_path, env_override
+    ):
         """Yearly report should build prev/next navigation links."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
-
-        meshmon.env._config = None
+        env_override(OUT_DIR=tmp_path)
 
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
-        mock_agg = MagicMock()
-        mock_agg.monthly = [{"month": 1}]
+        mock_agg = SimpleNamespace(monthly=[{"month": 1}])
 
         prev_report_data = None
         next_report_data = None
@@ -561,8 +587,8 @@ class TestReportNavigation:
         with (
             patch.object(module, "aggregate_yearly", return_value=mock_agg),
             patch.object(module, "render_report_page", side_effect=capture_render),
-            patch.object(module, "format_yearly_txt", return_value="TXT"),
-            patch.object(module, "yearly_to_json", return_value={}),
+            patch.object(module, "format_yearly_txt", new=_txt),
+            patch.object(module, "yearly_to_json", new=_empty_json),
         ):
             # Call with prev and next years
             module.render_yearly_report("repeater", 2024, prev_year=2023, next_year=2025)
@@ -578,38 +604,33 @@ class TestReportNavigation:
 class TestMainWithData:
     """Test main() function with actual data periods."""
 
-    def test_main_renders_reports_when_data_exists(self, configured_env, tmp_path, monkeypatch):
+    def test_main_renders_reports_when_data_exists(
+        self, render_reports_module, configured_env, tmp_path, env_override
+    ):
         """main() should render monthly and yearly reports when data exists."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
-
-        meshmon.env._config = None
-
-        module = load_script("render_reports.py")
-
-        def mock_periods(role):
-            if role == "repeater":
-                return [(2024, 11), (2024, 12)]
-            return []
-
-        mock_monthly_agg = MagicMock()
-        mock_monthly_agg.daily = [{"day": 1}]
-
-        mock_yearly_agg = MagicMock()
-        mock_yearly_agg.monthly = [{"month": 11}]
-
-        with (
-            patch.object(module, "init_db"),
-            patch.object(module, "get_available_periods", side_effect=mock_periods),
-            patch.object(module, "aggregate_monthly", return_value=mock_monthly_agg),
-            patch.object(module, "aggregate_yearly", return_value=mock_yearly_agg),
-            patch.object(module, "render_report_page", return_value="<html>"),
-            patch.object(module, "format_monthly_txt", return_value="TXT"),
-            patch.object(module, "format_yearly_txt", return_value="TXT"),
-            patch.object(module, "monthly_to_json", return_value={}),
-            patch.object(module, "yearly_to_json", return_value={}),
-            patch.object(module, "render_reports_index", return_value="<html>"),
-        ):
+        env_override(OUT_DIR=tmp_path)
+
+        module = render_reports_module
+
+        mock_monthly_agg = SimpleNamespace(daily=[{"day": 1}])
+
+        mock_yearly_agg = SimpleNamespace(monthly=[{"month": 11}])
+
+        with patch.multiple(
+            module,
+            init_db=DEFAULT,
+            get_available_periods=_repeater_periods_2024,
+            aggregate_monthly=DEFAULT,
+            aggregate_yearly=DEFAULT,
+            render_report_page=_html,
+            format_monthly_txt=_txt,
+            format_yearly_txt=_txt,
+            monthly_to_json=_empty_json,
+            yearly_to_json=_empty_json,
+            render_reports_index=_html,
+        ) as patched:
+            patched["aggregate_monthly"].return_value = mock_monthly_agg
+            patched["aggregate_yearly"].return_value = mock_yearly_agg
             module.main()
 
         # Verify reports were created
@@ -618,14 +639,13 @@ class TestMainWithData:
         assert (repeater_dir / "2024" / "12" / "index.html").exists()
         assert (repeater_dir / "2024" / "index.html").exists()
 
-    def test_main_creates_index_with_content(self, configured_env, tmp_path, monkeypatch):
+    def test_main_creates_index_with_content(
+        self, render_reports_module, configured_env, tmp_path, env_override
+    ):
         """main() should create reports index with valid content."""
-        monkeypatch.setenv("OUT_DIR", str(tmp_path))
-        import meshmon.env
-
-        meshmon.env._config = None
+        env_override(OUT_DIR=tmp_path)
 
-        module = load_script("render_reports.py")
+        module = render_reports_module
 
         index_html = """<!DOCTYPE html>
 <html>
@@ -5,49 +5,63 @@ These tests verify that scripts can be imported without errors,
 ensuring all dependencies and syntax are correct.
 """
 
+import functools
 from pathlib import Path
 
 import pytest
 
-from tests.scripts.conftest import load_script_module
-
 # Scripts directory
 SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
 
+# Entry-point scripts checked by TestScriptStructure
+STRUCTURE_SCRIPTS = (
+    "collect_companion.py",
+    "collect_repeater.py",
+    "render_charts.py",
+    "render_site.py",
+    "render_reports.py",
+)
+
+
+@functools.cache
+def _script_bytes(script_name: str) -> bytes:
+    """Raw source of a script, read once per session."""
+    return (SCRIPTS_DIR / script_name).read_bytes()
+
 
 class TestScriptImports:
     """Smoke tests - verify all scripts can be imported."""
 
-    def test_collect_companion_imports(self):
+    def test_collect_companion_imports(self, collect_companion_module):
         """collect_companion.py imports without error."""
-        module = load_script_module("collect_companion.py")
+        module = collect_companion_module
         assert hasattr(module, "main")
         assert hasattr(module, "collect_companion")
         assert callable(module.main)
 
-    def test_collect_repeater_imports(self):
+    def test_collect_repeater_imports(self, collect_repeater_module):
         """collect_repeater.py imports without error."""
-        module = load_script_module("collect_repeater.py")
+        module = collect_repeater_module
         assert hasattr(module, "main")
         assert hasattr(module, "collect_repeater")
         assert hasattr(module, "find_repeater_contact")
         assert callable(module.main)
 
-    def test_render_charts_imports(self):
+    def test_render_charts_imports(self, render_charts_module):
         """render_charts.py imports without error."""
-        module = load_script_module("render_charts.py")
+        module = render_charts_module
         assert hasattr(module, "main")
         assert callable(module.main)
 
-    def test_render_site_imports(self):
+    def test_render_site_imports(self, render_site_module):
         """render_site.py imports without error."""
-        module = load_script_module("render_site.py")
+        module = render_site_module
         assert hasattr(module, "main")
         assert callable(module.main)
 
-    def test_render_reports_imports(self):
+    def test_render_reports_imports(self, render_reports_module):
         """render_reports.py imports without error."""
-        module = load_script_module("render_reports.py")
+        module = render_reports_module
         assert hasattr(module, "main")
         assert hasattr(module, "safe_write")
         assert hasattr(module, "get_node_name")
@@ -57,9 +71,9 @@ class TestScriptImports:
         assert hasattr(module, "build_reports_index_data")
         assert callable(module.main)
 
-    def test_generate_snapshots_imports(self):
+    def test_generate_snapshots_imports(self, generate_snapshots_module):
         """generate_snapshots.py imports without error."""
-        module = load_script_module("generate_snapshots.py")
+        module = generate_snapshots_module
         # This utility script uses direct function calls instead of main()
         assert hasattr(module, "generate_svg_snapshots")
         assert hasattr(module, "generate_txt_snapshots")
@@ -69,53 +83,23 @@ class TestScriptImports:
 class TestScriptStructure:
     """Verify scripts follow expected patterns."""
 
-    @pytest.mark.parametrize(
-        "script_name",
-        [
-            "collect_companion.py",
-            "collect_repeater.py",
-            "render_charts.py",
-            "render_site.py",
-            "render_reports.py",
-        ],
-    )
+    @pytest.mark.parametrize("script_name", STRUCTURE_SCRIPTS)
     def test_script_has_main_guard(self, script_name: str):
         """Scripts have if __name__ == '__main__' guard."""
-        script_path = SCRIPTS_DIR / script_name
-        content = script_path.read_text()
-        assert 'if __name__ == "__main__":' in content
-
-    @pytest.mark.parametrize(
-        "script_name",
-        [
-            "collect_companion.py",
-            "collect_repeater.py",
-            "render_charts.py",
-            "render_site.py",
-            "render_reports.py",
-        ],
-    )
+        content = _script_bytes(script_name)
+        assert b'if __name__ == "__main__":' in content
+
+    @pytest.mark.parametrize("script_name", STRUCTURE_SCRIPTS)
     def test_script_has_docstring(self, script_name: str):
         """Scripts have module-level docstring."""
-        script_path = SCRIPTS_DIR / script_name
-        content = script_path.read_text()
+        content = _script_bytes(script_name)
         # Should start with shebang, then docstring
-        lines = content.split("\n")
-        assert lines[0].startswith("#!/")
-        assert lines[1] == '"""'
-
-    @pytest.mark.parametrize(
-        "script_name",
-        [
-            "collect_companion.py",
-            "collect_repeater.py",
-            "render_charts.py",
-            "render_site.py",
-            "render_reports.py",
-        ],
-    )
+        first, second, _ = content.split(b"\n", 2)
+        assert first.startswith(b"#!/")
+        assert second == b'"""'
+
+    @pytest.mark.parametrize("script_name", STRUCTURE_SCRIPTS)
     def test_script_calls_init_db(self, script_name: str):
         """Scripts initialize database before operations."""
-        script_path = SCRIPTS_DIR / script_name
-        content = script_path.read_text()
-        assert "init_db()" in content
+        content = _script_bytes(script_name)
+        assert b"init_db()" in content
@@ -4,19 +4,29 @@ Provides shared utilities for comparing test output against saved snapshots.
 Supports updating snapshots via UPDATE_SNAPSHOTS=1 environment variable.
 """
 
+import difflib
+import itertools
 import os
 from pathlib import Path
 
 import pytest
 
+# Read once: the environment does not change during a test run
+UPDATE_SNAPSHOTS = os.environ.get("UPDATE_SNAPSHOTS", "").lower() in frozenset({"1", "true", "yes"})
 
-@pytest.fixture
+# Maximum number of unified-diff lines shown on a snapshot mismatch
+DIFF_MAX_LINES = 40
+# Unchanged lines shown around each change
+DIFF_CONTEXT = 1
+
+
+@pytest.fixture(scope="session")
 def update_snapshots():
     """Return True if snapshots should be updated instead of compared.
 
     Set UPDATE_SNAPSHOTS=1 environment variable to regenerate snapshots.
     """
-    return os.environ.get("UPDATE_SNAPSHOTS", "").lower() in ("1", "true", "yes")
+    return UPDATE_SNAPSHOTS
 
 
 @pytest.fixture
@@ -73,19 +83,20 @@ def assert_snapshot_match(
             expected = normalize_fn(expected)
 
         if actual != expected:
-            # Provide helpful diff information
-            actual_lines = actual.splitlines()
+            # Provide helpful diff information (bounded unified diff)
             expected_lines = expected.splitlines()
-
-            diff_info = []
-            for i, (a, e) in enumerate(zip(actual_lines, expected_lines, strict=False), 1):
-                if a != e:
-                    diff_info.append(f"Line {i}:")
-                    diff_info.append(f"  Expected: {e[:100]}...")
-                    diff_info.append(f"  Actual:   {a[:100]}...")
-                    if len(diff_info) > 15:  # Limit diff output
-                        diff_info.append("  ...")
-                        break
+            actual_lines = actual.splitlines()
+            diff = difflib.unified_diff(
+                expected_lines,
+                actual_lines,
+                fromfile="expected",
+                tofile="actual",
+                n=DIFF_CONTEXT,
+                lineterm="",
+            )
+            diff_info = [line[:200] for line in itertools.islice(diff, DIFF_MAX_LINES)]
+            if len(diff_info) == DIFF_MAX_LINES:
+                diff_info.append("...")
 
             if len(actual_lines) != len(expected_lines):
                 diff_info.append(
@@ -0,0 +1,51 @@
+"""Fixtures for unit tests."""
+
+from datetime import datetime
+
+import pytest
+
+# Frozen log timestamp returned by the fixed_ts fixture
+FIXED_TS = "2024-01-15 10:30:45"
+
+# Frozen "now" returned by the fixed_now fixture
+BASE_NOW = datetime(2024, 1, 2, 12, 0, 0)
+
+
+class _FixedDatetime(datetime):
+    """datetime whose now() is pinned to BASE_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return BASE_NOW if tz is None else BASE_NOW.astimezone(tz)
+
+
+@pytest.fixture(scope="class")
+def fixed_ts():
+    """Freeze log timestamp for deterministic output assertions."""
+    from meshmon import log
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(log, "_ts", lambda: FIXED_TS)
+        yield FIXED_TS
+
+
+@pytest.fixture(scope="class")
+def fixed_now():
+    """Freeze meshmon.html datetime.now() for deterministic status tests."""
+    import meshmon.html
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(meshmon.html, "datetime", _FixedDatetime)
+        yield BASE_NOW
+
+
+@pytest.fixture
+def debug_config(inject_config):
+    """Config with MESH_DEBUG enabled, installed without parsing the env."""
+    return inject_config(mesh_debug=True)
+
+
+@pytest.fixture
+def nodebug_config(inject_config):
+    """Config with MESH_DEBUG disabled, installed without parsing the env."""
+    return inject_config(mesh_debug=False)
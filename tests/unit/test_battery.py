@@ -1,5 +1,8 @@
 """Tests for battery voltage to percentage conversion."""
 
+from itertools import pairwise
+
+import numpy as np
 import pytest
 
 from meshmon.battery import VOLTAGE_TABLE, voltage_to_percentage
@@ -102,14 +105,15 @@ class TestVoltageToPercentage:
 
     def test_percentage_is_monotonic(self):
         """Battery percentage should decrease monotonically as voltage drops."""
-        voltages = [v / 100 for v in range(420, 299, -1)]  # 4.20 down to 3.00
-        percentages = [voltage_to_percentage(v) for v in voltages]
-
-        for i in range(1, len(percentages)):
-            assert percentages[i] <= percentages[i - 1], (
-                f"Monotonicity violation: at {voltages[i]}V got {percentages[i]}%, "
-                f"but at {voltages[i-1]}V got {percentages[i-1]}%"
-            )
+        voltages = np.arange(420, 299, -1) / 100  # 4.20 down to 3.00
+        percentages = np.array([voltage_to_percentage(v) for v in voltages])
+
+        rises = np.diff(percentages) > 0
+        i = int(np.argmax(rises))
+        assert not rises.any(), (
+            f"Monotonicity violation: at {voltages[i + 1]}V got {percentages[i + 1]}%, "
+            f"but at {voltages[i]}V got {percentages[i]}%"
+        )
 
     # ==========================================================================
     # Type handling
@@ -129,7 +133,7 @@ class TestVoltageTable:
     def test_table_is_sorted_descending(self):
         """Voltage table should be sorted in descending order by voltage."""
         voltages = [v for v, _ in VOLTAGE_TABLE]
-        assert voltages == sorted(voltages, reverse=True), (
+        assert all(b <= a for a, b in pairwise(voltages)), (
             "VOLTAGE_TABLE should be sorted by voltage in descending order"
         )
 
@@ -150,6 +154,6 @@ class TestVoltageTable:
     def test_percentages_are_descending(self):
         """Percentages should decrease as voltage decreases."""
         percentages = [p for _, p in VOLTAGE_TABLE]
-        assert percentages == sorted(percentages, reverse=True), (
+        assert all(b <= a for a, b in pairwise(percentages)), (
             "Percentages should be in descending order"
         )
@@ -1,10 +1,15 @@
 """Tests for chart helper functions in charts.py."""
 
+import html
 import json
+import re
+import statistics
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
 from meshmon.charts import (
@@ -23,56 +28,54 @@ from meshmon.charts import (
 BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
 BASE_DAY_START = datetime(2024, 1, 1, 0, 0, 0)
 
+_DATA_POINTS_RE = re.compile(r'data-points="([^"]+)"')
+
+
+def _parsed_attrs(svg: str) -> dict[str, str]:
+    """Attributes of the root element, from a single parse of the SVG."""
+    return ET.fromstring(svg).attrib
+
+
+def _make_ts(*values: float) -> TimeSeries:
+    """Hourly day-period battery series whose last point is at BASE_TIME."""
+    last = len(values) - 1
+    points = [
+        DataPoint(timestamp=BASE_TIME - timedelta(hours=last - i), value=value)
+        for i, value in enumerate(values)
+    ]
+    return TimeSeries(metric="bat", role="repeater", period="day", points=points)
+
+
+# Read-only; no test mutates its points
+_EMPTY_TS = _make_ts()
+
+
+def _stamps(*minutes: int) -> list[datetime]:
+    """Timestamps at the given minute offsets from BASE_TIME."""
+    return [BASE_TIME + timedelta(minutes=m) for m in minutes]
+
+
+# (hex input, expected 0-255 RGBA channels)
+_HEX_CASES = [
+    ("ff0000", (0xFF, 0x00, 0x00, 0xFF)),  # Red
+    ("ff000080", (0xFF, 0x00, 0x00, 0x80)),  # Red with 50% alpha
+    ("ffffff", (0xFF, 0xFF, 0xFF, 0xFF)),  # White
+    ("000000", (0x00, 0x00, 0x00, 0xFF)),  # Black
+    ("00000000", (0x00, 0x00, 0x00, 0x00)),  # Fully transparent
+    ("b4530926", (0xB4, 0x53, 0x09, 0x26)),  # Light theme area (15% opacity)
+    ("f59e0b33", (0xF5, 0x9E, 0x0B, 0x33)),  # Dark theme area (20% opacity)
+]
+
 
 class TestHexToRgba:
     """Test _hex_to_rgba function."""
 
-    def test_6_char_hex(self):
-        """6-character hex (RGB) converts with alpha 1.0."""
-        r, g, b, a = _hex_to_rgba("ff0000")
-        assert r == pytest.approx(1.0)
-        assert g == pytest.approx(0.0)
-        assert b == pytest.approx(0.0)
-        assert a == pytest.approx(1.0)
-
-    def test_8_char_hex(self):
-        """8-character hex (RGBA) converts with proper alpha."""
-        r, g, b, a = _hex_to_rgba("ff000080")  # Red with 50% alpha
-        assert r == pytest.approx(1.0)
-        assert g == pytest.approx(0.0)
-        assert b == pytest.approx(0.0)
-        assert a == pytest.approx(128 / 255)
-
-    def test_white(self):
-        """White color converts correctly."""
-        r, g, b, a = _hex_to_rgba("ffffff")
-        assert r == pytest.approx(1.0)
-        assert g == pytest.approx(1.0)
-        assert b == pytest.approx(1.0)
-        assert a == pytest.approx(1.0)
-
-    def test_black(self):
-        """Black color converts correctly."""
-        r, g, b, a = _hex_to_rgba("000000")
-        assert r == pytest.approx(0.0)
-        assert g == pytest.approx(0.0)
-        assert b == pytest.approx(0.0)
-        assert a == pytest.approx(1.0)
-
-    def test_transparent(self):
-        """Fully transparent converts correctly."""
-        r, g, b, a = _hex_to_rgba("00000000")
-        assert a == pytest.approx(0.0)
-
-    def test_theme_area_color(self):
-        """Theme area colors with alpha parse correctly."""
-        # Light theme area: "b4530926" (15% opacity)
-        r, g, b, a = _hex_to_rgba("b4530926")
-        assert a == pytest.approx(0x26 / 255)  # 0x26 = 38
-
-        # Dark theme area: "f59e0b33" (20% opacity)
-        r, g, b, a = _hex_to_rgba("f59e0b33")
-        assert a == pytest.approx(0x33 / 255)  # 0x33 = 51
+    @pytest.mark.parametrize(
+        "hex_str,channels", _HEX_CASES, ids=[hex_str for hex_str, _ in _HEX_CASES]
+    )
+    def test_converts_hex_channels(self, hex_str, channels):
+        """6-char hex gets alpha 1.0, 8-char hex carries its own alpha."""
+        assert _hex_to_rgba(hex_str) == tuple(channel / 255 for channel in channels)
 
 
 class TestAggregateBins:
@@ -85,32 +88,22 @@ class TestAggregateBins:
 
     def test_single_point(self):
         """Single point returns single aggregated point."""
-        ts = datetime(2024, 1, 1, 12, 30, 0)
-        points = [(ts, 100.0)]
+        points = list(zip(_stamps(30), [100.0], strict=True))
         result = _aggregate_bins(points, 3600)  # 1-hour bins
         assert len(result) == 1
         assert result[0][1] == 100.0
 
     def test_points_same_bin(self):
         """Points in same bin are averaged."""
-        ts = datetime(2024, 1, 1, 12, 0, 0)
-        points = [
-            (ts + timedelta(minutes=10), 100.0),
-            (ts + timedelta(minutes=20), 200.0),
-            (ts + timedelta(minutes=30), 300.0),
-        ]
+        points = list(zip(_stamps(10, 20, 30), [100.0, 200.0, 300.0], strict=True))
         result = _aggregate_bins(points, 3600)  # 1-hour bins
         assert len(result) == 1
         assert result[0][1] == pytest.approx(200.0)  # Mean of 100, 200, 300
 
     def test_points_different_bins(self):
         """Points in different bins stay separate."""
-        ts = datetime(2024, 1, 1, 12, 0, 0)
-        points = [
-            (ts, 100.0),  # Hour 12 bin
-            (ts + timedelta(hours=1), 200.0),  # Hour 13 bin
-            (ts + timedelta(hours=2), 300.0),  # Hour 14 bin
-        ]
+        # Hour 12, 13 and 14 bins
+        points = list(zip(_stamps(0, 60, 120), [100.0, 200.0, 300.0], strict=True))
         result = _aggregate_bins(points, 3600)  # 1-hour bins
         assert len(result) == 3
         assert result[0][1] == 100.0
@@ -119,21 +112,15 @@ class TestAggregateBins:
 
     def test_bin_center_timestamp(self):
         """Result timestamps are at bin center."""
-        ts = datetime(2024, 1, 1, 12, 0, 0)
-        points = [(ts, 100.0)]
+        points = [(BASE_TIME, 100.0)]
         result = _aggregate_bins(points, 3600)  # 1-hour bins
         # Bin starts at 12:00, center should be at 12:30
         assert result[0][0].minute == 30
 
     def test_30_minute_bins(self):
         """30-minute bins aggregate correctly."""
-        ts = datetime(2024, 1, 1, 12, 0, 0)
-        points = [
-            (ts + timedelta(minutes=5), 100.0),  # First 30-min bin
-            (ts + timedelta(minutes=10), 110.0),
-            (ts + timedelta(minutes=35), 200.0),  # Second 30-min bin
-            (ts + timedelta(minutes=40), 210.0),
-        ]
+        # Two points in each of the first two 30-minute bins
+        points = list(zip(_stamps(5, 10, 35, 40), [100.0, 110.0, 200.0, 210.0], strict=True))
         result = _aggregate_bins(points, 1800)  # 30-minute bins
         assert len(result) == 2
         assert result[0][1] == pytest.approx(105.0)  # Mean of 100, 110
@@ -141,205 +128,214 @@ class TestAggregateBins:
 
     def test_sorted_output(self):
         """Output is sorted by timestamp."""
-        ts = datetime(2024, 1, 1, 12, 0, 0)
         # Input in reverse order
-        points = [
-            (ts + timedelta(hours=2), 300.0),
-            (ts, 100.0),
-            (ts + timedelta(hours=1), 200.0),
-        ]
+        points = list(zip(_stamps(120, 0, 60), [300.0, 100.0, 200.0], strict=True))
         result = _aggregate_bins(points, 3600)
         timestamps = [r[0] for r in result]
         assert timestamps == sorted(timestamps)
 
+    @pytest.mark.parametrize("bin_seconds", [1800, 3600, 7200])
+    def test_matches_reference_binning(self, bin_seconds):
+        """Random series agree with a floor-divide-and-mean reference."""
+        rng = np.random.default_rng(bin_seconds)
+        base_epoch = int(BASE_TIME.timestamp())
+        for _ in range(25):
+            size = int(rng.integers(0, 21))
+            epochs = np.sort(base_epoch + rng.integers(0, 86400, size)).tolist()
+            values = rng.uniform(-100.0, 100.0, size).tolist()
+            points = [(datetime.fromtimestamp(e), v) for e, v in zip(epochs, values, strict=True)]
+
+            bins: dict[int, list[float]] = {}
+            for epoch, value in zip(epochs, values, strict=True):
+                bins.setdefault(epoch // bin_seconds * bin_seconds, []).append(value)
+            expected = [
+                (datetime.fromtimestamp(key + bin_seconds // 2), statistics.fmean(bins[key]))
+                for key in sorted(bins)
+            ]
+
+            result = _aggregate_bins(points, bin_seconds)
+
+            assert [ts for ts, _ in result] == [ts for ts, _ in expected]
+            assert [v for _, v in result] == pytest.approx([v for _, v in expected])
+
+
+class _XAxisStub:
+    """Stands in for ax.xaxis, keeping what _configure_x_axis sets."""
+
+    def __init__(self):
+        self._formatter = None
+        self._locator = None
+
+    def set_major_formatter(self, formatter):
+        self._formatter = formatter
+
+    def set_major_locator(self, locator):
+        self._locator = locator
+
+    def get_major_formatter(self):
+        return self._formatter
+
+    def get_major_locator(self):
+        return self._locator
+
+    def get_majorticklabels(self):
+        return []
+
+
+@pytest.fixture
+def ax():
+    """Axes stub; avoids building a matplotlib figure per test."""
+    return SimpleNamespace(xaxis=_XAxisStub())
+
 
 class TestConfigureXAxis:
     """Test _configure_x_axis function."""
 
-    def test_day_period_format(self):
+    def test_day_period_format(self, ax):
         """Day period uses HH:MM format with 4-hour intervals."""
-        fig, ax = plt.subplots()
-        try:
-            _configure_x_axis(ax, "day")
-            formatter = ax.xaxis.get_major_formatter()
-            locator = ax.xaxis.get_major_locator()
-            assert isinstance(formatter, mdates.DateFormatter)
-            assert formatter.fmt == "%H:%M"
-            assert isinstance(locator, mdates.HourLocator)
-            ticks = locator.tick_values(
-                BASE_DAY_START, BASE_DAY_START + timedelta(days=1)
-            )
-            tick_times = [
-                mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
-            ]
-            assert tick_times[1] - tick_times[0] == timedelta(hours=4)
-        finally:
-            plt.close(fig)
+        _configure_x_axis(ax, "day")
+        formatter = ax.xaxis.get_major_formatter()
+        locator = ax.xaxis.get_major_locator()
+        assert isinstance(formatter, mdates.DateFormatter)
+        assert formatter.fmt == "%H:%M"
+        assert isinstance(locator, mdates.HourLocator)
+        ticks = locator.tick_values(
+            BASE_DAY_START, BASE_DAY_START + timedelta(days=1)
+        )
+        tick_times = [
+            mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
+        ]
+        assert tick_times[1] - tick_times[0] == timedelta(hours=4)
 
-    def test_week_period_format(self):
+    def test_week_period_format(self, ax):
         """Week period uses weekday format with daily intervals."""
-        fig, ax = plt.subplots()
-        try:
-            _configure_x_axis(ax, "week")
-            formatter = ax.xaxis.get_major_formatter()
-            locator = ax.xaxis.get_major_locator()
-            assert isinstance(formatter, mdates.DateFormatter)
-            assert formatter.fmt == "%a"
-            assert isinstance(locator, mdates.DayLocator)
-            ticks = locator.tick_values(
-                BASE_DAY_START, BASE_DAY_START + timedelta(days=7)
-            )
-            tick_times = [
-                mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
-            ]
-            assert tick_times[1] - tick_times[0] == timedelta(days=1)
-        finally:
-            plt.close(fig)
+        _configure_x_axis(ax, "week")
+        formatter = ax.xaxis.get_major_formatter()
+        locator = ax.xaxis.get_major_locator()
+        assert isinstance(formatter, mdates.DateFormatter)
+        assert formatter.fmt == "%a"
+        assert isinstance(locator, mdates.DayLocator)
+        ticks = locator.tick_values(
+            BASE_DAY_START, BASE_DAY_START + timedelta(days=7)
+        )
+        tick_times = [
+            mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
+        ]
+        assert tick_times[1] - tick_times[0] == timedelta(days=1)
 
-    def test_month_period_format(self):
+    def test_month_period_format(self, ax):
         """Month period uses day-of-month format with 5-day intervals."""
-        fig, ax = plt.subplots()
-        try:
-            _configure_x_axis(ax, "month")
-            formatter = ax.xaxis.get_major_formatter()
-            locator = ax.xaxis.get_major_locator()
-            assert isinstance(formatter, mdates.DateFormatter)
-            assert formatter.fmt == "%d"
-            assert isinstance(locator, mdates.DayLocator)
-            ticks = locator.tick_values(
-                BASE_DAY_START, BASE_DAY_START + timedelta(days=31)
-            )
-            tick_times = [
-                mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
-            ]
-            assert tick_times[1] - tick_times[0] == timedelta(days=5)
-        finally:
-            plt.close(fig)
+        _configure_x_axis(ax, "month")
+        formatter = ax.xaxis.get_major_formatter()
+        locator = ax.xaxis.get_major_locator()
+        assert isinstance(formatter, mdates.DateFormatter)
+        assert formatter.fmt == "%d"
+        assert isinstance(locator, mdates.DayLocator)
+        ticks = locator.tick_values(
+            BASE_DAY_START, BASE_DAY_START + timedelta(days=31)
+        )
+        tick_times = [
+            mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
+        ]
+        assert tick_times[1] - tick_times[0] == timedelta(days=5)
 
-    def test_year_period_format(self):
+    def test_year_period_format(self, ax):
         """Year period uses month abbreviation format."""
-        fig, ax = plt.subplots()
-        try:
-            _configure_x_axis(ax, "year")
-            formatter = ax.xaxis.get_major_formatter()
-            locator = ax.xaxis.get_major_locator()
-            assert isinstance(formatter, mdates.DateFormatter)
-            assert formatter.fmt == "%b"
-            assert isinstance(locator, mdates.MonthLocator)
-            ticks = locator.tick_values(
-                BASE_DAY_START, BASE_DAY_START + timedelta(days=365)
-            )
-            tick_times = [
-                mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
-            ]
-            assert len(tick_times) > 1
-            assert all(tick.day == 1 for tick in tick_times)
-            for current, nxt in zip(tick_times, tick_times[1:], strict=False):
-                expected_month = 1 if current.month == 12 else current.month + 1
-                expected_year = current.year + (1 if current.month == 12 else 0)
-                assert (nxt.year, nxt.month) == (expected_year, expected_month)
-        finally:
-            plt.close(fig)
-
-    def test_unknown_period_defaults_to_year(self):
+        _configure_x_axis(ax, "year")
+        formatter = ax.xaxis.get_major_formatter()
+        locator = ax.xaxis.get_major_locator()
+        assert isinstance(formatter, mdates.DateFormatter)
+        assert formatter.fmt == "%b"
+        assert isinstance(locator, mdates.MonthLocator)
+        ticks = locator.tick_values(
+            BASE_DAY_START, BASE_DAY_START + timedelta(days=365)
+        )
+        tick_times = [
+            mdates.num2date(tick).replace(tzinfo=None) for tick in ticks
+        ]
+        assert len(tick_times) > 1
+        assert all(tick.day == 1 for tick in tick_times)
+        for current, nxt in zip(tick_times, tick_times[1:], strict=False):
+            expected_month = 1 if current.month == 12 else current.month + 1
+            expected_year = current.year + (1 if current.month == 12 else 0)
+            assert (nxt.year, nxt.month) == (expected_year, expected_month)
+
+    def test_unknown_period_defaults_to_year(self, ax):
         """Unknown period defaults to year format."""
-        fig, ax = plt.subplots()
-        try:
-            _configure_x_axis(ax, "unknown")
-            formatter = ax.xaxis.get_major_formatter()
-            locator = ax.xaxis.get_major_locator()
-            assert isinstance(formatter, mdates.DateFormatter)
-            assert formatter.fmt == "%b"
-            assert isinstance(locator, mdates.MonthLocator)
-        finally:
-            plt.close(fig)
+        _configure_x_axis(ax, "unknown")
+        formatter = ax.xaxis.get_major_formatter()
+        locator = ax.xaxis.get_major_locator()
+        assert isinstance(formatter, mdates.DateFormatter)
+        assert formatter.fmt == "%b"
+        assert isinstance(locator, mdates.MonthLocator)
+
+
+@pytest.fixture(scope="module")
+def sample_ts() -> TimeSeries:
+    """Three-point battery series ending at BASE_TIME, shared by the module."""
+    return _make_ts(3.8, 3.9, 4.0)
+
+
+@pytest.fixture(scope="module")
+def svg() -> str:
+    """Minimal well-formed root SVG element."""
+    return '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 280"></svg>'
 
 
 class TestInjectDataAttributes:
     """Test _inject_data_attributes function."""
 
-    def test_adds_root_svg_attributes(self):
+    def test_adds_root_svg_attributes(self, sample_ts, svg):
         """Adds data attributes to root SVG element."""
-        ts = self._create_sample_timeseries()
-        svg = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 280">'
-
-        result = _inject_data_attributes(svg, ts, "light")
+        attrs = _parsed_attrs(_inject_data_attributes(svg, sample_ts, "light"))
 
-        assert 'data-metric="bat"' in result
-        assert 'data-period="day"' in result
-        assert 'data-theme="light"' in result
-        assert 'data-x-start="' in result
-        assert 'data-x-end="' in result
-        assert 'data-y-min="' in result
-        assert 'data-y-max="' in result
-        assert 'data-points="' in result
+        assert attrs["data-metric"] == "bat"
+        assert attrs["data-period"] == "day"
+        assert attrs["data-theme"] == "light"
+        for name in ("data-x-start", "data-x-end", "data-y-min", "data-y-max", "data-points"):
+            assert name in attrs
 
-    def test_data_points_json_format(self):
+    def test_data_points_json_format(self, sample_ts, svg):
         """Data points are JSON-encoded in attribute."""
-        ts = self._create_sample_timeseries()
-        svg = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 280">'
-
-        result = _inject_data_attributes(svg, ts, "light")
+        result = _inject_data_attributes(svg, sample_ts, "light")
 
         # Extract data-points value and decode
-        import re
-        match = re.search(r'data-points="([^"]+)"', result)
+        match = _DATA_POINTS_RE.search(result)
         assert match is not None
-        points_json = match.group(1).replace('&quot;', '"')
-        points = json.loads(points_json)
+        points = json.loads(html.unescape(match.group(1)))
 
         assert len(points) == 3
         assert all("ts" in p and "v" in p for p in points)
 
-    def test_uses_provided_x_range(self):
+    def test_uses_provided_x_range(self, sample_ts, svg):
         """Uses provided x_start and x_end for axis range."""
-        ts = self._create_sample_timeseries()
-        svg = '<svg xmlns="http://www.w3.org/2000/svg">'
         x_start = datetime(2024, 1, 1, 0, 0, 0)
         x_end = datetime(2024, 1, 2, 0, 0, 0)
 
-        result = _inject_data_attributes(
-            svg, ts, "light", x_start=x_start, x_end=x_end
+        attrs = _parsed_attrs(
+            _inject_data_attributes(svg, sample_ts, "light", x_start=x_start, x_end=x_end)
         )
 
-        assert f'data-x-start="{int(x_start.timestamp())}"' in result
-        assert f'data-x-end="{int(x_end.timestamp())}"' in result
+        assert attrs["data-x-start"] == str(int(x_start.timestamp()))
+        assert attrs["data-x-end"] == str(int(x_end.timestamp()))
 
-    def test_uses_provided_y_range(self):
+    def test_uses_provided_y_range(self, sample_ts, svg):
         """Uses provided y_min and y_max for axis range."""
-        ts = self._create_sample_timeseries()
-        svg = '<svg xmlns="http://www.w3.org/2000/svg">'
-
-        result = _inject_data_attributes(svg, ts, "light", y_min=0.0, y_max=100.0)
+        attrs = _parsed_attrs(
+            _inject_data_attributes(svg, sample_ts, "light", y_min=0.0, y_max=100.0)
+        )
 
-        assert 'data-y-min="0.0"' in result
-        assert 'data-y-max="100.0"' in result
+        assert attrs["data-y-min"] == "0.0"
+        assert attrs["data-y-max"] == "100.0"
 
-    def test_escapes_quotes_in_json(self):
+    def test_escapes_quotes_in_json(self, sample_ts, svg):
         """JSON quotes are properly escaped as &quot;"""
-        ts = self._create_sample_timeseries()
-        svg = '<svg xmlns="http://www.w3.org/2000/svg">'
-
-        result = _inject_data_attributes(svg, ts, "light")
+        result = _inject_data_attributes(svg, sample_ts, "light")
 
         # Ensure raw JSON double quotes are escaped
         assert '"ts":' not in result  # Should be &quot;ts&quot;:
         assert '&quot;ts&quot;:' in result
 
-    def _create_sample_timeseries(self) -> TimeSeries:
-        """Create sample time series for testing."""
-        now = BASE_TIME
-        return TimeSeries(
-            metric="bat",
-            role="repeater",
-            period="day",
-            points=[
-                DataPoint(timestamp=now - timedelta(hours=2), value=3.8),
-                DataPoint(timestamp=now - timedelta(hours=1), value=3.9),
-                DataPoint(timestamp=now, value=4.0),
-            ],
-        )
-
 
 class TestChartStatistics:
     """Test ChartStatistics dataclass."""
@@ -364,8 +360,7 @@ class TestCalculateStatistics:
 
     def test_empty_timeseries(self):
         """Empty time series returns empty statistics."""
-        ts = TimeSeries(metric="bat", role="repeater", period="day", points=[])
-        stats = calculate_statistics(ts)
+        stats = calculate_statistics(_EMPTY_TS)
         assert stats.min_value is None
         assert stats.avg_value is None
         assert stats.max_value is None
@@ -373,12 +368,7 @@ class TestCalculateStatistics:
 
     def test_single_point(self):
         """Single point has min=max=avg=current."""
-        ts = TimeSeries(
-            metric="bat",
-            role="repeater",
-            period="day",
-            points=[DataPoint(timestamp=BASE_TIME, value=3.8)],
-        )
+        ts = _make_ts(3.8)
         stats = calculate_statistics(ts)
         assert stats.min_value == 3.8
         assert stats.avg_value == 3.8
@@ -387,16 +377,7 @@ class TestCalculateStatistics:
 
     def test_multiple_points(self):
         """Multiple points calculate correct statistics."""
-        ts = TimeSeries(
-            metric="bat",
-            role="repeater",
-            period="day",
-            points=[
-                DataPoint(timestamp=BASE_TIME - timedelta(hours=2), value=3.0),
-                DataPoint(timestamp=BASE_TIME - timedelta(hours=1), value=4.0),
-                DataPoint(timestamp=BASE_TIME, value=5.0),
-            ],
-        )
+        ts = _make_ts(3.0, 4.0, 5.0)
         stats = calculate_statistics(ts)
         assert stats.min_value == 3.0
         assert stats.max_value == 5.0
@@ -405,16 +386,7 @@ class TestCalculateStatistics:
 
     def test_current_is_last_point(self):
         """Current value is the most recent (last) point."""
-        ts = TimeSeries(
-            metric="bat",
-            role="repeater",
-            period="day",
-            points=[
-                DataPoint(timestamp=BASE_TIME - timedelta(hours=2), value=100.0),
-                DataPoint(timestamp=BASE_TIME - timedelta(hours=1), value=50.0),
-                DataPoint(timestamp=BASE_TIME, value=75.0),
-            ],
-        )
+        ts = _make_ts(100.0, 50.0, 75.0)
         stats = calculate_statistics(ts)
         assert stats.current_value == 75.0
 
@@ -424,72 +396,55 @@ class TestTimeSeries:
 
     def test_timestamps_property(self):
         """timestamps property returns list of timestamps."""
-        ts = TimeSeries(
-            metric="bat",
-            role="repeater",
-            period="day",
-            points=[
-                DataPoint(timestamp=BASE_TIME - timedelta(hours=1), value=3.8),
-                DataPoint(timestamp=BASE_TIME, value=3.9),
-            ],
-        )
+        ts = _make_ts(3.8, 3.9)
         timestamps = ts.timestamps
         assert len(timestamps) == 2
-        assert all(isinstance(t, datetime) for t in timestamps)
+        assert set(map(type, timestamps)) == {datetime}
 
     def test_values_property(self):
         """values property returns list of values."""
-        ts = TimeSeries(
-            metric="bat",
-            role="repeater",
-            period="day",
-            points=[
-                DataPoint(timestamp=BASE_TIME, value=3.8),
-                DataPoint(timestamp=BASE_TIME + timedelta(minutes=1), value=3.9),
-            ],
-        )
+        ts = _make_ts(3.8, 3.9)
         values = ts.values
         assert values == [3.8, 3.9]
 
     def test_is_empty_true(self):
         """is_empty returns True for empty points."""
-        ts = TimeSeries(metric="bat", role="repeater", period="day", points=[])
-        assert ts.is_empty is True
+        assert _EMPTY_TS.is_empty is True
 
     def test_is_empty_false(self):
         """is_empty returns False for non-empty points."""
-        ts = TimeSeries(
-            metric="bat",
-            role="repeater",
-            period="day",
-            points=[DataPoint(timestamp=BASE_TIME, value=3.8)],
-        )
+        ts = _make_ts(3.8)
         assert ts.is_empty is False
 
 
+@pytest.fixture(scope="module")
+def themes():
+    """Light and dark chart themes, looked up once."""
+    return CHART_THEMES["light"], CHART_THEMES["dark"]
+
+
 class TestChartTheme:
     """Test ChartTheme dataclass and constants."""
 
-    def test_light_theme_exists(self):
+    def test_light_theme_exists(self, themes):
         """Light theme is defined."""
         assert "light" in CHART_THEMES
-        light = CHART_THEMES["light"]
+        light, _ = themes
         assert light.name == "light"
         assert light.background
         assert light.line
 
-    def test_dark_theme_exists(self):
+    def test_dark_theme_exists(self, themes):
         """Dark theme is defined."""
         assert "dark" in CHART_THEMES
-        dark = CHART_THEMES["dark"]
+        _, dark = themes
         assert dark.name == "dark"
         assert dark.background
         assert dark.line
 
-    def test_themes_have_different_colors(self):
+    def test_themes_have_different_colors(self, themes):
         """Light and dark themes have different colors."""
-        light = CHART_THEMES["light"]
-        dark = CHART_THEMES["dark"]
+        light, dark = themes
         assert light.background != dark.background
         assert light.line != dark.line
 
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+import meshmon.env
 from meshmon.env import (
     Config,
     _parse_config_value,
@@ -19,52 +20,43 @@ from meshmon.env import (
 class TestParseConfigValue:
     """Test _parse_config_value function."""
 
-    def test_empty_string(self):
-        """Empty string returns empty."""
-        assert _parse_config_value("") == ""
-        assert _parse_config_value("   ") == ""
-
-    def test_unquoted_value(self):
-        """Unquoted values are returned trimmed."""
-        assert _parse_config_value("hello") == "hello"
-        assert _parse_config_value("  hello  ") == "hello"
-        assert _parse_config_value("hello world") == "hello world"
-
-    def test_double_quoted_value(self):
-        """Double quoted values extract content."""
-        assert _parse_config_value('"hello"') == "hello"
-        assert _parse_config_value('"hello world"') == "hello world"
-        assert _parse_config_value('"value with spaces"') == "value with spaces"
-
-    def test_single_quoted_value(self):
-        """Single quoted values extract content."""
-        assert _parse_config_value("'hello'") == "hello"
-        assert _parse_config_value("'hello world'") == "hello world"
-
-    def test_unclosed_quotes(self):
-        """Unclosed quotes return content after quote."""
-        assert _parse_config_value('"hello') == "hello"
-        assert _parse_config_value("'hello") == "hello"
-
-    def test_inline_comments_stripped(self):
-        """Inline comments (# preceded by space) are stripped."""
-        assert _parse_config_value("hello # comment") == "hello"
-        assert _parse_config_value("value  # another comment") == "value"
-
-    def test_hash_without_space_kept(self):
-        """Hash without preceding space is kept (e.g., color codes)."""
-        assert _parse_config_value("#ffffff") == "#ffffff"
-        assert _parse_config_value("test#value") == "test#value"
-
-    def test_quoted_values_preserve_comments(self):
-        """Quoted values preserve comment-like content."""
-        assert _parse_config_value('"hello # not a comment"') == "hello # not a comment"
-        assert _parse_config_value("'value # preserved'") == "value # preserved"
-
-    def test_empty_quoted_string(self):
-        """Empty quoted string returns empty."""
-        assert _parse_config_value('""') == ""
-        assert _parse_config_value("''") == ""
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            # Empty string returns empty
+            ("", ""),
+            ("   ", ""),
+            # Unquoted values are returned trimmed
+            ("hello", "hello"),
+            ("  hello  ", "hello"),
+            ("hello world", "hello world"),
+            # Double quoted values extract content
+            ('"hello"', "hello"),
+            ('"hello world"', "hello world"),
+            ('"value with spaces"', "value with spaces"),
+            # Single quoted values extract content
+            ("'hello'", "hello"),
+            ("'hello world'", "hello world"),
+            # Unclosed quotes return content after quote
+            ('"hello', "hello"),
+            ("'hello", "hello"),
+            # Inline comments (# preceded by space) are stripped
+            ("hello # comment", "hello"),
+            ("value  # another comment", "value"),
+            # Hash without preceding space is kept (e.g., color codes)
+            ("#ffffff", "#ffffff"),
+            ("test#value", "test#value"),
+            # Quoted values preserve comment-like content
+            ('"hello # not a comment"', "hello # not a comment"),
+            ("'value # preserved'", "value # preserved"),
+            # Empty quoted string returns empty
+            ('""', ""),
+            ("''", ""),
+        ],
+    )
+    def test_parse(self, raw, expected):
+        """Raw config values parse to the expected string."""
+        assert _parse_config_value(raw) == expected
 
 
 class TestGetStr:
@@ -130,17 +122,30 @@ class TestGetBool:
         assert get_bool("NONEXISTENT_VAR_12345", False) is False
         assert get_bool("NONEXISTENT_VAR_12345", True) is True
 
-    @pytest.mark.parametrize("value", ["1", "true", "True", "TRUE", "yes", "Yes", "on", "ON"])
-    def test_truthy_values(self, value, monkeypatch):
-        """Various truthy values return True."""
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("1", True),
+            ("true", True),
+            ("True", True),
+            ("TRUE", True),
+            ("yes", True),
+            ("Yes", True),
+            ("on", True),
+            ("ON", True),
+            ("0", False),
+            ("false", False),
+            ("False", False),
+            ("no", False),
+            ("No", False),
+            ("off", False),
+            ("anything", False),
+        ],
+    )
+    def test_truthy_and_falsy_values(self, monkeypatch, value, expected):
+        """Truthy strings return True, anything else returns False."""
         monkeypatch.setenv("TEST_BOOL", value)
-        assert get_bool("TEST_BOOL") is True
-
-    @pytest.mark.parametrize("value", ["0", "false", "False", "no", "No", "off", "anything"])
-    def test_falsy_values(self, value, monkeypatch):
-        """Non-truthy values return False."""
-        monkeypatch.setenv("TEST_BOOL", value)
-        assert get_bool("TEST_BOOL") is False
+        assert get_bool("TEST_BOOL") is expected
 
     def test_empty_string_returns_default(self, monkeypatch):
         """Empty string returns default."""
@@ -182,76 +187,84 @@ class TestGetFloat:
         assert get_float("TEST_FLOAT", 0.0) == pytest.approx(0.001)
 
 
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """One temp directory for the path tests; they only resolve paths into it."""
+    return tmp_path_factory.mktemp("env_paths")
+
+
 class TestGetPath:
     """Test get_path function."""
 
-    def test_returns_path_from_env(self, monkeypatch, tmp_path):
+    def test_returns_path_from_env(self, monkeypatch, shared_tmp):
         """Returns Path from env var value."""
-        monkeypatch.setenv("TEST_PATH", str(tmp_path))
+        monkeypatch.setenv("TEST_PATH", str(shared_tmp))
         result = get_path("TEST_PATH", "/default")
-        assert result == tmp_path
+        assert result == shared_tmp
 
     def test_returns_default_when_not_set(self):
         """Returns Path from default when not set."""
         result = get_path("NONEXISTENT_VAR_12345", "/some/path")
         assert result == Path("/some/path")
 
-    def test_expands_user(self, monkeypatch, tmp_path):
+    def test_expands_user(self, monkeypatch, shared_tmp):
         """Expands ~ to user home directory."""
-        monkeypatch.setenv("HOME", str(tmp_path))
-        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        monkeypatch.setenv("HOME", str(shared_tmp))
+        monkeypatch.setenv("USERPROFILE", str(shared_tmp))
         monkeypatch.setenv("TEST_PATH", "~/subdir")
         result = get_path("TEST_PATH", "/default")
-        assert result == (tmp_path / "subdir").resolve()
+        assert result == (shared_tmp / "subdir").resolve()
 
-    def test_resolves_to_absolute(self, monkeypatch, tmp_path):
+    def test_resolves_to_absolute(self, monkeypatch, shared_tmp):
         """Relative paths are resolved to absolute from CWD."""
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.chdir(shared_tmp)
         monkeypatch.setenv("TEST_PATH", "relative/path")
         result = get_path("TEST_PATH", "/default")
-        assert result == (tmp_path / "relative/path").resolve()
+        assert result == (shared_tmp / "relative/path").resolve()
 
 
 class TestConfig:
     """Test Config class."""
 
-    def test_default_values(self, clean_env):
-        """Config uses defaults when env vars not set."""
-        config = Config()
-
-        # Connection defaults
-        assert config.mesh_transport == "serial"
-        assert config.mesh_serial_port is None
-        assert config.mesh_serial_baud == 115200
-        assert config.mesh_debug is False
-
-        # Timing defaults
-        assert config.companion_step == 60
-        assert config.repeater_step == 900
-        assert config.remote_timeout_s == 10
-        assert config.remote_retry_attempts == 2
-        assert config.remote_cb_fails == 6
-        assert config.remote_cb_cooldown_s == 3600
-
-        # Telemetry defaults
-        assert config.telemetry_enabled is False
-        assert config.telemetry_timeout_s == 10
-        assert config.display_unit_system == "metric"
-
-        # Display defaults
-        assert config.repeater_display_name == "Repeater Node"
-        assert config.companion_display_name == "Companion Node"
-
-    def test_reads_env_vars(self, monkeypatch, clean_env):
+    def test_default_connection_values(self, default_config):
+        """Connection settings use defaults when env vars not set."""
+        assert default_config.mesh_transport == "serial"
+        assert default_config.mesh_serial_port is None
+        assert default_config.mesh_serial_baud == 115200
+        assert default_config.mesh_debug is False
+
+    def test_default_timing_values(self, default_config):
+        """Timing settings use defaults when env vars not set."""
+        assert default_config.companion_step == 60
+        assert default_config.repeater_step == 900
+        assert default_config.remote_timeout_s == 10
+        assert default_config.remote_retry_attempts == 2
+        assert default_config.remote_cb_fails == 6
+        assert default_config.remote_cb_cooldown_s == 3600
+
+    def test_default_telemetry_values(self, default_config):
+        """Telemetry settings use defaults when env vars not set."""
+        assert default_config.telemetry_enabled is False
+        assert default_config.telemetry_timeout_s == 10
+        assert default_config.display_unit_system == "metric"
+
+    def test_default_display_values(self, default_config):
+        """Display names use defaults when env vars not set."""
+        assert default_config.repeater_display_name == "Repeater Node"
+        assert default_config.companion_display_name == "Companion Node"
+
+    def test_reads_env_vars(self, env_override, clean_env):
         """Config reads values from environment."""
-        monkeypatch.setenv("MESH_TRANSPORT", "tcp")
-        monkeypatch.setenv("MESH_SERIAL_PORT", "/dev/ttyUSB0")
-        monkeypatch.setenv("MESH_DEBUG", "1")
-        monkeypatch.setenv("COMPANION_STEP", "120")
-        monkeypatch.setenv("REPEATER_NAME", "TestRepeater")
-        monkeypatch.setenv("TELEMETRY_ENABLED", "true")
-        monkeypatch.setenv("DISPLAY_UNIT_SYSTEM", "imperial")
-        monkeypatch.setenv("REPORT_LAT", "51.5074")
+        env_override(
+            MESH_TRANSPORT="tcp",
+            MESH_SERIAL_PORT="/dev/ttyUSB0",
+            MESH_DEBUG="1",
+            COMPANION_STEP="120",
+            REPEATER_NAME="TestRepeater",
+            TELEMETRY_ENABLED="true",
+            DISPLAY_UNIT_SYSTEM="imperial",
+            REPORT_LAT="51.5074",
+        )
 
         config = Config()
 
@@ -299,8 +312,6 @@ class TestGetConfig:
 
     def test_reset_creates_new_instance(self, clean_env):
         """After reset, creates new instance."""
-        import meshmon.env
-
         config1 = get_config()
 
         # Reset singleton
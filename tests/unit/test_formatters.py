@@ -2,6 +2,8 @@
 
 from datetime import datetime
 
+import pytest
+
 from meshmon.formatters import (
     format_compact_number,
     format_duration,
@@ -47,92 +49,64 @@ class TestFormatTime:
 class TestFormatValue:
     """Test format_value function."""
 
-    def test_none_returns_na(self):
-        """None value returns N/A."""
-        assert format_value(None) == "N/A"
-
-    def test_float_two_decimals(self):
-        """Float values are formatted to 2 decimal places."""
-        assert format_value(3.14159) == "3.14"
-        assert format_value(0.0) == "0.00"
-        assert format_value(100.999) == "101.00"
-
-    def test_integer_unchanged(self):
-        """Integer values are converted to string."""
-        assert format_value(42) == "42"
-        assert format_value(0) == "0"
-
-    def test_string_unchanged(self):
-        """String values pass through."""
-        assert format_value("hello") == "hello"
-
-    def test_negative_float(self):
-        """Negative floats format correctly."""
-        assert format_value(-12.345) == "-12.35"
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "N/A"),
+            # Floats are formatted to 2 decimal places
+            (3.14159, "3.14"),
+            (0.0, "0.00"),
+            (100.999, "101.00"),
+            (-12.345, "-12.35"),
+            # Integers and strings are converted as-is
+            (42, "42"),
+            (0, "0"),
+            ("hello", "hello"),
+        ],
+    )
+    def test_formats_value(self, value, expected):
+        """Floats get two decimals, other values pass through str()."""
+        assert format_value(value) == expected
 
 
 class TestFormatNumber:
     """Test format_number function."""
 
-    def test_none_returns_na(self):
-        """None value returns N/A."""
-        assert format_number(None) == "N/A"
-
-    def test_small_numbers(self):
-        """Small numbers without separators."""
-        assert format_number(0) == "0"
-        assert format_number(999) == "999"
-
-    def test_thousands_separator(self):
-        """Numbers >= 1000 get comma separators."""
-        assert format_number(1000) == "1,000"
-        assert format_number(1234567) == "1,234,567"
-
-    def test_negative_numbers(self):
-        """Negative numbers format correctly."""
-        assert format_number(-1234) == "-1,234"
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "N/A"),
+            (0, "0"),
+            (999, "999"),
+            (1000, "1,000"),
+            (1234567, "1,234,567"),
+            (-1234, "-1,234"),
+        ],
+    )
+    def test_formats_number(self, value, expected):
+        """Numbers >= 1000 get comma thousands separators."""
+        assert format_number(value) == expected
 
 
 class TestFormatDuration:
     """Test format_duration function."""
 
-    def test_none_returns_na(self):
-        """None value returns N/A."""
-        assert format_duration(None) == "N/A"
-
-    def test_zero_seconds(self):
-        """Zero seconds shows just 0s."""
-        assert format_duration(0) == "0s"
-
-    def test_seconds_only(self):
-        """Less than a minute shows seconds only."""
-        result = format_duration(45)
-        assert result == "45s"
-
-    def test_minutes_and_seconds(self):
-        """Minutes and seconds format."""
-        result = format_duration(125)  # 2m 5s
-        assert result == "2m 5s"
-
-    def test_hours_minutes_seconds(self):
-        """Hours, minutes, and seconds format."""
-        result = format_duration(3725)  # 1h 2m 5s
-        assert result == "1h 2m 5s"
-
-    def test_days_hours_minutes_seconds(self):
-        """Full duration with days."""
-        result = format_duration(90125)  # 1d 1h 2m 5s
-        assert result == "1d 1h 2m 5s"
-
-    def test_exact_day(self):
-        """Exactly one day."""
-        result = format_duration(86400)
-        assert result == "1d 0h 0m 0s"
-
-    def test_multiple_days(self):
-        """Multiple days."""
-        result = format_duration(172800)  # 2 days
-        assert result == "2d 0h 0m 0s"
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (None, "N/A"),
+            (0, "0s"),
+            (45, "45s"),  # Less than a minute shows seconds only
+            (125, "2m 5s"),
+            (3725, "1h 2m 5s"),
+            (90125, "1d 1h 2m 5s"),
+            (86400, "1d 0h 0m 0s"),  # Exactly one day
+            (172800, "2d 0h 0m 0s"),
+        ],
+    )
+    def test_formats_duration(self, seconds, expected):
+        """Durations show every unit from the largest non-zero one down to seconds."""
+        assert format_duration(seconds) == expected
 
 
 class TestFormatUptime:
@@ -205,97 +179,75 @@ class TestFormatVoltageWithPct:
 class TestFormatCompactNumber:
     """Test format_compact_number function."""
 
-    def test_none_returns_na(self):
-        """None value returns N/A."""
-        assert format_compact_number(None) == "N/A"
-
-    def test_small_numbers_raw(self):
-        """Numbers < 1000 shown as raw integers."""
-        assert format_compact_number(0) == "0"
-        assert format_compact_number(847) == "847"
-        assert format_compact_number(999) == "999"
-
-    def test_thousands_with_comma(self):
-        """1000-9999 shown with comma separator."""
-        assert format_compact_number(1000) == "1,000"
-        assert format_compact_number(4989) == "4,989"
-        assert format_compact_number(9999) == "9,999"
-
-    def test_tens_of_thousands_with_k(self):
-        """10000-999999 shown with k suffix."""
-        assert format_compact_number(10000) == "10.0k"
-        assert format_compact_number(242100) == "242.1k"
-        assert format_compact_number(999999) == "1000.0k"
-
-    def test_millions_with_m(self):
-        """>= 1000000 shown with M suffix."""
-        assert format_compact_number(1000000) == "1.0M"
-        assert format_compact_number(1500000) == "1.5M"
-        assert format_compact_number(25000000) == "25.0M"
-
-    def test_custom_precision(self):
-        """Custom precision affects decimal places."""
-        assert format_compact_number(242156, precision=2) == "242.16k"
-        assert format_compact_number(1234567, precision=2) == "1.23M"
-        assert format_compact_number(10500, precision=0) == "10k"
-
-    def test_negative_numbers(self):
-        """Negative numbers get minus prefix."""
-        assert format_compact_number(-500) == "-500"
-        assert format_compact_number(-5000) == "-5,000"
-        assert format_compact_number(-50000) == "-50.0k"
-        assert format_compact_number(-5000000) == "-5.0M"
-
-    def test_float_input(self):
-        """Float inputs work correctly."""
-        assert format_compact_number(1234.5) == "1,234"
-        assert format_compact_number(12345.6) == "12.3k"
+    @pytest.mark.parametrize(
+        "value,kwargs,expected",
+        [
+            (None, {}, "N/A"),
+            # Numbers < 1000 shown as raw integers
+            (0, {}, "0"),
+            (847, {}, "847"),
+            (999, {}, "999"),
+            # 1000-9999 shown with comma separator
+            (1000, {}, "1,000"),
+            (4989, {}, "4,989"),
+            (9999, {}, "9,999"),
+            # 10000-999999 shown with k suffix
+            (10000, {}, "10.0k"),
+            (242100, {}, "242.1k"),
+            (999999, {}, "1000.0k"),
+            # >= 1000000 shown with M suffix
+            (1000000, {}, "1.0M"),
+            (1500000, {}, "1.5M"),
+            (25000000, {}, "25.0M"),
+            # Custom precision affects decimal places
+            (242156, {"precision": 2}, "242.16k"),
+            (1234567, {"precision": 2}, "1.23M"),
+            (10500, {"precision": 0}, "10k"),
+            # Negative numbers get minus prefix
+            (-500, {}, "-500"),
+            (-5000, {}, "-5,000"),
+            (-50000, {}, "-50.0k"),
+            (-5000000, {}, "-5.0M"),
+            # Float inputs
+            (1234.5, {}, "1,234"),
+            (12345.6, {}, "12.3k"),
+        ],
+    )
+    def test_formats_compact_number(self, value, kwargs, expected):
+        """Numbers are shortened with separators or k/M suffixes by magnitude."""
+        assert format_compact_number(value, **kwargs) == expected
 
 
 class TestFormatDurationCompact:
     """Test format_duration_compact function."""
 
-    def test_none_returns_na(self):
-        """None value returns N/A."""
-        assert format_duration_compact(None) == "N/A"
-
-    def test_zero_returns_0s(self):
-        """Zero seconds returns 0s."""
-        assert format_duration_compact(0) == "0s"
-
-    def test_seconds_only(self):
-        """Less than 60 seconds shows seconds only."""
-        assert format_duration_compact(1) == "1s"
-        assert format_duration_compact(45) == "45s"
-        assert format_duration_compact(59) == "59s"
-
-    def test_minutes_and_seconds(self):
-        """1 minute to < 1 hour shows minutes and seconds."""
-        assert format_duration_compact(60) == "1m 0s"
-        assert format_duration_compact(125) == "2m 5s"
-        assert format_duration_compact(3599) == "59m 59s"
-
-    def test_hours_and_minutes(self):
-        """1 hour to < 1 day shows hours and minutes."""
-        assert format_duration_compact(3600) == "1h 0m"
-        assert format_duration_compact(7260) == "2h 1m"
-        assert format_duration_compact(86399) == "23h 59m"
-
-    def test_days_and_hours(self):
-        """1 day or more shows days and hours."""
-        assert format_duration_compact(86400) == "1d 0h"
-        assert format_duration_compact(90000) == "1d 1h"
-        assert format_duration_compact(172800) == "2d 0h"
-        assert format_duration_compact(259200) == "3d 0h"
-
-    def test_truncation_not_rounding(self):
-        """Verifies truncation behavior (floor)."""
-        # 1d 23h 59m 59s should show as 1d 23h (not 2d 0h)
-        result = format_duration_compact(86400 + 23 * 3600 + 59 * 60 + 59)
-        assert result == "1d 23h"
-
-    def test_large_durations(self):
-        """Very large durations work correctly."""
-        # 365 days
-        result = format_duration_compact(365 * 86400)
-        assert result == "365d 0h"
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (None, "N/A"),
+            (0, "0s"),
+            # Less than 60 seconds shows seconds only
+            (1, "1s"),
+            (45, "45s"),
+            (59, "59s"),
+            # 1 minute to < 1 hour shows minutes and seconds
+            (60, "1m 0s"),
+            (125, "2m 5s"),
+            (3599, "59m 59s"),
+            # 1 hour to < 1 day shows hours and minutes
+            (3600, "1h 0m"),
+            (7260, "2h 1m"),
+            (86399, "23h 59m"),
+            # 1 day or more shows days and hours
+            (86400, "1d 0h"),
+            (90000, "1d 1h"),
+            (172800, "2d 0h"),
+            (259200, "3d 0h"),
+            # Truncates rather than rounds: 1d 23h 59m 59s is not 2d 0h
+            (86400 + 23 * 3600 + 59 * 60 + 59, "1d 23h"),
+            (365 * 86400, "365d 0h"),
+        ],
+    )
+    def test_formats_duration_compact(self, seconds, expected):
+        """Durations show the two largest units, truncated (seconds alone under a minute)."""
+        assert format_duration_compact(seconds) == expected
@@ -1,5 +1,8 @@
 """Tests for HTML builder functions in html.py."""
 
+from types import MappingProxyType
+
+import pytest
 
 from meshmon.html import (
     COMPANION_CHART_GROUPS,
@@ -14,211 +17,190 @@ from meshmon.html import (
     get_jinja_env,
 )
 
+# Reference repeater row and the metrics build_repeater_metrics derives from it
+_FULL_REPEATER_ROW = {
+    "bat": 3850.0,
+    "bat_pct": 55.0,
+    "last_rssi": -85.0,
+    "last_snr": 7.5,
+    "uptime": 86400,
+    "noise_floor": -115.0,
+    "tx_queue_len": 0,
+    "nb_recv": 1234,
+    "nb_sent": 567,
+    "recv_flood": 500,
+    "sent_flood": 200,
+    "recv_direct": 100,
+    "sent_direct": 50,
+    "airtime": 3600,
+    "rx_airtime": 7200,
+}
+_EXPECTED_REPEATER_CRITICAL = [
+    {"value": "3.85", "unit": "V", "label": "Battery", "bar_pct": 55},
+    {"value": "55", "unit": "%", "label": "Charge"},
+    {"value": "-85", "unit": "dBm", "label": "RSSI"},
+    {"value": "7.50", "unit": "dB", "label": "SNR"},
+]
+_EXPECTED_REPEATER_SECONDARY = [
+    {"label": "Uptime", "value": "1d 0h"},
+    {"label": "Noise Floor", "value": "-115 dBm"},
+    {"label": "TX Queue", "value": "0"},
+]
+# (label, value, raw_value, unit)
+_EXPECTED_REPEATER_TRAFFIC = [
+    ("RX", "1,234", 1234, "packets"),
+    ("TX", "567", 567, "packets"),
+    ("Flood RX", "500", 500, "packets"),
+    ("Flood TX", "200", 200, "packets"),
+    ("Direct RX", "100", 100, "packets"),
+    ("Direct TX", "50", 50, "packets"),
+    ("Airtime TX", "1h 0m", 3600, "seconds"),
+    ("Airtime RX", "2h 0m", 7200, "seconds"),
+]
+
+
+def _metric(label, value, raw_value, unit="packets"):
+    """Read-only traffic metric, as build_*_metrics emits them."""
+    return MappingProxyType(
+        {"label": label, "value": value, "raw_value": raw_value, "unit": unit}
+    )
+
+
+def _row(label, rx, rx_raw, tx, tx_raw, unit="packets"):
+    """Expected traffic table row."""
+    return {"label": label, "rx": rx, "rx_raw": rx_raw, "tx": tx, "tx_raw": tx_raw, "unit": unit}
+
+
+_RX = _metric("RX", "500", 500)
+
 
 class TestBuildTrafficTableRows:
     """Test _build_traffic_table_rows function."""
 
-    def test_empty_list(self):
-        """Empty list returns empty list."""
-        result = _build_traffic_table_rows([])
-        assert result == []
-
-    def test_rx_tx_packets(self):
-        """RX and TX become Packets row."""
-        traffic = [
-            {"label": "RX", "value": "1.2k", "raw_value": 1200, "unit": "packets"},
-            {"label": "TX", "value": "800", "raw_value": 800, "unit": "packets"},
-        ]
-        result = _build_traffic_table_rows(traffic)
-
-        assert len(result) == 1
-        assert result[0]["label"] == "Packets"
-        assert result[0]["rx"] == "1.2k"
-        assert result[0]["rx_raw"] == 1200
-        assert result[0]["tx"] == "800"
-        assert result[0]["tx_raw"] == 800
-        assert result[0]["unit"] == "packets"
-
-    def test_flood_rx_tx(self):
-        """Flood RX/TX become Flood row."""
-        traffic = [
-            {"label": "Flood RX", "value": "500", "raw_value": 500, "unit": "packets"},
-            {"label": "Flood TX", "value": "300", "raw_value": 300, "unit": "packets"},
-        ]
-        result = _build_traffic_table_rows(traffic)
-
-        assert len(result) == 1
-        assert result[0]["label"] == "Flood"
-        assert result[0]["rx"] == "500"
-        assert result[0]["tx"] == "300"
-        assert result[0]["rx_raw"] == 500
-        assert result[0]["tx_raw"] == 300
-        assert result[0]["unit"] == "packets"
-
-    def test_direct_rx_tx(self):
-        """Direct RX/TX become Direct row."""
-        traffic = [
-            {"label": "Direct RX", "value": "200", "raw_value": 200, "unit": "packets"},
-            {"label": "Direct TX", "value": "100", "raw_value": 100, "unit": "packets"},
-        ]
-        result = _build_traffic_table_rows(traffic)
-
-        assert len(result) == 1
-        assert result[0]["label"] == "Direct"
-        assert result[0]["rx"] == "200"
-        assert result[0]["tx"] == "100"
-        assert result[0]["rx_raw"] == 200
-        assert result[0]["tx_raw"] == 100
-        assert result[0]["unit"] == "packets"
-
-    def test_airtime_rx_tx(self):
-        """Airtime TX/RX become Airtime row."""
-        traffic = [
-            {"label": "Airtime TX", "value": "1h 30m", "raw_value": 5400, "unit": "seconds"},
-            {"label": "Airtime RX", "value": "3h 0m", "raw_value": 10800, "unit": "seconds"},
-        ]
-        result = _build_traffic_table_rows(traffic)
-
-        assert len(result) == 1
-        assert result[0]["label"] == "Airtime"
-        assert result[0]["tx"] == "1h 30m"
-        assert result[0]["rx"] == "3h 0m"
-        assert result[0]["rx_raw"] == 10800
-        assert result[0]["tx_raw"] == 5400
-        assert result[0]["unit"] == "seconds"
-
-    def test_output_order(self):
-        """Output follows order: Packets, Flood, Direct, Airtime."""
-        traffic = [
-            {"label": "Airtime TX", "value": "1h", "raw_value": 3600, "unit": "seconds"},
-            {"label": "Direct RX", "value": "100", "raw_value": 100, "unit": "packets"},
-            {"label": "Flood RX", "value": "200", "raw_value": 200, "unit": "packets"},
-            {"label": "RX", "value": "500", "raw_value": 500, "unit": "packets"},
-        ]
-        result = _build_traffic_table_rows(traffic)
-
-        labels = [r["label"] for r in result]
-        assert labels == ["Packets", "Flood", "Direct", "Airtime"]
-
-    def test_missing_pair(self):
-        """Missing pair leaves None for that direction."""
-        traffic = [
-            {"label": "RX", "value": "500", "raw_value": 500, "unit": "packets"},
-        ]
-        result = _build_traffic_table_rows(traffic)
-
-        assert result[0]["rx"] == "500"
-        assert result[0]["tx"] is None
-        assert result[0]["rx_raw"] == 500
-        assert result[0]["tx_raw"] is None
-
-    def test_unrecognized_label_skipped(self):
-        """Unrecognized labels are skipped."""
-        traffic = [
-            {"label": "Unknown", "value": "100", "raw_value": 100, "unit": "packets"},
-            {"label": "RX", "value": "500", "raw_value": 500, "unit": "packets"},
-        ]
-        result = _build_traffic_table_rows(traffic)
-
-        assert len(result) == 1
-        assert result[0]["label"] == "Packets"
+    @pytest.mark.parametrize(
+        "traffic,expected",
+        [
+            pytest.param((), [], id="empty"),
+            pytest.param(
+                (_metric("RX", "1.2k", 1200), _metric("TX", "800", 800)),
+                [_row("Packets", "1.2k", 1200, "800", 800)],
+                id="rx-tx-become-packets",
+            ),
+            pytest.param(
+                (_metric("Flood RX", "500", 500), _metric("Flood TX", "300", 300)),
+                [_row("Flood", "500", 500, "300", 300)],
+                id="flood",
+            ),
+            pytest.param(
+                (_metric("Direct RX", "200", 200), _metric("Direct TX", "100", 100)),
+                [_row("Direct", "200", 200, "100", 100)],
+                id="direct",
+            ),
+            pytest.param(
+                (
+                    _metric("Airtime TX", "1h 30m", 5400, "seconds"),
+                    _metric("Airtime RX", "3h 0m", 10800, "seconds"),
+                ),
+                [_row("Airtime", "3h 0m", 10800, "1h 30m", 5400, "seconds")],
+                id="airtime",
+            ),
+            pytest.param(
+                (_RX,),
+                [_row("Packets", "500", 500, None, None)],
+                id="missing-pair-leaves-none",
+            ),
+            pytest.param(
+                (_metric("Unknown", "100", 100), _RX),
+                [_row("Packets", "500", 500, None, None)],
+                id="unrecognized-label-skipped",
+            ),
+            pytest.param(
+                (
+                    _metric("Airtime TX", "1h", 3600, "seconds"),
+                    _metric("Direct RX", "100", 100),
+                    _metric("Flood RX", "200", 200),
+                    _RX,
+                ),
+                [
+                    _row("Packets", "500", 500, None, None),
+                    _row("Flood", "200", 200, None, None),
+                    _row("Direct", "100", 100, None, None),
+                    _row("Airtime", None, None, "1h", 3600, "seconds"),
+                ],
+                id="ordered-packets-flood-direct-airtime",
+            ),
+        ],
+    )
+    def test_builds_rows(self, traffic, expected):
+        """RX/TX pairs merge into one row per traffic type, in a fixed order."""
+        assert _build_traffic_table_rows(list(traffic)) == expected
 
 
 class TestBuildNodeDetails:
     """Test build_node_details function."""
 
-    def test_repeater_details(self, configured_env, monkeypatch):
+    def test_repeater_details(self, inject_config):
         """Repeater node details include location info."""
-        monkeypatch.setenv("REPORT_LOCATION_SHORT", "Test Location")
-        monkeypatch.setenv("REPORT_LAT", "51.5074")
-        monkeypatch.setenv("REPORT_LON", "-0.1278")
-        monkeypatch.setenv("REPORT_ELEV", "11")
-        monkeypatch.setenv("REPORT_ELEV_UNIT", "m")
-        monkeypatch.setenv("REPEATER_HARDWARE", "RAK 4631")
-
-        # Reset config to pick up new values
-        import meshmon.env
-        meshmon.env._config = None
-
-        result = build_node_details("repeater")
-
-        labels = [d["label"] for d in result]
-        assert "Location" in labels
-        assert "Coordinates" in labels
-        assert "Elevation" in labels
-        assert "Hardware" in labels
-
-        # Check specific values
-        location = next(d for d in result if d["label"] == "Location")
-        assert location["value"] == "Test Location"
-        coords = next(d for d in result if d["label"] == "Coordinates")
-        assert coords["value"] == "51.5074°N, 0.1278°W"
-        elevation = next(d for d in result if d["label"] == "Elevation")
-        assert elevation["value"] == "11 m"
-
-        hardware = next(d for d in result if d["label"] == "Hardware")
-        assert hardware["value"] == "RAK 4631"
-
-    def test_companion_details(self, configured_env, monkeypatch):
-        """Companion node details are simpler."""
-        monkeypatch.setenv("COMPANION_HARDWARE", "T-Beam Supreme")
+        inject_config(
+            report_location_short="Test Location",
+            report_lat=51.5074,
+            report_lon=-0.1278,
+            report_elev=11.0,
+            report_elev_unit="m",
+            repeater_hardware="RAK 4631",
+        )
+
+        by_label = {d["label"]: d["value"] for d in build_node_details("repeater")}
+
+        assert by_label == {
+            "Location": "Test Location",
+            "Coordinates": "51.5074°N, 0.1278°W",
+            "Elevation": "11 m",
+            "Hardware": "RAK 4631",
+        }
 
-        # Reset config
-        import meshmon.env
-        meshmon.env._config = None
+    def test_companion_details(self, inject_config):
+        """Companion node details are simpler."""
+        inject_config(companion_hardware="T-Beam Supreme")
 
-        result = build_node_details("companion")
+        by_label = {d["label"]: d["value"] for d in build_node_details("companion")}
 
-        labels = [d["label"] for d in result]
-        assert "Hardware" in labels
-        assert "Connection" in labels
-        assert next(d for d in result if d["label"] == "Connection")["value"] == "USB Serial"
-        assert next(d for d in result if d["label"] == "Hardware")["value"] == "T-Beam Supreme"
+        assert by_label["Connection"] == "USB Serial"
+        assert by_label["Hardware"] == "T-Beam Supreme"
 
         # No location info for companion
-        assert "Location" not in labels
-        assert "Coordinates" not in labels
+        assert "Location" not in by_label
+        assert "Coordinates" not in by_label
 
-    def test_coordinate_directions(self, configured_env, monkeypatch):
+    def test_coordinate_directions(self, inject_config):
         """Coordinate directions are correct for positive/negative."""
-        monkeypatch.setenv("REPORT_LAT", "-33.8688")  # Sydney
-        monkeypatch.setenv("REPORT_LON", "151.2093")
-
-        import meshmon.env
-        meshmon.env._config = None
+        inject_config(report_lat=-33.8688, report_lon=151.2093)  # Sydney
 
-        result = build_node_details("repeater")
-        coords = next(d for d in result if d["label"] == "Coordinates")
+        by_label = {d["label"]: d["value"] for d in build_node_details("repeater")}
 
-        assert coords["value"] == "33.8688°S, 151.2093°E"
+        assert by_label["Coordinates"] == "33.8688°S, 151.2093°E"
 
 
 class TestBuildRadioConfig:
     """Test build_radio_config function."""
 
-    def test_returns_radio_settings(self, configured_env, monkeypatch):
-        """Returns radio configuration from env."""
-        monkeypatch.setenv("RADIO_FREQUENCY", "915.0 MHz")
-        monkeypatch.setenv("RADIO_BANDWIDTH", "125 kHz")
-        monkeypatch.setenv("RADIO_SPREAD_FACTOR", "SF12")
-        monkeypatch.setenv("RADIO_CODING_RATE", "CR5")
-
-        import meshmon.env
-        meshmon.env._config = None
-
-        result = build_radio_config()
+    def test_returns_radio_settings(self, inject_config):
+        """Returns radio configuration from config."""
+        inject_config(
+            radio_frequency="915.0 MHz",
+            radio_bandwidth="125 kHz",
+            radio_spread_factor="SF12",
+            radio_coding_rate="CR5",
+        )
 
-        labels = [d["label"] for d in result]
-        assert "Frequency" in labels
-        assert "Bandwidth" in labels
-        assert "Spread Factor" in labels
-        assert "Coding Rate" in labels
+        by_label = {d["label"]: d["value"] for d in build_radio_config()}
 
-        freq = next(d for d in result if d["label"] == "Frequency")
-        assert freq["value"] == "915.0 MHz"
-        assert next(d for d in result if d["label"] == "Bandwidth")["value"] == "125 kHz"
-        assert next(d for d in result if d["label"] == "Spread Factor")["value"] == "SF12"
-        assert next(d for d in result if d["label"] == "Coding Rate")["value"] == "CR5"
+        assert by_label == {
+            "Frequency": "915.0 MHz",
+            "Bandwidth": "125 kHz",
+            "Spread Factor": "SF12",
+            "Coding Rate": "CR5",
+        }
 
 
 class TestBuildRepeaterMetrics:
@@ -240,76 +222,14 @@ class TestBuildRepeaterMetrics:
 
     def test_full_row_extracts_metrics(self):
         """Full row extracts all metric categories."""
-        row = {
-            "bat": 3850.0,
-            "bat_pct": 55.0,
-            "last_rssi": -85.0,
-            "last_snr": 7.5,
-            "uptime": 86400,
-            "noise_floor": -115.0,
-            "tx_queue_len": 0,
-            "nb_recv": 1234,
-            "nb_sent": 567,
-            "recv_flood": 500,
-            "sent_flood": 200,
-            "recv_direct": 100,
-            "sent_direct": 50,
-            "airtime": 3600,
-            "rx_airtime": 7200,
-        }
-        result = build_repeater_metrics(row)
-
-        # Critical metrics
-        assert [m["label"] for m in result["critical_metrics"]] == [
-            "Battery",
-            "Charge",
-            "RSSI",
-            "SNR",
-        ]
-        battery = result["critical_metrics"][0]
-        assert battery == {
-            "value": "3.85",
-            "unit": "V",
-            "label": "Battery",
-            "bar_pct": 55,
-        }
-        assert result["critical_metrics"][1] == {
-            "value": "55",
-            "unit": "%",
-            "label": "Charge",
-        }
-        assert result["critical_metrics"][2] == {
-            "value": "-85",
-            "unit": "dBm",
-            "label": "RSSI",
-        }
-        assert result["critical_metrics"][3] == {
-            "value": "7.50",
-            "unit": "dB",
-            "label": "SNR",
-        }
-
-        # Secondary metrics
-        assert result["secondary_metrics"] == [
-            {"label": "Uptime", "value": "1d 0h"},
-            {"label": "Noise Floor", "value": "-115 dBm"},
-            {"label": "TX Queue", "value": "0"},
-        ]
+        result = build_repeater_metrics(_FULL_REPEATER_ROW)
 
-        # Traffic metrics
+        assert result["critical_metrics"] == _EXPECTED_REPEATER_CRITICAL
+        assert result["secondary_metrics"] == _EXPECTED_REPEATER_SECONDARY
         assert [
             (metric["label"], metric["value"], metric["raw_value"], metric["unit"])
             for metric in result["traffic_metrics"]
-        ] == [
-            ("RX", "1,234", 1234, "packets"),
-            ("TX", "567", 567, "packets"),
-            ("Flood RX", "500", 500, "packets"),
-            ("Flood TX", "200", 200, "packets"),
-            ("Direct RX", "100", 100, "packets"),
-            ("Direct TX", "50", 50, "packets"),
-            ("Airtime TX", "1h 0m", 3600, "seconds"),
-            ("Airtime RX", "2h 0m", 7200, "seconds"),
-        ]
+        ] == _EXPECTED_REPEATER_TRAFFIC
 
     def test_battery_converts_mv_to_v(self):
         """Battery value is converted from mV to V."""
@@ -390,43 +310,43 @@ class TestBuildCompanionMetrics:
         assert contacts["unit"] is None
 
 
+@pytest.fixture(scope="module")
+def fresh_jinja_env():
+    """Jinja env rebuilt from scratch once for the module."""
+    import meshmon.html
+
+    meshmon.html._jinja_env = None
+    return get_jinja_env()
+
+
 class TestGetJinjaEnv:
     """Test get_jinja_env function."""
 
-    def test_returns_environment(self):
+    def test_returns_environment(self, fresh_jinja_env):
         """Returns a Jinja2 Environment."""
         from jinja2 import Environment
 
-        # Reset singleton for clean test
-        import meshmon.html
-        meshmon.html._jinja_env = None
+        assert isinstance(fresh_jinja_env, Environment)
 
-        env = get_jinja_env()
-        assert isinstance(env, Environment)
-
-    def test_returns_singleton(self):
+    def test_returns_singleton(self, fresh_jinja_env):
         """Returns same instance on subsequent calls."""
-        import meshmon.html
-        meshmon.html._jinja_env = None
-
-        env1 = get_jinja_env()
-        env2 = get_jinja_env()
-        assert env1 is env2
-
-    def test_registers_custom_filters(self):
+        assert get_jinja_env() is fresh_jinja_env
+
+    @pytest.mark.parametrize(
+        "filter_name",
+        [
+            "format_time",
+            "format_value",
+            "format_number",
+            "format_duration",
+            "format_uptime",
+            "format_compact_number",
+            "format_duration_compact",
+        ],
+    )
+    def test_registers_custom_filters(self, fresh_jinja_env, filter_name):
         """Custom format filters are registered."""
-        import meshmon.html
-        meshmon.html._jinja_env = None
-
-        env = get_jinja_env()
-
-        assert "format_time" in env.filters
-        assert "format_value" in env.filters
-        assert "format_number" in env.filters
-        assert "format_duration" in env.filters
-        assert "format_uptime" in env.filters
-        assert "format_compact_number" in env.filters
-        assert "format_duration_compact" in env.filters
+        assert filter_name in fresh_jinja_env.filters
 
 
 class TestChartGroupConstants:
@@ -434,30 +354,21 @@ class TestChartGroupConstants:
 
     def test_repeater_chart_groups_defined(self):
         """Repeater chart groups are defined."""
-        assert len(REPEATER_CHART_GROUPS) > 0
-        for group in REPEATER_CHART_GROUPS:
-            assert "title" in group
-            assert "metrics" in group
-            assert len(group["metrics"]) > 0
+        assert REPEATER_CHART_GROUPS
+        assert all({"title", "metrics"} <= g.keys() and g["metrics"] for g in REPEATER_CHART_GROUPS)
 
     def test_companion_chart_groups_defined(self):
         """Companion chart groups are defined."""
-        assert len(COMPANION_CHART_GROUPS) > 0
-        for group in COMPANION_CHART_GROUPS:
-            assert "title" in group
-            assert "metrics" in group
-            assert len(group["metrics"]) > 0
+        assert COMPANION_CHART_GROUPS
+        assert all({"title", "metrics"} <= g.keys() and g["metrics"] for g in COMPANION_CHART_GROUPS)
 
     def test_period_config_defined(self):
         """Period config has all expected periods."""
-        assert "day" in PERIOD_CONFIG
-        assert "week" in PERIOD_CONFIG
-        assert "month" in PERIOD_CONFIG
-        assert "year" in PERIOD_CONFIG
-
-        for _period, (title, subtitle) in PERIOD_CONFIG.items():
-            assert isinstance(title, str)
-            assert isinstance(subtitle, str)
+        assert {"day", "week", "month", "year"} <= PERIOD_CONFIG.keys()
+        assert all(
+            isinstance(title, str) and isinstance(subtitle, str)
+            for title, subtitle in PERIOD_CONFIG.values()
+        )
 
 
 class TestBuildChartGroups:
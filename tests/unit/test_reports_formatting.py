@@ -1,5 +1,6 @@
 """Tests for reports formatting functions in reports.py."""
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 import pytest
@@ -23,68 +24,38 @@ from meshmon.reports import (
 class TestFormatLatLon:
     """Test format_lat_lon function."""
 
-    def test_north_east(self):
-        """Positive lat/lon formats as N/E."""
-        lat_str, lon_str = format_lat_lon(51.5074, 0.1278)
-        assert lat_str == "51-30.44 N"
-        assert lon_str == "000-07.67 E"
-
-    def test_south_west(self):
-        """Negative lat/lon formats as S/W."""
-        lat_str, lon_str = format_lat_lon(-33.8688, -151.2093)
-        assert lat_str == "33-52.13 S"
-        assert lon_str == "151-12.56 W"
-
-    def test_degrees_minutes_format(self):
-        """Output is in DD-MM.MM format."""
-        lat_str, lon_str = format_lat_lon(51.5074, -0.1278)
-        assert lat_str == "51-30.44 N"
-        assert lon_str == "000-07.67 W"
-
-    def test_zero_coordinates(self):
-        """Zero coordinates at equator/prime meridian."""
-        lat_str, lon_str = format_lat_lon(0.0, 0.0)
-        assert lat_str == "00-00.00 N"
-        assert lon_str == "000-00.00 E"
-
-    def test_latitude_format_width(self):
-        """Latitude degrees is 2 digits."""
-        lat_str, _ = format_lat_lon(5.5, 0.0)
-        assert lat_str == "05-30.00 N"
-
-    def test_longitude_format_width(self):
-        """Longitude degrees is 3 digits."""
-        _, lon_str = format_lat_lon(0.0, 5.5)
-        assert lon_str == "005-30.00 E"
+    @pytest.mark.parametrize(
+        "lat,lon,expected_lat,expected_lon",
+        [
+            (51.5074, 0.1278, "51-30.44 N", "000-07.67 E"),  # Positive is N/E
+            (-33.8688, -151.2093, "33-52.13 S", "151-12.56 W"),  # Negative is S/W
+            (51.5074, -0.1278, "51-30.44 N", "000-07.67 W"),  # Mixed hemispheres
+            (0.0, 0.0, "00-00.00 N", "000-00.00 E"),  # Equator/prime meridian
+            (5.5, 0.0, "05-30.00 N", "000-00.00 E"),  # Latitude degrees are 2 digits
+            (0.0, 5.5, "00-00.00 N", "005-30.00 E"),  # Longitude degrees are 3 digits
+        ],
+    )
+    def test_formats_degrees_minutes(self, lat, lon, expected_lat, expected_lon):
+        """Coordinates format as DD-MM.MM / DDD-MM.MM with a hemisphere letter."""
+        assert format_lat_lon(lat, lon) == (expected_lat, expected_lon)
 
 
 class TestFormatLatLonDms:
     """Test format_lat_lon_dms function."""
 
-    def test_basic_format(self):
-        """Returns combined DMS string."""
-        result = format_lat_lon_dms(51.5074, -0.1278)
-        assert result == "51°30'26\"N  000°07'40\"W"
-
-    def test_north_east_directions(self):
-        """Positive coordinates show N and E."""
-        result = format_lat_lon_dms(51.5074, 0.1278)
-        assert result == "51°30'26\"N  000°07'40\"E"
-
-    def test_south_west_directions(self):
-        """Negative coordinates show S and W."""
-        result = format_lat_lon_dms(-33.8688, -151.2093)
-        assert result == "33°52'07\"S  151°12'33\"W"
-
-    def test_lat_two_digit_degrees(self):
-        """Latitude has 2-digit degrees."""
-        result = format_lat_lon_dms(5.0, 0.0)
-        assert result == "05°00'00\"N  000°00'00\"E"
-
-    def test_lon_three_digit_degrees(self):
-        """Longitude has 3-digit degrees."""
-        result = format_lat_lon_dms(0.0, 5.0)
-        assert result == "00°00'00\"N  005°00'00\"E"
+    @pytest.mark.parametrize(
+        "lat,lon,expected",
+        [
+            (51.5074, -0.1278, "51°30'26\"N  000°07'40\"W"),
+            (51.5074, 0.1278, "51°30'26\"N  000°07'40\"E"),  # Positive is N/E
+            (-33.8688, -151.2093, "33°52'07\"S  151°12'33\"W"),  # Negative is S/W
+            (5.0, 0.0, "05°00'00\"N  000°00'00\"E"),  # Latitude degrees are 2 digits
+            (0.0, 5.0, "00°00'00\"N  005°00'00\"E"),  # Longitude degrees are 3 digits
+        ],
+    )
+    def test_formats_dms(self, lat, lon, expected):
+        """Returns a combined degrees/minutes/seconds string."""
+        assert format_lat_lon_dms(lat, lon) == expected
 
 
 class TestLocationInfo:
@@ -167,6 +138,12 @@ class TestColumn:
         result = col.format("hi")
         assert result == "    hi    "
 
+    def test_is_immutable(self):
+        """Columns are frozen, so the specs derived at init can't go stale."""
+        col = Column(width=6)
+        with pytest.raises(FrozenInstanceError):
+            col.width = 10
+
 
 class TestFormatRow:
     """Test _format_row function."""